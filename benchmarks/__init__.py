@@ -0,0 +1,3 @@
+"""Benchmarks for the library, run with pytest."""
+
+### __init__.py ends here
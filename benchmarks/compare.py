@@ -0,0 +1,97 @@
+"""Compare two sets of benchmark results.
+
+Usage:
+
+    python -m benchmarks.compare BEFORE.json AFTER.json [--threshold PERCENT]
+
+Each timing that appears in both sets of results is shown side by side,
+using the median of the rounds, with any that have slowed down by more than
+the threshold flagged as a regression.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import json
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from typing import Any
+
+##############################################################################
+Timings = dict[tuple[str, int, str], float]
+"""The type of the timings pulled out of a set of results."""
+
+
+##############################################################################
+def _timings(results: Path) -> Timings:
+    """Load the median timings from a set of results.
+
+    Args:
+        results: The file the results were saved to.
+
+    Returns:
+        The median timings, keyed by benchmark, size and measurement.
+    """
+    loaded: dict[str, Any] = json.loads(results.read_text(encoding="utf-8"))
+    return {
+        (result["benchmark"], result["size"], measurement): value["median"]
+        for result in loaded["results"]
+        for measurement, value in result.items()
+        if isinstance(value, dict) and "median" in value
+    }
+
+
+##############################################################################
+def _arguments() -> Namespace:
+    """Get the command line arguments.
+
+    Returns:
+        The arguments.
+    """
+    parser = ArgumentParser(description="Compare two sets of benchmark results.")
+    parser.add_argument("before", type=Path, help="The results to compare against.")
+    parser.add_argument("after", type=Path, help="The results to compare.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="The percentage slowdown to flag as a regression.",
+    )
+    return parser.parse_args()
+
+
+##############################################################################
+def main() -> int:
+    """Compare two sets of benchmark results.
+
+    Returns:
+        `1` if there are any regressions, `0` if not.
+    """
+    arguments = _arguments()
+    before = _timings(arguments.before)
+    after = _timings(arguments.after)
+    regressions = 0
+    print(
+        f"{'benchmark':<52} {'size':>9} {'before ms':>11} {'after ms':>11} {'change':>8}"
+    )
+    for key in sorted(before.keys() & after.keys()):
+        benchmark, size, measurement = key
+        change = (after[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+        regressed = change > arguments.threshold
+        regressions += regressed
+        print(
+            f"{f'{benchmark} ({measurement})':<52} {size:>9,} "
+            f"{before[key]:>11.2f} {after[key]:>11.2f} {change:>+7.1f}%"
+            f"{'  REGRESSION' if regressed else ''}"
+        )
+    return 1 if regressions else 0
+
+
+##############################################################################
+if __name__ == "__main__":
+    raise SystemExit(main())
+
+### compare.py ends here
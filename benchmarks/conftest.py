@@ -0,0 +1,135 @@
+"""Configuration and fixtures for the benchmarks."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from collections.abc import Iterator
+from importlib.metadata import version
+from pathlib import Path
+from typing import Final
+
+##############################################################################
+# pytest imports.
+import pytest
+
+##############################################################################
+# Local imports.
+from .measure import BenchmarkResults
+from .synthetic import SyntheticTree, make_tree
+
+##############################################################################
+DEFAULT_SIZES: Final[tuple[int, ...]] = (1_000, 10_000)
+"""The sizes of directory benchmarked against by default."""
+
+LARGE_SIZES: Final[tuple[int, ...]] = (100_000, 1_000_000)
+"""The extra sizes of directory benchmarked against when asked for."""
+
+DEFAULT_ROUNDS: Final[int] = 3
+"""The default number of times to take each measurement."""
+
+RESULTS: Final[Path] = Path(__file__).parent.parent / ".benchmarks"
+"""The default directory to save the results in."""
+
+
+##############################################################################
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the options for the benchmarks.
+
+    Args:
+        parser: The parser to add the options to.
+    """
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--bench-large",
+        action="store_true",
+        help="Also benchmark against directories of 100,000 and 1,000,000 entries.",
+    )
+    group.addoption(
+        "--bench-sizes",
+        help="Comma-separated sizes of directory to benchmark against.",
+    )
+    group.addoption(
+        "--bench-rounds",
+        type=int,
+        default=DEFAULT_ROUNDS,
+        help="The number of times to take each measurement.",
+    )
+    group.addoption(
+        "--bench-trees",
+        type=Path,
+        help="Where to make (and keep, for later runs) the synthetic directories.",
+    )
+    group.addoption(
+        "--bench-json",
+        type=Path,
+        help="Where to save the results; defaults to .benchmarks/<version>.json.",
+    )
+
+
+##############################################################################
+def _sizes(config: pytest.Config) -> list[int]:
+    """Get the sizes of directory to benchmark against.
+
+    Args:
+        config: The pytest configuration.
+
+    Returns:
+        The sizes of directory.
+    """
+    if sizes := config.getoption("--bench-sizes"):
+        return [int(size.replace("_", "")) for size in sizes.split(",")]
+    if config.getoption("--bench-large"):
+        return [*DEFAULT_SIZES, *LARGE_SIZES]
+    return list(DEFAULT_SIZES)
+
+
+##############################################################################
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Run each benchmark against each size of directory.
+
+    Args:
+        metafunc: The benchmark to generate runs of.
+    """
+    if "tree_size" in metafunc.fixturenames:
+        sizes = _sizes(metafunc.config)
+        metafunc.parametrize("tree_size", sizes, ids=str, scope="session")
+
+
+##############################################################################
+@pytest.fixture(scope="session")
+def trees(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """The directory to make the synthetic directories in."""
+    kept: Path | None = request.config.getoption("--bench-trees")
+    return kept or tmp_path_factory.mktemp("trees")
+
+
+##############################################################################
+@pytest.fixture(scope="session")
+def tree(trees: Path, tree_size: int) -> SyntheticTree:
+    """A synthetic directory to benchmark against."""
+    return make_tree(trees, tree_size)
+
+
+##############################################################################
+@pytest.fixture(scope="session")
+def rounds(request: pytest.FixtureRequest) -> int:
+    """The number of times to take each measurement."""
+    return max(1, int(request.config.getoption("--bench-rounds")))
+
+
+##############################################################################
+@pytest.fixture(scope="session")
+def results(request: pytest.FixtureRequest) -> Iterator[BenchmarkResults]:
+    """The results of the benchmarks, saved once they've all been run."""
+    recorded = BenchmarkResults()
+    yield recorded
+    output: Path | None = request.config.getoption("--bench-json")
+    recorded.save(output or RESULTS / f"{version('textual_fspicker')}.json")
+
+
+### conftest.py ends here
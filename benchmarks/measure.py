@@ -0,0 +1,186 @@
+"""Code for taking and recording measurements."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import json
+import os
+import pathlib
+import platform
+import sys
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import wraps
+from importlib.metadata import version
+from pathlib import Path
+from statistics import mean, median, quantiles
+from threading import Lock
+from typing import Any, Final
+
+##############################################################################
+COUNTED: Final[tuple[str, ...]] = (
+    "stat",
+    "lstat",
+    "scandir",
+    "listdir",
+    "readlink",
+    "open",
+)
+"""The names of the functions in `os` whose calls are counted."""
+
+
+##############################################################################
+class FilesystemCalls:
+    """Counts the calls made to the filesystem.
+
+    Rather than tracing system calls, which needs tools that can't be relied
+    on to be installed, this counts the calls made to the functions in
+    [`os`][os] that each go to the filesystem with a system call of their
+    own. While counting, the functions are wrapped, so the counts shouldn't
+    be taken while timing.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the counter."""
+        self.counts: Counter[str] = Counter()
+        """The number of calls to each function."""
+        self._lock = Lock()
+        """Lock for updating the counts, as calls come from many threads."""
+
+    def _counting(self, name: str, call: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a function so that calls to it are counted.
+
+        Args:
+            name: The name to count the calls under.
+            call: The function to wrap.
+
+        Returns:
+            The wrapped function.
+        """
+
+        @wraps(call)
+        def _counted(*args: Any, **kwargs: Any) -> Any:
+            with self._lock:
+                self.counts[
+                    "lstat"
+                    if name == "stat" and kwargs.get("follow_symlinks") is False
+                    else name
+                ] += 1
+            return call(*args, **kwargs)
+
+        return _counted
+
+    @contextmanager
+    def counting(self) -> Iterator[FilesystemCalls]:
+        """Count the calls made to the filesystem within a context.
+
+        Yields:
+            The counter.
+        """
+        # Older versions of pathlib keep hold of their own references to
+        # the functions in `os`, so those need wrapping too.
+        accessor = getattr(pathlib, "_NormalAccessor", None)
+        patched: list[tuple[object, str, object]] = []
+        for name in COUNTED:
+            for owner in (os, accessor):
+                if owner is not None and hasattr(owner, name):
+                    patched.append((owner, name, original := getattr(owner, name)))
+                    setattr(owner, name, self._counting(name, original))
+        try:
+            yield self
+        finally:
+            for owner, name, original in reversed(patched):
+                setattr(owner, name, original)
+
+    @property
+    def total(self) -> int:
+        """The total number of calls made to the filesystem."""
+        return sum(self.counts.values())
+
+    def as_json(self) -> dict[str, int]:
+        """The counts, in a form that can be saved as JSON."""
+        return {"total": self.total, **dict(sorted(self.counts.items()))}
+
+
+##############################################################################
+def summarise(seconds: Sequence[float]) -> dict[str, float]:
+    """Summarise a collection of timings.
+
+    Args:
+        seconds: The timings, in seconds.
+
+    Returns:
+        A summary of the timings, in milliseconds.
+    """
+    milliseconds = sorted(sample * 1_000 for sample in seconds)
+    summary = {
+        "rounds": float(len(milliseconds)),
+        "min": milliseconds[0],
+        "median": median(milliseconds),
+        "mean": mean(milliseconds),
+        "max": milliseconds[-1],
+    }
+    if len(milliseconds) > 1:
+        centiles = quantiles(milliseconds, n=100, method="inclusive")
+        summary |= {"p50": centiles[49], "p95": centiles[94], "p99": centiles[98]}
+    return summary
+
+
+##############################################################################
+class BenchmarkResults:
+    """The results of a run of the benchmarks."""
+
+    def __init__(self) -> None:
+        """Initialise the results."""
+        self.results: list[dict[str, Any]] = []
+        """The result of each benchmark."""
+
+    def record(self, benchmark: str, size: int, **measurements: Any) -> None:
+        """Record the result of a benchmark.
+
+        Args:
+            benchmark: The name of the benchmark.
+            size: The number of entries in the directory it was run against.
+            measurements: The measurements that were taken.
+        """
+        self.results.append({"benchmark": benchmark, "size": size, **measurements})
+
+    @staticmethod
+    def environment() -> dict[str, str]:
+        """Describe the environment the benchmarks were run in.
+
+        Returns:
+            A description of the environment.
+        """
+        return {
+            "textual-fspicker": version("textual_fspicker"),
+            "textual": version("textual"),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "when": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+
+    def save(self, output: Path) -> None:
+        """Save the results as JSON.
+
+        Args:
+            output: The file to save the results to.
+        """
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(
+            json.dumps(
+                {"environment": self.environment(), "results": self.results},
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+
+
+### measure.py ends here
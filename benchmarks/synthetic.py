@@ -0,0 +1,158 @@
+"""Code for making synthetic directories to benchmark against.
+
+Each synthetic directory holds a given number of entries, made up of a mix
+of files, directories, hidden files and symbolic links (some to files, some
+to directories and some that go nowhere), with a spread of names and
+extensions. The same size of directory always has the same content.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import os
+from pathlib import Path
+from random import Random
+from shutil import rmtree
+from typing import Final, NamedTuple
+
+##############################################################################
+STEMS: Final[tuple[str, ...]] = (
+    "alpha",
+    "Bravo",
+    "charlie",
+    "delta",
+    "Echo",
+    "foxtrot",
+    "golf",
+    "Hotel",
+    "india",
+    "juliet",
+)
+"""The stems to make the names of entries from."""
+
+SUFFIXES: Final[tuple[str, ...]] = (".txt", ".py", ".md", ".json", ".csv", "")
+"""The suffixes to give to files."""
+
+SEED: Final[int] = 42
+"""The seed for shuffling the entries, so every run gets the same directory."""
+
+
+##############################################################################
+class SyntheticTree(NamedTuple):
+    """A synthetic directory, ready to be benchmarked against."""
+
+    root: Path
+    """The directory full of entries."""
+
+    empty: Path
+    """An empty directory, beside the full one, to move away to."""
+
+    size: int
+    """The number of entries in the directory."""
+
+    files: int
+    """The number of visible files."""
+
+    directories: int
+    """The number of directories."""
+
+    hidden: int
+    """The number of hidden files."""
+
+    links: int
+    """The number of symbolic links."""
+
+    dangling: int
+    """The number of symbolic links that go nowhere."""
+
+    @property
+    def shown(self) -> int:
+        """The number of entries shown, when hidden entries aren't."""
+        return self.size - self.hidden - self.dangling
+
+
+##############################################################################
+def _name(index: int, suffix: str = "") -> str:
+    """Make the name of an entry.
+
+    Args:
+        index: The index of the entry.
+        suffix: The suffix to give the entry.
+
+    Returns:
+        The name of the entry.
+    """
+    return f"{STEMS[index % len(STEMS)]}-{index:07d}{suffix}"
+
+
+##############################################################################
+def make_tree(root: Path, size: int) -> SyntheticTree:
+    """Make a synthetic directory.
+
+    Args:
+        root: The directory to make the synthetic directory within.
+        size: The number of entries to put in the directory.
+
+    Returns:
+        The details of the synthetic directory.
+
+    If the directory has already been made, below `root`, it is used as it
+    is.
+    """
+    directory = root / f"entries-{size}"
+    empty = root / "empty"
+    empty.mkdir(parents=True, exist_ok=True)
+    directories = size // 10
+    hidden = size // 20
+    links = size // 20
+    files = size - directories - hidden - links
+
+    # The entries are made in a shuffled order, so that the order they're
+    # listed in has nothing to do with the order they'll be sorted into;
+    # every third link is to a directory, and every tenth goes nowhere.
+    kinds = ["d"] * directories + ["h"] * hidden + ["l"] * links + ["f"] * files
+    Random(SEED).shuffle(kinds)
+    dangling = {
+        index
+        for index, kind in enumerate(kinds)
+        if kind == "l" and (index % 10 == 0 or not (files and directories))
+    }
+    tree = SyntheticTree(
+        directory, empty, size, files, directories, hidden, links, len(dangling)
+    )
+    if (complete := root / f"entries-{size}.complete").exists():
+        return tree
+
+    rmtree(directory, ignore_errors=True)
+    directory.mkdir(parents=True)
+    made_files: list[str] = []
+    made_directories: list[str] = []
+    for index, kind in enumerate(kinds):
+        if kind == "d":
+            os.mkdir(directory / (name := _name(index)))
+            made_directories.append(name)
+        elif kind == "f" or kind == "h":
+            name = _name(index, SUFFIXES[index % len(SUFFIXES)])
+            if kind == "h":
+                name = f".{name}"
+            else:
+                made_files.append(name)
+            os.close(os.open(directory / name, os.O_CREAT | os.O_WRONLY, 0o644))
+    # Links are made last, so that they have something to point at.
+    for index, kind in enumerate(kinds):
+        if kind == "l":
+            if index in dangling:
+                target = f"missing-{index}"
+            elif index % 3 == 0:
+                target = made_directories[index % len(made_directories)]
+            else:
+                target = made_files[index % len(made_files)]
+            os.symlink(target, directory / _name(index, ".lnk"))
+    complete.touch()
+    return tree
+
+
+### synthetic.py ends here
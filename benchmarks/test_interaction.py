@@ -0,0 +1,391 @@
+"""Benchmarks for how quickly the dialogs respond to the user.
+
+Each dialog is driven headlessly, with Textual's
+[`Pilot`][textual.pilot.Pilot], and the latency of each interaction is
+measured from the key being pressed to the display being painted for the
+last time as a result; that is, once any work started by the key, such as
+loading a directory or suggesting a completion, has finished and the
+result has been shown.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import asyncio
+from collections.abc import Awaitable, Callable
+from time import perf_counter
+from typing import Any, Final
+
+##############################################################################
+# pytest imports.
+import pytest
+
+##############################################################################
+# Rich imports.
+from rich.console import RenderableType
+
+##############################################################################
+# Textual imports.
+from textual.app import App
+from textual.pilot import Pilot
+from textual.screen import Screen
+from textual.widgets import Input
+
+##############################################################################
+# Local imports.
+from textual_fspicker import FileOpen, FileSave, Filter, Filters, SelectDirectory
+from textual_fspicker.base_dialog import FileSystemPickerScreen
+from textual_fspicker.file_dialog import FileFilter
+from textual_fspicker.parts import DirectoryNavigation
+from textual_fspicker.parts.directory_navigation import DirectoryEntry
+
+from .measure import BenchmarkResults, summarise
+from .synthetic import SyntheticTree
+
+##############################################################################
+QUIET: Final[float] = 0.05
+"""How long, in seconds, the display has to go unpainted to be settled."""
+
+SETTLE_TIMEOUT: Final[float] = 600
+"""How long, in seconds, to wait for an interaction to settle."""
+
+KEYSTROKES: Final[int] = 30
+"""The number of times to measure interactions that are quick to make."""
+
+TYPED: Final[str] = "charlie-00"
+"""What to type into the input of a dialog, one key at a time."""
+
+
+##############################################################################
+class Latency:
+    """Measures the time from keys being pressed to the display being painted."""
+
+    def __init__(self, app: App[None], pilot: Pilot[None]) -> None:
+        """Initialise the measurement.
+
+        Args:
+            app: The app to measure.
+            pilot: The pilot driving the app.
+        """
+        self._app = app
+        """The app being measured."""
+        self._pilot = pilot
+        """The pilot driving the app."""
+        self._painted: list[float] = []
+        """The times at which the display was painted."""
+        display = app._display
+
+        def _display(screen: Screen[object], renderable: RenderableType | None) -> None:
+            if renderable is not None:
+                self._painted.append(perf_counter())
+            display(screen, renderable)
+
+        app._display = _display  # type: ignore[method-assign]
+
+    @property
+    def _busy(self) -> bool:
+        """Is the app still working on something?"""
+        return any(worker.is_running for worker in self._app.workers)
+
+    async def settle(self) -> None:
+        """Wait for the app to finish working and painting."""
+        started = perf_counter()
+        while True:
+            await asyncio.sleep(0.001)
+            now = perf_counter()
+            if now - started > SETTLE_TIMEOUT:
+                raise TimeoutError("The app didn't settle")
+            if (
+                not self._busy
+                and now - started >= QUIET
+                and (not self._painted or now - self._painted[-1] >= QUIET)
+            ):
+                return
+
+    async def press(self, *keys: str) -> float:
+        """Press keys and measure how long it takes for the result to be shown.
+
+        Args:
+            keys: The keys to press.
+
+        Returns:
+            The time, in seconds, from the keys being pressed to the last
+                paint that resulted.
+        """
+        self._painted.clear()
+        started = perf_counter()
+        await self._pilot.press(*keys)
+        await self.settle()
+        assert self._painted, f"Pressing {keys!r} didn't change the display"
+        return self._painted[-1] - started
+
+
+##############################################################################
+class DialogApp(App[None]):
+    """An app for benchmarking one of the dialogs."""
+
+    def __init__(self, dialog: FileSystemPickerScreen[Any]) -> None:
+        """Initialise the app.
+
+        Args:
+            dialog: The dialog to benchmark.
+        """
+        super().__init__()
+        self.dialog = dialog
+        """The dialog being benchmarked."""
+
+    def on_mount(self) -> None:
+        """Open the dialog."""
+        self.push_screen(self.dialog)
+
+
+##############################################################################
+FILTERS: Final[Filters] = Filters(
+    ("Any", lambda _: True),
+    Filter.from_suffixes("Text", ".txt"),
+    Filter.from_suffixes("Python", ".py"),
+)
+"""The filters to switch between in the file dialogs."""
+
+Interaction = Callable[
+    [Latency, FileSystemPickerScreen[Any], int], Awaitable[list[float]]
+]
+"""The type of a function that measures an interaction with a dialog."""
+
+DialogMaker = Callable[[SyntheticTree], FileSystemPickerScreen[Any]]
+"""The type of a function that makes a dialog to benchmark."""
+
+
+##############################################################################
+async def _highlight(
+    latency: Latency, dialog: FileSystemPickerScreen[Any], rounds: int
+) -> list[float]:
+    """Measure moving the highlight.
+
+    Args:
+        latency: The measurement to take.
+        dialog: The dialog to interact with.
+        rounds: The number of times to take the measurement.
+
+    Returns:
+        The latency of each move of the highlight.
+    """
+    del rounds
+    dialog.query_one(DirectoryNavigation).focus()
+    return [await latency.press("down") for _ in range(KEYSTROKES)]
+
+
+##############################################################################
+async def _toggle_hidden(
+    latency: Latency, dialog: FileSystemPickerScreen[Any], rounds: int
+) -> list[float]:
+    """Measure toggling the display of hidden entries.
+
+    Args:
+        latency: The measurement to take.
+        dialog: The dialog to interact with.
+        rounds: The number of times to take the measurement.
+
+    Returns:
+        The latency of each toggle.
+    """
+    dialog.query_one(DirectoryNavigation).focus()
+    return [await latency.press("full_stop") for _ in range(rounds * 2)]
+
+
+##############################################################################
+def _highlight_directory(navigation: DirectoryNavigation) -> None:
+    """Highlight the first directory in the navigation, other than the parent.
+
+    Args:
+        navigation: The navigation to highlight a directory in.
+    """
+    navigation.highlighted = next(
+        index
+        for index in range(1, navigation.option_count)
+        if isinstance(entry := navigation.get_option_at_index(index), DirectoryEntry)
+        and entry.is_dir
+    )
+
+
+##############################################################################
+async def _enter_directory(
+    latency: Latency, dialog: FileSystemPickerScreen[Any], rounds: int
+) -> list[float]:
+    """Measure entering a directory.
+
+    Args:
+        latency: The measurement to take.
+        dialog: The dialog to interact with.
+        rounds: The number of times to take the measurement.
+
+    Returns:
+        The latency of each directory being entered.
+    """
+    navigation = dialog.query_one(DirectoryNavigation)
+    navigation.focus()
+    samples: list[float] = []
+    for _ in range(rounds):
+        _highlight_directory(navigation)
+        await latency.settle()
+        samples.append(await latency.press("enter"))
+        await latency.press("backspace")
+    return samples
+
+
+##############################################################################
+async def _leave_directory(
+    latency: Latency, dialog: FileSystemPickerScreen[Any], rounds: int
+) -> list[float]:
+    """Measure leaving a directory, for the large one it's in.
+
+    Args:
+        latency: The measurement to take.
+        dialog: The dialog to interact with.
+        rounds: The number of times to take the measurement.
+
+    Returns:
+        The latency of each directory being left.
+    """
+    navigation = dialog.query_one(DirectoryNavigation)
+    navigation.focus()
+    samples: list[float] = []
+    for _ in range(rounds):
+        _highlight_directory(navigation)
+        await latency.settle()
+        await latency.press("enter")
+        samples.append(await latency.press("backspace"))
+    return samples
+
+
+##############################################################################
+async def _type(
+    latency: Latency, dialog: FileSystemPickerScreen[Any], rounds: int
+) -> list[float]:
+    """Measure typing into the input of the dialog, with path completion.
+
+    Args:
+        latency: The measurement to take.
+        dialog: The dialog to interact with.
+        rounds: The number of times to take the measurement.
+
+    Returns:
+        The latency of each key typed.
+    """
+    del rounds
+    typing = dialog.query_one("InputBar Input", Input)
+    samples: list[float] = []
+    while len(samples) < KEYSTROKES:
+        typing.value = ""
+        typing.focus()
+        await latency.settle()
+        for character in TYPED:
+            samples.append(await latency.press(character))
+    return samples[:KEYSTROKES]
+
+
+##############################################################################
+async def _switch_filter(
+    latency: Latency, dialog: FileSystemPickerScreen[Any], rounds: int
+) -> list[float]:
+    """Measure switching from one filter to another.
+
+    Args:
+        latency: The measurement to take.
+        dialog: The dialog to interact with.
+        rounds: The number of times to take the measurement.
+
+    Returns:
+        The latency of each switch of filter.
+    """
+    switcher = dialog.query_one(FileFilter)
+    samples: list[float] = []
+    for round in range(rounds * 2):
+        switcher.focus()
+        await latency.settle()
+        # Open the list of filters and move to the next one (or back again)
+        # and only measure the choice being made.
+        await latency.press("enter", "down" if round % 2 == 0 else "up")
+        samples.append(await latency.press("enter"))
+    return samples
+
+
+##############################################################################
+INTERACTIONS: Final[dict[str, tuple[DialogMaker, tuple[str, ...]]]] = {
+    "FileOpen": (
+        lambda tree: FileOpen(tree.root, filters=FILTERS),
+        (
+            "highlight",
+            "toggle_hidden",
+            "enter_directory",
+            "leave_directory",
+            "type",
+            "switch_filter",
+        ),
+    ),
+    "FileSave": (
+        lambda tree: FileSave(tree.root, filters=FILTERS),
+        (
+            "highlight",
+            "toggle_hidden",
+            "enter_directory",
+            "leave_directory",
+            "type",
+            "switch_filter",
+        ),
+    ),
+    "SelectDirectory": (
+        lambda tree: SelectDirectory(tree.root),
+        ("highlight", "toggle_hidden", "enter_directory", "leave_directory"),
+    ),
+}
+"""The dialogs to benchmark, and the interactions to benchmark for each."""
+
+MEASURES: Final[dict[str, Interaction]] = {
+    "highlight": _highlight,
+    "toggle_hidden": _toggle_hidden,
+    "enter_directory": _enter_directory,
+    "leave_directory": _leave_directory,
+    "type": _type,
+    "switch_filter": _switch_filter,
+}
+"""The functions that measure each interaction."""
+
+
+##############################################################################
+@pytest.mark.parametrize("dialog_name", list(INTERACTIONS))
+def test_interaction(
+    dialog_name: str, tree: SyntheticTree, rounds: int, results: BenchmarkResults
+) -> None:
+    """Benchmark the latency of interacting with a dialog."""
+
+    make_dialog, interactions = INTERACTIONS[dialog_name]
+    latencies: dict[str, list[float]] = {}
+
+    async def benchmark() -> None:
+        app = DialogApp(make_dialog(tree))
+        async with app.run_test(size=(120, 40)) as pilot:
+            latency = Latency(app, pilot)
+            # The blinking of the cursor in an input would keep the
+            # display from ever settling.
+            for typing in app.dialog.query(Input):
+                typing.cursor_blink = False
+            await latency.settle()
+            for interaction in interactions:
+                latencies[interaction] = await MEASURES[interaction](
+                    latency, app.dialog, rounds
+                )
+
+    asyncio.run(benchmark())
+    for interaction, samples in latencies.items():
+        results.record(
+            f"latency:{dialog_name}:{interaction}",
+            tree.size,
+            latency=summarise(samples),
+        )
+
+
+### test_interaction.py ends here
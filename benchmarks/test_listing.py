@@ -0,0 +1,249 @@
+"""Benchmarks for listing directories with the directory navigation widget."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import asyncio
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter
+from typing import Final
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+from textual.worker import Worker, WorkerState
+
+##############################################################################
+# Local imports.
+from textual_fspicker import Filter
+from textual_fspicker.parts import DirectoryNavigation
+from textual_fspicker.parts.directory_navigation import DirectoryEntry
+
+from .measure import BenchmarkResults, FilesystemCalls, summarise
+from .synthetic import SyntheticTree
+
+##############################################################################
+LOAD_TIMEOUT: Final[float] = 600
+"""How long, in seconds, to wait for a directory to load."""
+
+TEXT_FILES: Final[Filter] = Filter.from_suffixes("Text", ".txt")
+"""The filter to switch to when benchmarking filtering."""
+
+
+##############################################################################
+class TimedNavigation(DirectoryNavigation):
+    """Directory navigation that keeps track of how long loading takes."""
+
+    def __init__(self, location: Path) -> None:
+        """Initialise the navigation.
+
+        Args:
+            location: The location to start in.
+        """
+        super().__init__(location)
+        self.started = perf_counter()
+        """When the last load was started."""
+        self.first_row: float | None = None
+        """When the first entry of the last load was shown, if it has been."""
+        self.finished: float | None = None
+        """When the last load finished, if it has."""
+        self.loaded = asyncio.Event()
+        """Set when the last load has finished."""
+
+    def load(self, location: Path) -> None:
+        """Start loading a directory.
+
+        Args:
+            location: The location of the directory to load.
+        """
+        self.first_row = self.finished = None
+        self.loaded.clear()
+        self.started = perf_counter()
+        self.location = location
+
+    async def wait(self) -> None:
+        """Wait for the last load to finish."""
+        await asyncio.wait_for(self.loaded.wait(), LOAD_TIMEOUT)
+
+    def _seen_rows(self) -> None:
+        """Note when the first entry, other than the parent, was shown."""
+        if self.first_row is None and self.option_count > (0 if self.is_root else 1):
+            self.first_row = perf_counter()
+
+    def _show_first_page(self, location: Path, entries: list[DirectoryEntry]) -> None:
+        """Show the first page of a directory, noting when it was shown."""
+        super()._show_first_page(location, entries)
+        self._seen_rows()
+
+    def _repopulate_display(self, evaluate: bool = True) -> None:
+        """Repopulate the display, noting when it was populated."""
+        super()._repopulate_display(evaluate)
+        self._seen_rows()
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Note when a load has finished.
+
+        Args:
+            event: The event to handle.
+        """
+        if event.worker.name == "_load_listing" and event.state == WorkerState.SUCCESS:
+            self.finished = perf_counter()
+            self.loaded.set()
+
+
+##############################################################################
+class NavigationApp(App[None]):
+    """An app for benchmarking the directory navigation widget."""
+
+    def __init__(self, location: Path) -> None:
+        """Initialise the app.
+
+        Args:
+            location: The location to start in.
+        """
+        super().__init__()
+        self._location = location
+        """The location to start in."""
+
+    def compose(self) -> ComposeResult:
+        """Compose the app."""
+        yield TimedNavigation(self._location)
+
+
+##############################################################################
+async def _navigation(app: NavigationApp) -> TimedNavigation:
+    """Get the navigation from the app, once it has loaded where it started.
+
+    Args:
+        app: The app to get the navigation from.
+
+    Returns:
+        The navigation.
+    """
+    navigation = app.query_one(TimedNavigation)
+    await navigation.wait()
+    return navigation
+
+
+##############################################################################
+def test_load(tree: SyntheticTree, rounds: int, results: BenchmarkResults) -> None:
+    """Benchmark loading a directory, and the time to its first entry."""
+
+    first_rows: list[float] = []
+    loads: list[float] = []
+    calls = FilesystemCalls()
+
+    async def benchmark() -> None:
+        app = NavigationApp(tree.empty)
+        async with app.run_test():
+            navigation = await _navigation(app)
+            for _ in range(rounds):
+                navigation.load(tree.root)
+                await navigation.wait()
+                assert navigation.first_row is not None
+                assert navigation.finished is not None
+                first_rows.append(navigation.first_row - navigation.started)
+                loads.append(navigation.finished - navigation.started)
+                navigation.load(tree.empty)
+                await navigation.wait()
+            # Count the calls to the filesystem in a round of its own, as
+            # counting them slows things down.
+            with calls.counting():
+                navigation.load(tree.root)
+                await navigation.wait()
+            # Everything that should be shown is, along with the parent.
+            assert navigation.option_count == tree.shown + 1
+
+    asyncio.run(benchmark())
+    results.record(
+        "load",
+        tree.size,
+        first_row=summarise(first_rows),
+        load=summarise(loads),
+        filesystem_calls=calls.as_json(),
+    )
+
+
+##############################################################################
+def _toggle_hidden(navigation: DirectoryNavigation) -> None:
+    """Toggle the display of hidden entries.
+
+    Args:
+        navigation: The navigation to toggle.
+    """
+    navigation.show_hidden = not navigation.show_hidden
+
+
+##############################################################################
+def _toggle_filter(navigation: DirectoryNavigation) -> None:
+    """Toggle filtering the display down to text files.
+
+    Args:
+        navigation: The navigation to toggle.
+    """
+    navigation.file_filter = None if navigation.file_filter else TEXT_FILES
+
+
+##############################################################################
+def _toggle_sorting(navigation: DirectoryNavigation) -> None:
+    """Toggle the sorting of the display.
+
+    Args:
+        navigation: The navigation to toggle.
+    """
+    navigation.sort_display = not navigation.sort_display
+
+
+##############################################################################
+TOGGLES: Final[dict[str, Callable[[DirectoryNavigation], None]]] = {
+    "show_hidden": _toggle_hidden,
+    "file_filter": _toggle_filter,
+    "sort_display": _toggle_sorting,
+}
+"""The changes to the display to benchmark repopulating for."""
+
+
+##############################################################################
+def test_repopulate(
+    tree: SyntheticTree, rounds: int, results: BenchmarkResults
+) -> None:
+    """Benchmark repopulating the display after a change to what's shown."""
+
+    repopulates: dict[str, list[float]] = {toggle: [] for toggle in TOGGLES}
+    calls: dict[str, FilesystemCalls] = {
+        toggle: FilesystemCalls() for toggle in TOGGLES
+    }
+
+    async def benchmark() -> None:
+        app = NavigationApp(tree.root)
+        async with app.run_test() as pilot:
+            navigation = await _navigation(app)
+            for toggle, change in TOGGLES.items():
+                # Each change is made, and then undone, so that every round
+                # starts from the same place.
+                for _ in range(rounds):
+                    for _ in range(2):
+                        started = perf_counter()
+                        change(navigation)
+                        repopulates[toggle].append(perf_counter() - started)
+                        await pilot.pause()
+                with calls[toggle].counting():
+                    for _ in range(2):
+                        change(navigation)
+                        await pilot.pause()
+
+    asyncio.run(benchmark())
+    for toggle, timings in repopulates.items():
+        results.record(
+            f"repopulate:{toggle}",
+            tree.size,
+            repopulate=summarise(timings),
+            filesystem_calls=calls[toggle].as_json(),
+        )
+
+
+### test_listing.py ends here
@@ -0,0 +1,21 @@
+from textual import on, work
+from textual.app import App, ComposeResult
+from textual.widgets import Button, Label
+
+from textual_fspicker import MultiFileOpen
+
+
+class MultiFileOpenApp(App[None]):
+    def compose(self) -> ComposeResult:
+        yield Button("Press to open some files")
+        yield Label()
+
+    @on(Button.Pressed)
+    @work
+    async def open_some_files(self) -> None:
+        if opened := await self.push_screen_wait(MultiFileOpen()):
+            self.query_one(Label).update("\n".join(str(file) for file in opened))
+
+
+if __name__ == "__main__":
+    MultiFileOpenApp().run()
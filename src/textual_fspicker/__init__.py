@@ -1,8 +1,13 @@
 """A library that provides widgets for selecting things from the filesystem."""
 
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
 ##############################################################################
 # Python imports.
-from importlib.metadata import version
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Final
 
 ######################################################################
 # Main app information.
@@ -11,20 +16,97 @@ __copyright__ = "Copyright 2023-2025, Dave Pearson"
 __credits__ = ["Dave Pearson"]
 __maintainer__ = "Dave Pearson"
 __email__ = "davep@davep.org"
-__version__ = version("textual_fspicker")
 __licence__ = "MIT"
 
 ##############################################################################
 # Local imports.
-from .file_open import FileOpen
-from .file_save import FileSave
-from .icons import Icons
-from .path_filters import Filters
-from .path_maker import MakePath
-from .select_directory import SelectDirectory
+if TYPE_CHECKING:
+    from .archives import ArchivePath
+    from .file_open import FileOpen
+    from .file_save import FileSave
+    from .filename_index import FilenameIndex
+    from .icons import Icons
+    from .ignore_rules import IgnoreRules
+    from .listing_cache import ListingCache
+    from .multi_file_open import MultiFileOpen
+    from .path_filters import Filter, Filters
+    from .path_maker import MakePath
+    from .select_directory import SelectDirectory
+
+    __version__: str
 
 ##############################################################################
 # Export the imports.
-__all__ = ["FileOpen", "FileSave", "Icons", "SelectDirectory", "Filters", "MakePath"]
+__all__ = [
+    "ArchivePath",
+    "FileOpen",
+    "FileSave",
+    "FilenameIndex",
+    "Icons",
+    "IgnoreRules",
+    "ListingCache",
+    "MultiFileOpen",
+    "SelectDirectory",
+    "Filter",
+    "Filters",
+    "MakePath",
+]
+
+##############################################################################
+# Where to find each of the exports.
+_EXPORTED_FROM: Final[dict[str, str]] = {
+    "ArchivePath": ".archives",
+    "FileOpen": ".file_open",
+    "FileSave": ".file_save",
+    "FilenameIndex": ".filename_index",
+    "Icons": ".icons",
+    "IgnoreRules": ".ignore_rules",
+    "ListingCache": ".listing_cache",
+    "MultiFileOpen": ".multi_file_open",
+    "SelectDirectory": ".select_directory",
+    "Filter": ".path_filters",
+    "Filters": ".path_filters",
+    "MakePath": ".path_maker",
+}
+
+
+##############################################################################
+def __getattr__(name: str) -> Any:
+    """Get an export of the library, importing it the first time it's used.
+
+    Args:
+        name: The name of the export.
+
+    Returns:
+        The export.
+
+    Raises:
+        AttributeError: If there is no such export.
+
+    Importing the dialogs means importing Textual, and finding the version
+    of the library means looking through the installed distributions; so
+    neither happens until it's needed.
+    """
+    if name == "__version__":
+        from importlib.metadata import version
+
+        exported: Any = version("textual_fspicker")
+    elif (module := _EXPORTED_FROM.get(name)) is not None:
+        exported = getattr(import_module(module, __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = exported
+    return exported
+
+
+##############################################################################
+def __dir__() -> list[str]:
+    """Get the names available in the library.
+
+    Returns:
+        The names, including the exports that haven't been imported yet.
+    """
+    return sorted({*globals(), *__all__, "__version__"})
+
 
 ### __init__.py ends here
@@ -17,7 +17,7 @@ from textual.widgets import Button, Footer, Label
 
 ##############################################################################
 # Local imports.
-from textual_fspicker import FileOpen, FileSave, Filters, SelectDirectory
+from textual_fspicker import FileOpen, FileSave, Filter, Filters, SelectDirectory
 
 
 ##############################################################################
@@ -66,14 +66,15 @@ class TestApp(App[None]):
             FileOpen(
                 ".",
                 filters=Filters(
-                    ("Python", lambda p: p.suffix.lower() == ".py"),
+                    Filter.from_suffixes("Python", ".py"),
                     ("Any", lambda _: True),
-                    ("Emacs", lambda p: p.suffix.lower() == ".el"),
-                    ("Lisp", lambda p: p.suffix.lower() in (".lisp", ".lsp", ".cl")),
-                    ("Pascal", lambda p: p.suffix.lower() == ".pas"),
-                    ("Clipper", lambda p: p.suffix.lower() in (".prg", ".ch")),
-                    ("C", lambda p: p.suffix.lower() in (".c", ".h")),
-                    ("C++", lambda p: p.suffix.lower() in (".cpp", ".cc", ".h")),
+                    Filter.from_suffixes("Emacs", ".el"),
+                    Filter.from_suffixes("Lisp", ".lisp", ".lsp", ".cl"),
+                    Filter.from_suffixes("Pascal", ".pas"),
+                    Filter.from_suffixes("Clipper", ".prg", ".ch"),
+                    Filter.from_suffixes("C", ".c", ".h"),
+                    Filter.from_suffixes("C++", ".cpp", ".cc", ".h"),
+                    Filter.from_globs("Make", "Makefile", "*.mk"),
                 ),
             ),
             callback=self.show_selected,
@@ -0,0 +1,631 @@
+"""Support code for browsing inside zip and tar archives.
+
+An [`ArchivePath`][textual_fspicker.archives.ArchivePath] is a local path
+that can lead inside an archive; for example, given an archive called
+`bundle.zip` that contains `docs/readme.txt`:
+
+```python
+>>> from textual_fspicker.archives import ArchivePath
+>>> readme = ArchivePath("bundle.zip/docs/readme.txt")
+>>> readme.is_file()
+True
+>>> readme.read_text()
+'Hello, World!\\n'
+```
+
+An archive itself is treated as a directory, and its members as the
+entries within it. Only the index of an archive is read to do this (the
+central directory of a zip archive, or the member headers of a tar
+archive), and that index is cached until the archive changes; the content
+of a member is only read when it is opened.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import sys
+from collections.abc import Callable, Generator
+from datetime import datetime
+from errno import EISDIR, ENOENT, ENOTDIR, EROFS
+from io import BufferedReader, TextIOWrapper, text_encoding
+from os import stat_result, strerror
+from pathlib import PosixPath, WindowsPath
+from posixpath import normpath
+from stat import S_IFDIR, S_IFREG, S_ISDIR, S_ISLNK, S_ISREG
+from threading import Lock
+from typing import IO, TYPE_CHECKING, Any, ClassVar, Final, NamedTuple, TypeAlias
+
+if TYPE_CHECKING:
+    import tarfile
+    import zipfile
+
+##############################################################################
+ARCHIVE_SUFFIXES: Final[tuple[str, ...]] = (
+    ".zip",
+    ".tar",
+    ".tar.gz",
+    ".tgz",
+    ".tar.bz2",
+    ".tbz2",
+    ".tar.xz",
+    ".txz",
+)
+"""The suffixes of the names of files that are taken to be archives."""
+
+DEFAULT_CACHE_SIZE: Final[int] = 16
+"""The default number of archive indexes to keep in the cache."""
+
+##############################################################################
+if sys.platform == "win32":
+    _LocalPath = WindowsPath
+else:
+    _LocalPath = PosixPath
+
+
+##############################################################################
+def is_archive_name(name: str) -> bool:
+    """Does the given name look like that of an archive?
+
+    Args:
+        name: The name to test.
+
+    Returns:
+        `True` if the name looks like that of an archive, `False` if not.
+    """
+    return name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+##############################################################################
+def _error(code: int, location: object) -> OSError:
+    """Make an error to raise for a location.
+
+    Args:
+        code: The error number.
+        location: The location the error is for.
+
+    Returns:
+        The error.
+    """
+    return OSError(code, strerror(code), str(location))
+
+
+##############################################################################
+def _stat(is_dir: bool, size: int, mtime: float) -> stat_result:
+    """Make a stat result for an entry in an archive.
+
+    Args:
+        is_dir: Is the entry a directory?
+        size: The size of the entry.
+        mtime: The modification time of the entry.
+
+    Returns:
+        The stat result.
+    """
+    return stat_result(
+        ((S_IFDIR | 0o555) if is_dir else (S_IFREG | 0o444), 0, 0, 1, 0, 0)
+        + (size, mtime, mtime, mtime)
+    )
+
+
+##############################################################################
+class _TarMemberStream(BufferedReader):
+    """A stream of the content of a member of a tar archive.
+
+    Closing the stream also closes the archive it reads from.
+    """
+
+    def __init__(self, archive: tarfile.TarFile, stream: IO[bytes]) -> None:
+        """Initialise the stream.
+
+        Args:
+            archive: The archive the member is in.
+            stream: The stream of the content of the member.
+        """
+        super().__init__(stream)  # type: ignore[arg-type]
+        self._archive = archive
+        """The archive the member is in."""
+
+    def close(self) -> None:
+        """Close the stream, and the archive it reads from."""
+        try:
+            super().close()
+        finally:
+            self._archive.close()
+
+
+##############################################################################
+class ArchiveMember(NamedTuple):
+    """The details of a member of an archive."""
+
+    is_dir: bool
+    """Is the member a directory?"""
+
+    size: int
+    """The uncompressed size of the member."""
+
+    mtime: float
+    """The modification time of the member."""
+
+    info: zipfile.ZipInfo | tarfile.TarInfo | None = None
+    """The archive's own record of the member, if it has one.
+
+    Directories that are only implied by the names of the members within
+    them have no record.
+    """
+
+
+##############################################################################
+class ArchiveIndex:
+    """The index of the members of an archive."""
+
+    def __init__(self, archive: PosixPath | WindowsPath) -> None:
+        """Initialise the index.
+
+        Args:
+            archive: The location of the archive to index.
+
+        An archive that can't be read is indexed as an empty archive.
+        """
+        import tarfile
+        import zipfile
+
+        self.archive = archive
+        """The location of the archive."""
+        self._members: dict[str, ArchiveMember] = {"": ArchiveMember(True, 0, 0.0)}
+        """The members of the archive, keyed on their normalised names."""
+        self._children: dict[str, dict[str, None]] = {}
+        """The names of the members within each directory, in archive order."""
+        try:
+            if zipfile.is_zipfile(archive):
+                self._read_zip()
+            else:
+                self._read_tar()
+        except (OSError, EOFError, zipfile.BadZipFile, tarfile.TarError):
+            pass
+
+    @staticmethod
+    def _normalise(name: str) -> str | None:
+        """Normalise the name of a member of an archive.
+
+        Args:
+            name: The name to normalise.
+
+        Returns:
+            The normalised name, or `None` if the name would lead outside
+                of the archive.
+        """
+        parts = [
+            part for part in name.replace("\\", "/").split("/") if part not in ("", ".")
+        ]
+        return None if ".." in parts else "/".join(parts)
+
+    def _add(self, name: str | None, member: ArchiveMember) -> None:
+        """Add a member to the index.
+
+        Args:
+            name: The normalised name of the member.
+            member: The details of the member.
+
+        Any directories the member is within that aren't in the index yet
+        are added along with it.
+        """
+        if not name:
+            return
+        self._members[name] = member
+        while name:
+            parent, _, leaf = name.rpartition("/")
+            self._children.setdefault(parent, {})[leaf] = None
+            if parent in self._members:
+                break
+            self._members[parent] = ArchiveMember(True, 0, member.mtime)
+            name = parent
+
+    def _read_zip(self) -> None:
+        """Read the index of a zip archive, from its central directory."""
+        import zipfile
+
+        with zipfile.ZipFile(self.archive) as archive:
+            for info in archive.infolist():
+                try:
+                    mtime = datetime(*info.date_time).timestamp()
+                except (OverflowError, ValueError):
+                    mtime = 0.0
+                self._add(
+                    self._normalise(info.filename),
+                    ArchiveMember(info.is_dir(), info.file_size, mtime, info),
+                )
+
+    def _read_tar(self) -> None:
+        """Read the index of a tar archive, from the headers of its members."""
+        import tarfile
+
+        with tarfile.open(self.archive) as archive:
+            for info in archive:
+                if info.isdir() or info.isreg():
+                    self._add(
+                        self._normalise(info.name),
+                        ArchiveMember(info.isdir(), info.size, float(info.mtime), info),
+                    )
+
+    def member(self, name: str) -> ArchiveMember | None:
+        """Get the details of a member of the archive.
+
+        Args:
+            name: The normalised name of the member.
+
+        Returns:
+            The details of the member, or `None` if there's no such member.
+        """
+        return self._members.get(name)
+
+    def children(self, name: str) -> list[str]:
+        """Get the names of the members within a directory in the archive.
+
+        Args:
+            name: The normalised name of the directory.
+
+        Returns:
+            The names of the members within the directory.
+
+        Raises:
+            FileNotFoundError: If there's no such member.
+            NotADirectoryError: If the member isn't a directory.
+        """
+        if (member := self.member(name)) is None:
+            raise _error(ENOENT, self.archive / name)
+        if not member.is_dir:
+            raise _error(ENOTDIR, self.archive / name)
+        return list(self._children.get(name, {}))
+
+    def open(self, name: str) -> IO[bytes]:
+        """Open a member of the archive for reading.
+
+        Args:
+            name: The normalised name of the member.
+
+        Returns:
+            A binary stream of the content of the member.
+
+        Raises:
+            FileNotFoundError: If there's no such member.
+            IsADirectoryError: If the member is a directory.
+        """
+        import tarfile
+        import zipfile
+
+        if (member := self.member(name)) is None:
+            raise _error(ENOENT, self.archive / name)
+        if member.is_dir:
+            raise _error(EISDIR, self.archive / name)
+        if isinstance(member.info, zipfile.ZipInfo):
+            # The stream keeps the archive's file open until it is closed.
+            with zipfile.ZipFile(self.archive) as archive:
+                return archive.open(member.info)
+        assert isinstance(member.info, tarfile.TarInfo)
+        # The archive can't be closed here, as the stream reads from it; it
+        # is closed along with the stream.
+        tar = tarfile.open(self.archive)  # noqa: SIM115
+        if (stream := tar.extractfile(member.info)) is None:
+            tar.close()
+            raise _error(ENOENT, self.archive / name)
+        return _TarMemberStream(tar, stream)
+
+
+##############################################################################
+_CacheKey: TypeAlias = tuple[int, int]
+"""The type of the key used to tell if a cached archive index is current."""
+
+
+##############################################################################
+class ArchiveIndexes:
+    """A cache of the indexes of archives."""
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initialise the cache.
+
+        Args:
+            cache_size: The maximum number of indexes to keep in the cache.
+        """
+        self._cache_size = cache_size
+        """The maximum number of indexes to keep in the cache."""
+        self._indexes: dict[str, tuple[_CacheKey, ArchiveIndex]] = {}
+        """The cached indexes, along with the size and time of their archives."""
+        self._lock = Lock()
+        """Lock for updating the cache."""
+
+    def index_of(self, archive: PosixPath | WindowsPath) -> ArchiveIndex:
+        """Get the index of an archive.
+
+        Args:
+            archive: The location of the archive.
+
+        Returns:
+            The index of the archive.
+
+        The archive is only read if there's no index for it in the cache,
+        or if it has changed since it was indexed.
+        """
+        try:
+            details = archive.stat()
+            key = (details.st_size, details.st_mtime_ns)
+        except OSError:
+            key = (-1, -1)
+        cached = self._indexes.get(str(archive))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        index = ArchiveIndex(archive)
+        with self._lock:
+            self._indexes.pop(str(archive), None)
+            while len(self._indexes) >= self._cache_size:
+                del self._indexes[next(iter(self._indexes))]
+            self._indexes[str(archive)] = (key, index)
+        return index
+
+    def clear(self) -> None:
+        """Clear the cache of indexes."""
+        with self._lock:
+            self._indexes.clear()
+
+
+##############################################################################
+class ArchivePath(_LocalPath):
+    """A local path that can lead inside of archives.
+
+    Outside of archives an `ArchivePath` behaves just like any other local
+    path. An archive is treated as a read-only directory, and the members
+    of the archive as the entries within it.
+
+    Note:
+        Only reading from an archive is supported. Also note that the
+        location of a member of an archive (as given by
+        [`str`][str] or [`os.fspath`][os.fspath]) isn't one that the
+        operating system knows how to open; members should be opened with
+        [`open`][textual_fspicker.archives.ArchivePath.open] or read with
+        [`read_bytes`][textual_fspicker.archives.ArchivePath.read_bytes] or
+        [`read_text`][textual_fspicker.archives.ArchivePath.read_text].
+    """
+
+    indexes: ClassVar[ArchiveIndexes] = ArchiveIndexes()
+    """The cache of the indexes of the archives that have been looked in."""
+
+    _located: tuple[PosixPath | WindowsPath, str | None]
+    """Where this path really leads, once that has been worked out."""
+
+    def _locate(self) -> tuple[PosixPath | WindowsPath, str | None]:
+        """Work out where this path really leads.
+
+        Returns:
+            The archive that the path leads into, along with the name of
+                the member of the archive (an empty name being the archive
+                itself); or the real location of the path and `None` if it
+                doesn't lead into an archive.
+
+        Working this out means looking at any part of the path that could
+        be an archive, so it's only done once for each path.
+        """
+        try:
+            return self._located
+        except AttributeError:
+            self._located = located = self._find()
+            return located
+
+    def _find(self) -> tuple[PosixPath | WindowsPath, str | None]:
+        """Find where this path really leads.
+
+        Returns:
+            The archive that the path leads into, along with the name of
+                the member of the archive; or the real location of the path
+                and `None` if it doesn't lead into an archive.
+        """
+        parts = self.parts
+        for end in range(1, len(parts) + 1):
+            if (
+                is_archive_name(parts[end - 1])
+                and (archive := _LocalPath(*parts[:end])).is_file()
+            ):
+                member = normpath("/".join(parts[end:])) if end < len(parts) else ""
+                if member == ".":
+                    member = ""
+                elif member == ".." or member.startswith("../"):
+                    # This leads back out of the archive.
+                    return ArchivePath(archive.parent, *member.split("/")[1:])._locate()
+                return archive, member
+        return _LocalPath(self), None
+
+    @property
+    def archive(self) -> PosixPath | WindowsPath | None:
+        """The archive this path leads into, if it leads into one."""
+        location, member = self._locate()
+        return None if member is None else location
+
+    @property
+    def member(self) -> str | None:
+        """The name of the member of the archive this path leads to, if any.
+
+        The name of the archive itself is an empty string.
+        """
+        return self._locate()[1]
+
+    def stat(self, *, follow_symlinks: bool = True) -> stat_result:
+        """Get the details of the entry this path leads to.
+
+        Args:
+            follow_symlinks: Should a symbolic link be followed?
+
+        Returns:
+            The details of the entry.
+        """
+        location, member = self._locate()
+        if member is None:
+            return location.stat(follow_symlinks=follow_symlinks)
+        if not member:
+            archive = location.stat(follow_symlinks=follow_symlinks)
+            if S_ISLNK(archive.st_mode):
+                return archive
+            return _stat(True, archive.st_size, archive.st_mtime)
+        if (found := self.indexes.index_of(location).member(member)) is None:
+            raise _error(ENOENT, self)
+        return _stat(found.is_dir, found.size, found.mtime)
+
+    def lstat(self) -> stat_result:
+        """Get the details of the entry this path leads to, without following links.
+
+        Returns:
+            The details of the entry.
+        """
+        return self.stat(follow_symlinks=False)
+
+    def _is(self, test: Callable[[int], bool], follow_symlinks: bool) -> bool:
+        """Test the mode of the entry this path leads to.
+
+        Args:
+            test: The test to make.
+            follow_symlinks: Should a symbolic link be followed?
+
+        Returns:
+            The result of the test, or `False` if there is no such entry.
+        """
+        try:
+            return test(self.stat(follow_symlinks=follow_symlinks).st_mode)
+        except (OSError, ValueError):
+            return False
+
+    def exists(self, *, follow_symlinks: bool = True) -> bool:
+        """Does the entry this path leads to exist?
+
+        Args:
+            follow_symlinks: Should a symbolic link be followed?
+
+        Returns:
+            `True` if the entry exists, `False` if not.
+        """
+        location, member = self._locate()
+        if member is None and follow_symlinks:
+            return location.exists()
+        return self._is(lambda _: True, follow_symlinks)
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        """Does this path lead to a directory?
+
+        Args:
+            follow_symlinks: Should a symbolic link be followed?
+
+        Returns:
+            `True` if the path leads to a directory, `False` if not.
+        """
+        location, member = self._locate()
+        if member is None and follow_symlinks:
+            return location.is_dir()
+        return self._is(S_ISDIR, follow_symlinks)
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        """Does this path lead to a file?
+
+        Args:
+            follow_symlinks: Should a symbolic link be followed?
+
+        Returns:
+            `True` if the path leads to a file, `False` if not.
+        """
+        location, member = self._locate()
+        if member is None and follow_symlinks:
+            return location.is_file()
+        return self._is(S_ISREG, follow_symlinks)
+
+    def is_symlink(self) -> bool:
+        """Does this path lead to a symbolic link?
+
+        Returns:
+            `True` if the path leads to a symbolic link, `False` if not.
+
+        Note:
+            Members of archives are never taken to be links.
+        """
+        location, member = self._locate()
+        return False if member else location.is_symlink()
+
+    def iterdir(self) -> Generator[ArchivePath, None, None]:
+        """Iterate over the entries in the directory this path leads to.
+
+        Yields:
+            The paths of the entries in the directory.
+        """
+        location, member = self._locate()
+        if member is None:
+            for entry in location.iterdir():
+                yield ArchivePath(entry)
+        else:
+            for name in self.indexes.index_of(location).children(member):
+                yield self / name
+
+    def open(  # type: ignore[override]
+        self,
+        mode: str = "r",
+        buffering: int = -1,
+        encoding: str | None = None,
+        errors: str | None = None,
+        newline: str | None = None,
+    ) -> IO[Any]:
+        """Open the file this path leads to.
+
+        Args:
+            mode: The mode to open the file in.
+            buffering: The buffering policy.
+            encoding: The encoding to use in text mode.
+            errors: How to handle encoding errors in text mode.
+            newline: How to handle newlines in text mode.
+
+        Returns:
+            The opened file.
+
+        Raises:
+            OSError: If an attempt is made to write to a member of an archive.
+
+        A member of an archive isn't read until it is opened; only reading
+        is supported, and `buffering` is ignored.
+        """
+        location, member = self._locate()
+        if member is None:
+            return location.open(mode, buffering, encoding, errors, newline)
+        if set(mode) - set("rbt"):
+            raise _error(EROFS, self)
+        if not member:
+            raise _error(EISDIR, self)
+        stream = self.indexes.index_of(location).open(member)
+        if "b" in mode:
+            return stream
+        return TextIOWrapper(stream, text_encoding(encoding), errors, newline)
+
+    def read_bytes(self) -> bytes:
+        """Read the content of the file this path leads to, as bytes.
+
+        Returns:
+            The content of the file.
+        """
+        with self.open("rb") as content:
+            return bytes(content.read())
+
+    def read_text(
+        self,
+        encoding: str | None = None,
+        errors: str | None = None,
+        newline: str | None = None,
+    ) -> str:
+        """Read the content of the file this path leads to, as text.
+
+        Args:
+            encoding: The encoding to use.
+            errors: How to handle encoding errors.
+            newline: How to handle newlines.
+
+        Returns:
+            The content of the file.
+        """
+        with self.open("r", encoding=encoding, errors=errors, newline=newline) as text:
+            return str(text.read())
+
+
+### archives.py ends here
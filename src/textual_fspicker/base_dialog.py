@@ -9,7 +9,7 @@ from __future__ import annotations
 import sys
 from collections.abc import Callable
 from pathlib import Path
-from typing import TypeAlias
+from typing import TypeAlias, TypeVar
 
 ##############################################################################
 # Textual imports.
@@ -17,12 +17,18 @@ from textual import on
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
+from textual.events import ScreenResume, ScreenSuspend
 from textual.screen import ModalScreen
-from textual.widgets import Button
+from textual.widgets import Button, Input
 
 ##############################################################################
 # Local imports.
-from .parts import DirectoryNavigation, DriveNavigation
+from .filename_index import FilenameIndex
+from .ignore_rules import IgnoreRules
+from .listing_backends import AsyncListingBackend, ListingBackend
+from .listing_cache import ListingCache
+from .parts import DirectoryNavigation, DriveNavigation, SearchResults
+from .path_maker import MakePath
 
 
 ##############################################################################
@@ -35,14 +41,39 @@ class InputBar(Horizontal):
     """The input bar area of the dialog."""
 
 
+##############################################################################
+class NarrowingInput(Input):
+    """The input for narrowing the display of the dialog.
+
+    This is hidden until the user asks to narrow the display.
+    """
+
+
+##############################################################################
+class SearchInput(Input):
+    """The input for searching below the current directory of the dialog.
+
+    This is hidden until the user asks to search.
+    """
+
+
 ##############################################################################
 ButtonLabel: TypeAlias = str | Callable[[str], str]
 """The type for a button label value."""
 
 
 ##############################################################################
-class FileSystemPickerScreen(ModalScreen[Path | None]):
-    """Base screen for the dialogs in this library."""
+PickerResult = TypeVar("PickerResult")
+"""The type of what a dialog hands back when something is picked."""
+
+
+##############################################################################
+class FileSystemPickerScreen(ModalScreen[PickerResult | None]):
+    """Base screen for the dialogs in this library.
+
+    The screen is generic in the type of what it hands back when something
+    is picked; if the dialog is cancelled it hands back `None`.
+    """
 
     DEFAULT_CSS = """
     FileSystemPickerScreen {
@@ -68,6 +99,30 @@ class FileSystemPickerScreen(ModalScreen[Path | None]):
             height: 1fr;
         }
 
+        NarrowingInput {
+            display: none;
+            &.-active {
+                display: block;
+            }
+        }
+
+        SearchInput, SearchResults {
+            display: none;
+        }
+
+        SearchResults {
+            height: 1fr;
+        }
+
+        Dialog.-searching {
+            SearchInput, SearchResults {
+                display: block;
+            }
+            NarrowingInput, DirectoryNavigation {
+                display: none;
+            }
+        }
+
         InputBar {
             height: auto;
             align: right middle;
@@ -84,8 +139,23 @@ class FileSystemPickerScreen(ModalScreen[Path | None]):
     ERROR_PERMISSION_ERROR = "Permission error"
     """Error to tell there user there was a problem with permissions."""
 
-    BINDINGS = [Binding("full_stop", "hidden"), Binding("escape", "dismiss(None)")]
-    """The bindings for the dialog."""
+    ERROR_LINK_LOOP = "Symbolic link loop"
+    """Error to tell the user that a symbolic link loops."""
+
+    BINDINGS = [
+        Binding("full_stop", "hidden"),
+        Binding("ctrl+s", "sort"),
+        Binding("ctrl+r", "reverse_sort"),
+        Binding("ctrl+t", "measure"),
+        Binding("ctrl+l", "flat"),
+        Binding("ctrl+f", "narrow"),
+        Binding("escape", "escape"),
+    ]
+    """The bindings for the dialog.
+
+    Dialogs that support searching below the current directory also bind
+    the `search` action.
+    """
 
     def __init__(
         self,
@@ -94,6 +164,10 @@ class FileSystemPickerScreen(ModalScreen[Path | None]):
         select_button: ButtonLabel = "",
         cancel_button: ButtonLabel = "",
         double_click_directories: bool = True,
+        ignore_rules: IgnoreRules | None = None,
+        filename_index: FilenameIndex | None = None,
+        listing_cache: ListingCache | None = None,
+        listing_backend: ListingBackend | AsyncListingBackend | None = None,
     ) -> None:
         """Initialise the dialog.
 
@@ -103,6 +177,10 @@ class FileSystemPickerScreen(ModalScreen[Path | None]):
             select_button: Label or format function for the select button.
             cancel_button: Label or format function for the cancel button.
             double_click_directories: Double click to open directories.
+            ignore_rules: Optional rules for entries that should be ignored.
+            filename_index: Optional index to search below the current directory.
+            listing_cache: Optional cache of listings to show while loading.
+            listing_backend: Optional backend to list directories with.
         """
         super().__init__()
         self._location = location
@@ -115,11 +193,27 @@ class FileSystemPickerScreen(ModalScreen[Path | None]):
         """The text prompt for the cancel button, or a function to format it."""
         self._double_click_directories = double_click_directories
         """Should the user need to double-click to select a directory with the mouse?"""
+        self._ignore_rules = ignore_rules
+        """The rules for entries that should be ignored."""
+        self._filename_index = filename_index
+        """The index to search below the current directory, if there is one."""
+        self._listing_cache = listing_cache
+        """The cache of directory listings, if there is one."""
+        self._listing_backend = listing_backend
+        """The backend to list directories with, if one was given."""
+        self._relocate = False
+        """Should the dialog move to its location when it is next reopened?"""
+        self._dismissed = False
+        """Has the dialog been dismissed since it was last shown?"""
 
     def _header_area(self) -> ComposeResult:
         """Provide any widgets for the header of the dialog."""
         yield from ()
 
+    def _side_area(self) -> ComposeResult:
+        """Provide any widgets to show beside the navigation."""
+        yield from ()
+
     def _input_bar(self) -> ComposeResult:
         """Provide any widgets for the input bar, before the buttons."""
         yield from ()
@@ -148,13 +242,20 @@ class FileSystemPickerScreen(ModalScreen[Path | None]):
         with Dialog() as dialog:
             dialog.border_title = self._title
             yield from self._header_area()
+            yield NarrowingInput(placeholder="Narrow")
+            yield SearchInput(placeholder="Search below here")
             with Horizontal():
                 if sys.platform == "win32":
                     yield DriveNavigation(self._location)
                 yield DirectoryNavigation(
                     self._location,
                     double_click_directories=self._double_click_directories,
+                    ignore_rules=self._ignore_rules,
+                    listing_cache=self._listing_cache,
+                    listing_backend=self._listing_backend,
                 )
+                yield SearchResults()
+                yield from self._side_area()
             with InputBar():
                 yield from self._input_bar()
                 yield Button(self._label(self._select_button, "Select"), id="select")
@@ -162,8 +263,72 @@ class FileSystemPickerScreen(ModalScreen[Path | None]):
 
     def on_mount(self) -> None:
         """Focus directory widget on mount."""
+        self._relocate = False
         self.query_one(DirectoryNavigation).focus()
 
+    def reopen(
+        self, *, location: str | Path | None = None, title: str | None = None
+    ) -> None:
+        """Make changes to the dialog before it is next opened.
+
+        Args:
+            location: Optional new location for the dialog to show.
+            title: Optional new title for the dialog.
+
+        A dialog that has been installed with
+        [`install_screen`][textual.app.App.install_screen] is kept, along
+        with the listing it is showing, when it is closed; this allows for
+        changing it before it is pushed again. Anything not given is left
+        as it was.
+        """
+        if location is not None:
+            self._location = location
+            self._relocate = True
+        if title is not None:
+            self._title = title
+
+    def _reopened(self) -> None:
+        """Get the dialog ready to be used again, after it has been reopened.
+
+        The listing and its highlight are kept; anything else left over from
+        the last time the dialog was used is cleared away.
+        """
+        if self._searching:
+            self._end_search()
+        narrowing = self.query_one(NarrowingInput)
+        narrowing.remove_class("-active")
+        narrowing.value = ""
+        self.query_one(Dialog).border_title = self._title
+        self._set_error()
+        navigation = self.query_one(DirectoryNavigation)
+        if self._relocate:
+            self._relocate = False
+            if sys.platform == "win32":
+                self.query_one(DriveNavigation).drive = (
+                    MakePath.of(self._location).absolute().drive
+                )
+            navigation.location = self._location
+        else:
+            navigation.recheck()
+        navigation.focus()
+
+    @on(ScreenSuspend)
+    def _maybe_dismissed(self) -> None:
+        """Note if the dialog has been dismissed, rather than covered."""
+        if self not in self.app.screen_stack:
+            self._dismissed = True
+            # Anything the dialog, or any part of it, was doing when it was
+            # dismissed is no longer wanted.
+            for node in (self, *self.query("*")):
+                self.workers.cancel_node(node)
+
+    @on(ScreenResume)
+    def _maybe_reopened(self) -> None:
+        """Get the dialog ready to be used again if it's being reopened."""
+        if self._dismissed:
+            self._dismissed = False
+            self._reopened()
+
     def _set_error(self, message: str = "") -> None:
         """Set or clear the error message.
 
@@ -182,11 +347,41 @@ class FileSystemPickerScreen(ModalScreen[Path | None]):
         """Clear any error that might be showing."""
         self._set_error()
 
+    @on(DirectoryNavigation.Changed)
+    def _clear_narrowing(self) -> None:
+        """Clear any narrowing of the display when the directory changes."""
+        self.query_one(NarrowingInput).value = ""
+
+    @on(Input.Changed, "NarrowingInput")
+    def _narrow(self, event: Input.Changed) -> None:
+        """Narrow the display as the user types.
+
+        Args:
+            event: The event to handle.
+        """
+        event.stop()
+        self.query_one(DirectoryNavigation).narrow = event.value
+
+    @on(Input.Submitted, "NarrowingInput")
+    def _narrowed(self, event: Input.Submitted) -> None:
+        """Move to the display once the user has finished narrowing it.
+
+        Args:
+            event: The event to handle.
+        """
+        event.stop()
+        self.query_one(DirectoryNavigation).focus()
+
     @on(DirectoryNavigation.PermissionError)
     def _show_permission_error(self) -> None:
         """Show any permission error bubbled up from the directory navigator."""
         self._set_error(self.ERROR_PERMISSION_ERROR)
 
+    @on(DirectoryNavigation.LinkLoop)
+    def _show_link_loop_error(self) -> None:
+        """Show any link loop error bubbled up from the directory navigator."""
+        self._set_error(self.ERROR_LINK_LOOP)
+
     @on(Button.Pressed, "#cancel")
     def _cancel(self, event: Button.Pressed) -> None:
         """Cancel the dialog.
@@ -201,5 +396,124 @@ class FileSystemPickerScreen(ModalScreen[Path | None]):
         """Action for toggling the display of hidden entries."""
         self.query_one(DirectoryNavigation).toggle_hidden()
 
+    def _action_sort(self) -> None:
+        """Action for switching to the next sort mode."""
+        navigation = self.query_one(DirectoryNavigation)
+        navigation.cycle_sort_mode()
+        self.notify(navigation.sort_mode.label, title="Sorting by")
+
+    def _action_reverse_sort(self) -> None:
+        """Action for reversing the direction of the sort."""
+        self.query_one(DirectoryNavigation).toggle_sort_reverse()
+
+    def _action_measure(self) -> None:
+        """Action for toggling working out the total size of directories."""
+        navigation = self.query_one(DirectoryNavigation)
+        navigation.toggle_measure_directories()
+        self.notify(
+            "On" if navigation.measure_directories else "Off",
+            title="Directory sizes",
+        )
+
+    def _action_flat(self) -> None:
+        """Action for toggling the flat view of the current directory."""
+        navigation = self.query_one(DirectoryNavigation)
+        navigation.toggle_flat_view()
+        self.notify("On" if navigation.flat_view else "Off", title="Flat view")
+
+    @property
+    def _searching(self) -> bool:
+        """Is the dialog searching below the current directory?"""
+        return self.query_one(Dialog).has_class("-searching")
+
+    def _start_search(self) -> None:
+        """Switch the dialog to searching below the current directory."""
+        if self._filename_index is not None:
+            self._filename_index.update_in_background()
+        self.query_one(Dialog).add_class("-searching")
+        self.query_one(SearchInput).focus()
+
+    def _end_search(self) -> None:
+        """Switch the dialog back from searching to navigating."""
+        self.query_one(SearchResults).cancel()
+        self.query_one(SearchResults).clear_options()
+        self.query_one(SearchInput).value = ""
+        self.query_one(Dialog).remove_class("-searching")
+        self.query_one(DirectoryNavigation).focus()
+
+    @on(Input.Changed, "SearchInput")
+    def _search(self, event: Input.Changed) -> None:
+        """Search below the current directory as the user types.
+
+        Args:
+            event: The event to handle.
+        """
+        event.stop()
+        navigation = self.query_one(DirectoryNavigation)
+        self.query_one(SearchResults).search(
+            navigation.location,
+            event.value,
+            include_hidden=navigation.show_hidden,
+            directories_only=not navigation.show_files,
+            ignore_rules=self._ignore_rules,
+            file_filter=navigation.file_filter,
+            filename_index=self._filename_index,
+        )
+
+    @on(Input.Submitted, "SearchInput")
+    def _searched(self, event: Input.Submitted) -> None:
+        """Move to the search results once the user has finished typing.
+
+        Args:
+            event: The event to handle.
+        """
+        event.stop()
+        self.query_one(SearchResults).focus()
+
+    @on(SearchResults.Selected)
+    def _search_result_selected(self, event: SearchResults.Selected) -> None:
+        """Handle a search result being selected.
+
+        Args:
+            event: The event to handle.
+
+        A directory that is selected is navigated to; a file that is
+        selected is treated as if it had been selected in the directory
+        it was found in.
+        """
+        event.stop()
+        self._end_search()
+        navigation = self.query_one(DirectoryNavigation)
+        if event.is_dir:
+            navigation.location = event.path
+        else:
+            navigation.location = event.path.parent
+            navigation.post_message(
+                DirectoryNavigation.Selected(navigation, event.path)
+            )
+
+    def _action_search(self) -> None:
+        """Action for starting or ending a search below the current directory."""
+        if self._searching:
+            self._end_search()
+        else:
+            self._start_search()
+
+    def _action_escape(self) -> None:
+        """Action for backing out of a search, or out of the dialog."""
+        if self._searching:
+            self._end_search()
+        else:
+            self.dismiss(None)
+
+    def _action_narrow(self) -> None:
+        """Action for showing or hiding the input for narrowing the display."""
+        narrowing = self.query_one(NarrowingInput)
+        if narrowing.toggle_class("-active").has_class("-active"):
+            narrowing.focus()
+        else:
+            narrowing.value = ""
+            self.query_one(DirectoryNavigation).focus()
+
 
 ### base_dialog.py ends here
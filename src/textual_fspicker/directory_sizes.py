@@ -0,0 +1,249 @@
+"""Support code for working out the total size of the content of directories.
+
+The size that the filesystem reports for a directory says nothing about how
+much is in it. This module provides a sizer that walks the tree below
+directories, in a pool of worker threads, adding up the sizes of everything
+within; the results are cached so that a directory need only be walked
+again once it has changed.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from os import scandir, stat
+from pathlib import Path, PosixPath, WindowsPath
+from stat import S_ISDIR
+from threading import Lock
+from typing import Final, NamedTuple, TypeAlias
+
+##############################################################################
+# Local imports.
+from .archives import ArchivePath
+
+##############################################################################
+DEFAULT_CACHE_SIZE: Final[int] = 10_000
+"""The default number of directory sizes to keep in the cache."""
+
+DEFAULT_WORKERS: Final[int] = 4
+"""The default number of workers to use to size directories."""
+
+CANCEL_CHECK_INTERVAL: Final[int] = 1_000
+"""How many entries to look at between checks for cancellation."""
+
+
+##############################################################################
+class DirectorySize(NamedTuple):
+    """The total size of the content of a directory."""
+
+    size: int
+    """The total size, in bytes, of everything below the directory."""
+
+    items: int
+    """The number of entries below the directory."""
+
+
+##############################################################################
+_CacheKey: TypeAlias = tuple[int, int, int]
+"""The type of a key in the size cache."""
+
+
+##############################################################################
+class DirectorySizer:
+    """Works out the size of directories in a pool of workers, caching the results."""
+
+    def __init__(
+        self, cache_size: int = DEFAULT_CACHE_SIZE, workers: int = DEFAULT_WORKERS
+    ) -> None:
+        """Initialise the sizer.
+
+        Args:
+            cache_size: The maximum number of sizes to keep in the cache.
+            workers: The maximum number of workers to size directories with.
+        """
+        self._cache_size = cache_size
+        """The maximum number of sizes to keep in the cache."""
+        self._workers = workers
+        """The maximum number of workers to size directories with."""
+        self._sizes: dict[_CacheKey, DirectorySize] = {}
+        """The cache of sizes."""
+        self._lock = Lock()
+        """Lock for updating the cache."""
+        self._pool: ThreadPoolExecutor | None = None
+        """The pool of workers, created when first needed."""
+
+    @staticmethod
+    def _key(directory: Path) -> _CacheKey | None:
+        """Get the cache key for a directory.
+
+        Args:
+            directory: The directory to get the key for.
+
+        Returns:
+            The key for the cache, or `None` if the location isn't a
+                directory on the local filesystem that can be looked at.
+
+        Note:
+            The key is made from the device, inode and modification time of
+            the directory, so a directory is sized again once entries are
+            added to or removed from it, or once it is replaced; changes
+            deeper down the tree aren't noticed until then.
+        """
+        # Only directories on the local filesystem can be walked; anywhere
+        # else, including inside an archive, would need a call for every
+        # entry below the directory.
+        if not isinstance(directory, (PosixPath, WindowsPath)) or (
+            isinstance(directory, ArchivePath) and directory.archive is not None
+        ):
+            return None
+        try:
+            details = stat(directory)
+        except OSError:
+            return None
+        if not S_ISDIR(details.st_mode):
+            return None
+        return (details.st_dev, details.st_ino, details.st_mtime_ns)
+
+    def _remember(self, key: _CacheKey, size: DirectorySize) -> None:
+        """Remember the size of a directory.
+
+        Args:
+            key: The cache key for the directory.
+            size: The size of the directory.
+        """
+        with self._lock:
+            while self._sizes and len(self._sizes) >= self._cache_size:
+                del self._sizes[next(iter(self._sizes))]
+            self._sizes[key] = size
+
+    @staticmethod
+    def _walk(
+        directory: Path, is_cancelled: Callable[[], bool]
+    ) -> DirectorySize | None:
+        """Walk the tree below a directory, adding up the size of its content.
+
+        Args:
+            directory: The directory to walk.
+            is_cancelled: A function that says if the walk has been
+                cancelled.
+
+        Returns:
+            The size of the directory, or `None` if the walk was cancelled.
+
+        As with `du -x`, the walk stays on the device the directory is on,
+        so that measuring a directory with filesystems mounted below it
+        (`/`, say) doesn't wander into `/proc`, or across the network. Also
+        like `du`, a file with more than one hard link within the tree is
+        only counted once.
+        """
+        size = items = 0
+        linked: set[tuple[int, int]] = set()
+        try:
+            device = stat(directory).st_dev
+        except OSError:
+            return DirectorySize(size, items)
+        waiting = [str(directory)]
+        while waiting:
+            try:
+                with scandir(waiting.pop()) as entries:
+                    for entry in entries:
+                        items += 1
+                        if not items % CANCEL_CHECK_INTERVAL and is_cancelled():
+                            return None
+                        try:
+                            # Links aren't followed, so that a link that
+                            # loops can't send the walk round in circles, and
+                            # so that nothing is counted twice.
+                            if entry.is_dir(follow_symlinks=False):
+                                # Where the device isn't known, which is
+                                # the case on Windows, it's taken to be the
+                                # same one.
+                                if (
+                                    on := entry.stat(follow_symlinks=False).st_dev
+                                ) == device or not on:
+                                    waiting.append(entry.path)
+                            else:
+                                details = entry.stat(follow_symlinks=False)
+                                if details.st_nlink > 1:
+                                    if (
+                                        inode := (details.st_dev, details.st_ino)
+                                    ) in linked:
+                                        continue
+                                    linked.add(inode)
+                                size += details.st_size
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+        return DirectorySize(size, items)
+
+    def _size(
+        self, directory: Path, is_cancelled: Callable[[], bool]
+    ) -> DirectorySize | None:
+        """Size a directory, using the cache if possible.
+
+        Args:
+            directory: The directory to size.
+            is_cancelled: A function that says if the sizing has been
+                cancelled.
+
+        Returns:
+            The size of the directory, or `None` if it couldn't be sized.
+        """
+        if (key := self._key(directory)) is None:
+            return None
+        if (size := self._sizes.get(key)) is None and (
+            size := self._walk(directory, is_cancelled)
+        ) is not None:
+            self._remember(key, size)
+        return size
+
+    def measure(
+        self,
+        directories: Iterable[Path],
+        is_cancelled: Callable[[], bool] = lambda: False,
+    ) -> Iterator[tuple[Path, DirectorySize]]:
+        """Work out the size of a collection of directories.
+
+        Args:
+            directories: The directories to size.
+            is_cancelled: A function that says if the sizing has been
+                cancelled.
+
+        Yields:
+            Each directory along with its size, in the order in which the
+                sizes became available.
+
+        Directories that can't be looked at are skipped.
+        """
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    self._workers, thread_name_prefix="fspicker-size"
+                )
+            pool = self._pool
+        pending: dict[Future[DirectorySize | None], Path] = {
+            pool.submit(self._size, directory, is_cancelled): directory
+            for directory in directories
+        }
+        try:
+            for done in as_completed(pending):
+                if is_cancelled():
+                    return
+                if (size := done.result()) is not None:
+                    yield pending[done], size
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def clear(self) -> None:
+        """Clear the cache of sizes."""
+        with self._lock:
+            self._sizes.clear()
+
+
+### directory_sizes.py ends here
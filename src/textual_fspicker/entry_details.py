@@ -0,0 +1,123 @@
+"""Provides a record of the details of an entry in the filesystem.
+
+When a directory is loaded, everything the library needs to know about each
+entry within it is gathered up in one go, and kept in an
+[`EntryDetails`][textual_fspicker.entry_details.EntryDetails] record. This
+means that the display, sorting and filtering of the entries can all be
+done without going back to the filesystem again.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from os import DirEntry
+from pathlib import Path
+from stat import S_ISDIR, S_ISLNK, S_ISREG
+from typing import NamedTuple
+
+
+##############################################################################
+class EntryDetails(NamedTuple):
+    """The details of an entry in the filesystem."""
+
+    location: Path
+    """The location of the entry."""
+
+    name: str
+    """The name of the entry."""
+
+    is_dir: bool
+    """Is the entry a directory?"""
+
+    is_file: bool
+    """Is the entry a file?
+
+    Note:
+        As with [`safe_tests.is_file`][textual_fspicker.safe_tests.is_file],
+        an entry that can't be looked at because of a permission problem is
+        taken to be a file.
+    """
+
+    is_link: bool
+    """Is the entry a symbolic link?"""
+
+    size: int
+    """The size of the entry."""
+
+    mtime: float
+    """The modification time of the entry."""
+
+    @classmethod
+    def of(cls, location: Path) -> EntryDetails:
+        """Gather the details of the given location.
+
+        Args:
+            location: The location to gather the details of.
+
+        Returns:
+            The details of the location.
+
+        This will look at the location with, at most, two calls to the
+        filesystem: one to look at the entry itself, and one more to look
+        at its target if it is a symbolic link.
+        """
+        is_link = False
+        try:
+            try:
+                details = location.lstat()
+            except NotImplementedError:
+                details = location.stat()
+            if is_link := S_ISLNK(details.st_mode):
+                details = location.stat()
+        except PermissionError:
+            return cls(location, location.name, False, True, is_link, 0, 0.0)
+        except OSError:
+            return cls(location, location.name, False, False, is_link, 0, 0.0)
+        return cls(
+            location,
+            location.name,
+            S_ISDIR(details.st_mode),
+            S_ISREG(details.st_mode),
+            is_link,
+            details.st_size,
+            details.st_mtime,
+        )
+
+    @classmethod
+    def scanned(cls, location: Path, entry: DirEntry[str]) -> EntryDetails:
+        """Gather the details of a location found by scanning its directory.
+
+        Args:
+            location: The location to gather the details of.
+            entry: The entry for the location, from [`os.scandir`][os.scandir].
+
+        Returns:
+            The details of the location.
+
+        This makes use of what the scan of the directory already knows
+        about the entry; depending on the operating system that can mean
+        the entry doesn't need to be looked at again at all.
+        """
+        is_link = False
+        try:
+            is_link = entry.is_symlink()
+            details = entry.stat()
+        except PermissionError:
+            return cls(location, entry.name, False, True, is_link, 0, 0.0)
+        except OSError:
+            return cls(location, entry.name, False, False, is_link, 0, 0.0)
+        return cls(
+            location,
+            entry.name,
+            S_ISDIR(details.st_mode),
+            S_ISREG(details.st_mode),
+            is_link,
+            details.st_size,
+            details.st_mtime,
+        )
+
+
+### entry_details.py ends here
@@ -7,18 +7,33 @@ from __future__ import annotations
 ##############################################################################
 # Python imports.
 import sys
-from pathlib import Path
+from asyncio import TimeoutError as AsyncTimeoutError
+from asyncio import to_thread, wait_for
+from pathlib import Path, PosixPath, WindowsPath
+from typing import cast
 
 ##############################################################################
 # Textual imports.
-from textual import on
+from textual import on, work
 from textual.app import ComposeResult
 from textual.events import Mount
 from textual.widgets import Button, Input, Select
 
 ##############################################################################
 # Local imports.
-from .base_dialog import ButtonLabel, FileSystemPickerScreen
+from .archives import ArchivePath
+from .base_dialog import (
+    ButtonLabel,
+    Dialog,
+    FileSystemPickerScreen,
+    InputBar,
+    PickerResult,
+)
+from .entry_details import EntryDetails
+from .filename_index import FilenameIndex
+from .ignore_rules import IgnoreRules
+from .listing_backends import AsyncListingBackend, ListingBackend
+from .listing_cache import ListingCache
 from .parts import CurrentDirectory, DirectoryNavigation, DriveNavigation
 from .path_filters import Filters
 from .path_maker import MakePath
@@ -36,10 +51,15 @@ class FileFilter(Select[int]):
 
 
 ##############################################################################
-class BaseFileDialog(FileSystemPickerScreen):
+class BaseFileDialog(FileSystemPickerScreen[PickerResult]):
     """The base dialog for file-oriented picking dialogs."""
 
     DEFAULT_CSS = """
+    BaseFileDialog Dialog.-confirming {
+        border-subtitle-color: $text-muted;
+        border-subtitle-background: $panel;
+    }
+
     BaseFileDialog InputBar {
         Input {
             width: 2fr;
@@ -53,6 +73,15 @@ class BaseFileDialog(FileSystemPickerScreen):
     ERROR_A_FILE_MUST_BE_CHOSEN = "A file must be chosen"
     """An error to show the user when a file should be chosen."""
 
+    ERROR_CONFIRM_TIMED_OUT = "Timed out checking the file"
+    """An error to show the user when checking the chosen file takes too long."""
+
+    CONFIRMING = "Checking..."
+    """The message to show while the chosen file is being checked."""
+
+    CONFIRM_TIMEOUT = 10.0
+    """How long, in seconds, to wait for the chosen file to be checked."""
+
     def __init__(
         self,
         location: str | Path = ".",
@@ -64,6 +93,10 @@ class BaseFileDialog(FileSystemPickerScreen):
         default_file: str | Path | None = None,
         double_click_directories: bool = True,
         suggest_completions: bool = True,
+        ignore_rules: IgnoreRules | None = None,
+        filename_index: FilenameIndex | None = None,
+        listing_cache: ListingCache | None = None,
+        listing_backend: ListingBackend | AsyncListingBackend | None = None,
     ) -> None:
         """Initialise the base dialog.
 
@@ -76,6 +109,10 @@ class BaseFileDialog(FileSystemPickerScreen):
             default_file: The default filename to place in the input.
             double_click_directories: Double click to open directories.
             suggest_completions: Should the `Input` suggest completions?
+            ignore_rules: Optional rules for entries that should be ignored.
+            filename_index: Optional index to search below the current directory.
+            listing_cache: Optional cache of listings to show while loading.
+            listing_backend: Optional backend to list directories with.
         """
         super().__init__(
             location,
@@ -83,6 +120,10 @@ class BaseFileDialog(FileSystemPickerScreen):
             select_button=select_button,
             cancel_button=cancel_button,
             double_click_directories=double_click_directories,
+            ignore_rules=ignore_rules,
+            filename_index=filename_index,
+            listing_cache=listing_cache,
+            listing_backend=listing_backend,
         )
         self._filters = filters
         """The filters for the dialog."""
@@ -90,25 +131,86 @@ class BaseFileDialog(FileSystemPickerScreen):
         """The default filename to put in the input field."""
         self._suggest_path = SuggestPath() if suggest_completions else None
         """The object that suggests paths in the input field."""
+        self._chosen_details: EntryDetails | None = None
+        """The details of the chosen file, as looked up when it was chosen."""
+        self._confirming = False
+        """Is the chosen file being checked?"""
+        self._refilter = False
+        """Should the filters be put back in place when the dialog is reopened?"""
 
     def _header_area(self) -> ComposeResult:
         """Populate the header area with the current directory path."""
         yield CurrentDirectory()
 
+    @staticmethod
+    def _file_filter(filters: Filters) -> FileFilter:
+        """Make the widget for picking from the filters.
+
+        Args:
+            filters: The filters to pick from.
+
+        Returns:
+            The filter picking widget.
+        """
+        return FileFilter(
+            filters.selections, prompt="File filter", value=0, allow_blank=False
+        )
+
     def _input_bar(self) -> ComposeResult:
         """Provide any widgets for the input before, before the buttons."""
         yield Input(Path(self._default_file or "").name, suggester=self._suggest_path)
         if self._filters:
-            yield FileFilter(
-                self._filters.selections,
-                prompt="File filter",
-                value=0,
-                allow_blank=False,
+            yield self._file_filter(self._filters)
+
+    def reopen(
+        self,
+        *,
+        location: str | Path | None = None,
+        title: str | None = None,
+        filters: Filters | None = None,
+        default_file: str | Path | None = None,
+    ) -> None:
+        """Make changes to the dialog before it is next opened.
+
+        Args:
+            location: Optional new location for the dialog to show.
+            title: Optional new title for the dialog.
+            filters: Optional new filters to show in the dialog.
+            default_file: Optional new default filename to place in the input.
+
+        To remove the filters from the dialog, pass an empty
+        [`Filters`][textual_fspicker.path_filters.Filters].
+        """
+        super().reopen(location=location, title=title)
+        if filters is not None:
+            self._filters = filters
+            self._refilter = True
+        if default_file is not None:
+            self._default_file = default_file
+
+    def _reopened(self) -> None:
+        """Get the dialog ready to be used again, after it has been reopened."""
+        super()._reopened()
+        self._set_confirming(False)
+        self._chosen_details = None
+        self.query_one("InputBar Input", Input).value = Path(
+            self._default_file or ""
+        ).name
+        if self._refilter:
+            self._refilter = False
+            self.query(FileFilter).remove()
+            if self._filters:
+                self.query_one(InputBar).mount(
+                    self._file_filter(self._filters), after="InputBar Input"
+                )
+            self.query_one(DirectoryNavigation).file_filter = (
+                self._filters[0] if self._filters else None
             )
 
     @on(Mount)
     def _initial_filter(self) -> None:
         """Set the initial filter once the DOM is ready."""
+        self._refilter = False
         if self._filters:
             self.query_one(DirectoryNavigation).file_filter = self._filters[0]
 
@@ -121,6 +223,9 @@ class BaseFileDialog(FileSystemPickerScreen):
         )
         if self._suggest_path is not None:
             self._suggest_path.root = location
+            self._suggest_path.listing_backend = self.query_one(
+                DirectoryNavigation
+            ).listing_backend
 
     @on(DirectoryNavigation.Selected)
     def _select_file(self, event: DirectoryNavigation.Selected) -> None:
@@ -129,8 +234,15 @@ class BaseFileDialog(FileSystemPickerScreen):
         Args:
             event: The event to handle.
         """
-        file_name = self.query_one(Input)
-        file_name.value = str(event.path.name)
+        file_name = self.query_one("InputBar Input", Input)
+        # In a flat view the file could be below the current directory, so
+        # it's named relative to that.
+        try:
+            file_name.value = str(
+                event.path.relative_to(self.query_one(DirectoryNavigation).location)
+            )
+        except ValueError:
+            file_name.value = str(event.path.name)
         file_name.focus()
 
     @on(Input.Changed)
@@ -168,7 +280,125 @@ class BaseFileDialog(FileSystemPickerScreen):
         del candidate
         return True
 
-    @on(Input.Submitted)
+    def _nothing_chosen(self) -> None:
+        """Handle the user confirming without having typed a file name."""
+        self._set_error(self.ERROR_A_FILE_MUST_BE_CHOSEN)
+
+    def _return(self, chosen: Path) -> None:
+        """Hand the chosen file back to the caller.
+
+        Args:
+            chosen: The file that was chosen, and that passed the final
+                checks.
+
+        By default the file itself is what the dialog hands back; a dialog
+        that hands back something else should override this.
+        """
+        self.dismiss(result=cast(PickerResult, chosen))
+
+    def _exists(self, candidate: Path) -> bool:
+        """Does the chosen file exist?
+
+        Args:
+            candidate: The file to check.
+
+        Returns:
+            `True` if the file exists, `False` if not.
+
+        What was found when the file was looked up as it was chosen is used,
+        rather than going back to the filesystem.
+        """
+        if (details := self._chosen_details) is not None and (
+            details.location == candidate
+        ):
+            return details.is_dir or details.is_file or details.is_link
+        return candidate.exists()
+
+    @staticmethod
+    def _chosen_path(value: str, location: Path, browse_archives: bool) -> Path:
+        """Work out the path of the file the user typed in.
+
+        Args:
+            value: The value the user typed in.
+            location: The location the dialog is currently looking at.
+            browse_archives: Are archives being browsed?
+
+        Returns:
+            The path of the chosen file.
+
+        Raises:
+            RuntimeError: If a home directory couldn't be worked out.
+        """
+        # If it looks like the user is typing in some sort of home
+        # directory path... (does pathlib let me test for this, or at
+        # least ask what the home character is? Docs don't mention this;
+        # so for now I'm going to hard-code this). If it is, let's simply
+        # expand and go with that; otherwise combine with the location of
+        # the directory navigator widget.
+        chosen = (
+            MakePath.of(value).expanduser()
+            if value.startswith("~")
+            else (location / value).resolve()
+        )
+
+        # If archives are being browsed, the chosen file could be inside
+        # of one.
+        if browse_archives and isinstance(chosen, (PosixPath, WindowsPath)):
+            chosen = ArchivePath(chosen)
+
+        return chosen
+
+    @staticmethod
+    def _details_of(chosen: Path) -> EntryDetails:
+        """Look up the details of the chosen file.
+
+        Args:
+            chosen: The file to look up.
+
+        Returns:
+            The details of the file.
+
+        Raises:
+            PermissionError: If the file couldn't be looked at.
+        """
+        # Asking if it's a directory first means that a problem with
+        # permissions is reported as such, rather than the file being taken
+        # to be a file that exists.
+        chosen.is_dir()
+        return EntryDetails.of(chosen)
+
+    async def _look_up(self, value: str) -> tuple[Path, EntryDetails]:
+        """Look up the file the user typed in.
+
+        Args:
+            value: The value the user typed in.
+
+        Returns:
+            The path of the chosen file, and its details.
+        """
+        navigation = self.query_one(DirectoryNavigation)
+        chosen = await to_thread(
+            self._chosen_path, value, navigation.location, navigation.browse_archives
+        )
+        # If the navigation is listing with an async backend, look the
+        # chosen file up with that, on the event loop; otherwise go to the
+        # filesystem in a thread.
+        if navigation.is_async:
+            return chosen, await navigation.details_of(chosen)
+        return chosen, await to_thread(self._details_of, chosen)
+
+    def _set_confirming(self, confirming: bool) -> None:
+        """Set or clear the display of the chosen file being checked.
+
+        Args:
+            confirming: Is the chosen file being checked?
+        """
+        self._confirming = confirming
+        self.query_one(Dialog).set_class(confirming, "-confirming")
+        self.query_one("#select", Button).disabled = confirming
+        self._set_error(self.CONFIRMING if confirming else "")
+
+    @on(Input.Submitted, "InputBar Input")
     @on(Button.Pressed, "#select")
     def _confirm_file(self, event: Input.Submitted | Button.Pressed) -> None:
         """Confirm the selection of the file in the input box.
@@ -177,50 +407,63 @@ class BaseFileDialog(FileSystemPickerScreen):
             event: The event to handle.
         """
         event.stop()
-        file_name = self.query_one(Input)
+
+        # If the last file chosen is still being checked, don't start
+        # checking it all over again.
+        if self._confirming:
+            return
 
         # Only even try and process this if there's some input.
-        if not file_name.value:
-            self._set_error(self.ERROR_A_FILE_MUST_BE_CHOSEN)
+        if not (value := self.query_one("InputBar Input", Input).value):
+            self._nothing_chosen()
             return
 
-        # If it looks like the user is typing in some sort of home
-        # directory path... (does pathlib let me test for this, or at
-        # least ask what the home character is? Docs don't mention this;
-        # so for now I'm going to hard-code this).
-        if file_name.value.startswith("~"):
-            # ...let's simply expand and go with that.
-            try:
-                chosen = MakePath.of(file_name.value).expanduser()
-            except RuntimeError as error:
-                self._set_error(str(error))
-                return
+        self._check_file(value)
+
+    @work(exclusive=True, group="confirm")
+    async def _check_file(self, value: str) -> None:
+        """Check the file the user typed in, and act on it.
+
+        Args:
+            value: The value the user typed in.
+
+        Looking at the chosen file means going to the filesystem, which
+        could be slow or even hang; so it is looked at away from the UI,
+        and is given up on if it takes longer than
+        [`CONFIRM_TIMEOUT`][textual_fspicker.file_dialog.BaseFileDialog.CONFIRM_TIMEOUT].
+        """
+        self._set_confirming(True)
+        try:
+            chosen, details = await wait_for(self._look_up(value), self.CONFIRM_TIMEOUT)
+        except AsyncTimeoutError:
+            error = self.ERROR_CONFIRM_TIMED_OUT
+        except PermissionError:
+            error = self.ERROR_PERMISSION_ERROR
+        except RuntimeError as problem:
+            error = str(problem)
         else:
-            # It's not a home directory path, so let's combine with the
-            # location of the directory navigator widget.
-            chosen = (
-                self.query_one(DirectoryNavigation).location / file_name.value
-            ).resolve()
+            error = ""
+        self._set_confirming(False)
+        if error:
+            self._set_error(error)
+            return
+        self._chosen_details = details
 
         # If it's a directory, approach it like it's the user simply
         # doing a "cd".
-        try:
-            if chosen.is_dir():
-                if sys.platform == "win32":
-                    if drive := MakePath.of(file_name.value).drive:
-                        self.query_one(DriveNavigation).drive = drive
-                self.query_one(DirectoryNavigation).location = chosen
-                self.query_one(DirectoryNavigation).focus()
-                self.query_one(Input).value = ""
-                return
-        except PermissionError:
-            self._set_error(self.ERROR_PERMISSION_ERROR)
+        if details.is_dir:
+            if sys.platform == "win32":
+                if drive := MakePath.of(value).drive:
+                    self.query_one(DriveNavigation).drive = drive
+            self.query_one(DirectoryNavigation).location = chosen
+            self.query_one(DirectoryNavigation).focus()
+            self.query_one("InputBar Input", Input).value = ""
             return
 
         # If the chosen file passes the final tests...
         if self._should_return(chosen):
             # ...return it.
-            self.dismiss(result=chosen)
+            self._return(chosen)
 
 
 ### file_dialog.py ends here
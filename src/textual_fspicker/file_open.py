@@ -8,16 +8,33 @@ from __future__ import annotations
 # Python imports.
 from pathlib import Path
 
+##############################################################################
+# Textual imports.
+from textual import on
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.events import Mount
+
 ##############################################################################
 # Local imports.
-from .base_dialog import ButtonLabel
+from .base_dialog import ButtonLabel, PickerResult
 from .file_dialog import BaseFileDialog
+from .filename_index import FilenameIndex
+from .ignore_rules import IgnoreRules
+from .listing_backends import AsyncListingBackend, ListingBackend
+from .listing_cache import ListingCache
+from .parts import DirectoryNavigation, FilePreview
 from .path_filters import Filters
 
 
 ##############################################################################
-class FileOpen(BaseFileDialog):
-    """A file opening dialog."""
+class BaseFileOpen(BaseFileDialog[PickerResult]):
+    """The base dialog for file opening dialogs."""
+
+    BINDINGS = [
+        Binding("ctrl+g", "search"),
+    ]
+    """The bindings for the dialog."""
 
     ERROR_A_FILE_MUST_EXIST = "The file must exist"
     """An error to show a user when a file must exist."""
@@ -34,8 +51,14 @@ class FileOpen(BaseFileDialog):
         default_file: str | Path | None = None,
         double_click_directories: bool = True,
         suggest_completions: bool = True,
+        ignore_rules: IgnoreRules | None = None,
+        filename_index: FilenameIndex | None = None,
+        listing_cache: ListingCache | None = None,
+        listing_backend: ListingBackend | AsyncListingBackend | None = None,
+        browse_archives: bool = False,
+        preview: bool = False,
     ) -> None:
-        """Initialise the `FileOpen` dialog.
+        """Initialise the file opening dialog.
 
         Args:
             location: Optional starting location.
@@ -47,6 +70,12 @@ class FileOpen(BaseFileDialog):
             default_file: The default filename to place in the input.
             double_click_directories: Double click to open directories.
             suggest_completions: Should the `Input` suggest completions?
+            ignore_rules: Optional rules for entries that should be ignored.
+            filename_index: Optional index to search below the current directory.
+            listing_cache: Optional cache of listings to show while loading.
+            listing_backend: Optional backend to list directories with.
+            browse_archives: Should zip and tar archives be browsed?
+            preview: Should the start of the highlighted file be previewed?
 
         Notes:
             `open_button` and `cancel_button` can either be strings that
@@ -62,9 +91,49 @@ class FileOpen(BaseFileDialog):
             default_file=default_file,
             double_click_directories=double_click_directories,
             suggest_completions=suggest_completions,
+            ignore_rules=ignore_rules,
+            filename_index=filename_index,
+            listing_cache=listing_cache,
+            listing_backend=listing_backend,
         )
         self._must_exist = must_exist
         """Must the file exist?"""
+        self._browse_archives = browse_archives
+        """Should zip and tar archives be browsed?"""
+        self._preview = preview
+        """Should the start of the highlighted file be previewed?"""
+
+    @on(Mount)
+    def _initial_browse_archives(self) -> None:
+        """Set up the browsing of archives once the DOM is ready."""
+        self.query_one(DirectoryNavigation).browse_archives = self._browse_archives
+
+    def _side_area(self) -> ComposeResult:
+        """Provide the preview beside the navigation, if it's wanted."""
+        if self._preview:
+            yield FilePreview()
+
+    def _reopened(self) -> None:
+        """Get the dialog ready to be used again, after it has been reopened."""
+        super()._reopened()
+        if self._preview:
+            self.query_one(FilePreview).resume()
+
+    @on(DirectoryNavigation.Highlighted)
+    def _preview_highlighted(self, event: DirectoryNavigation.Highlighted) -> None:
+        """Preview the highlighted file, if previewing.
+
+        Args:
+            event: The event to handle.
+        """
+        if self._preview:
+            self.query_one(FilePreview).preview(event.path)
+
+    @on(DirectoryNavigation.Changed)
+    def _clear_preview(self) -> None:
+        """Clear the preview when the directory changes."""
+        if self._preview:
+            self.query_one(FilePreview).preview(None)
 
     def _should_return(self, candidate: Path) -> bool:
         """Perform the final checks on the chosen file.
@@ -72,10 +141,15 @@ class FileOpen(BaseFileDialog):
         Args:
             candidate: The file to check.
         """
-        if self._must_exist and not candidate.exists():
+        if self._must_exist and not self._exists(candidate):
             self._set_error(self.ERROR_A_FILE_MUST_EXIST)
             return False
         return True
 
 
+##############################################################################
+class FileOpen(BaseFileOpen[Path]):
+    """A file opening dialog."""
+
+
 ### file_open.py ends here
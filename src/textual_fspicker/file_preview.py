@@ -0,0 +1,200 @@
+"""Support code for previewing the start of a file.
+
+Only the head of a file is ever looked at: on the local filesystem the
+file is memory-mapped, with the mapping limited to the size of the preview,
+so that previewing a file that is many gigabytes in size costs no more than
+previewing a small one. The previews are cached against the location and
+modification time of each file.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from codecs import getincrementaldecoder
+from pathlib import Path, PosixPath, WindowsPath
+from stat import S_ISREG
+from threading import Lock
+from typing import Final, NamedTuple
+
+##############################################################################
+# Local imports.
+from .archives import ArchivePath
+
+##############################################################################
+DEFAULT_CACHE_SIZE: Final[int] = 256
+"""The default number of previews to keep in the cache."""
+
+DEFAULT_WINDOW: Final[int] = 8 * 1024
+"""The default number of bytes at the start of a file to preview."""
+
+HEX_DUMP_BYTES: Final[int] = 512
+"""The number of bytes to show in the hex dump of a binary file."""
+
+HEX_DUMP_WIDTH: Final[int] = 16
+"""The number of bytes to show on each line of a hex dump."""
+
+
+##############################################################################
+class Preview(NamedTuple):
+    """The preview of a file."""
+
+    content: str
+    """The content of the preview.
+
+    For a text file this is the start of the text; for a binary file it is
+    a hex dump of the start of the file.
+    """
+
+    binary: bool
+    """Does the file appear to be a binary file?"""
+
+    size: int
+    """The size of the whole file."""
+
+    truncated: bool
+    """Is the preview of only part of the file?"""
+
+
+##############################################################################
+def _hex_dump(data: bytes) -> str:
+    """Make a hex dump of some data.
+
+    Args:
+        data: The data to dump.
+
+    Returns:
+        The hex dump.
+    """
+    return "\n".join(
+        f"{offset:08x}  "
+        f"{line.hex(' '):<{HEX_DUMP_WIDTH * 3 - 1}}  "
+        f"{''.join(chr(byte) if 32 <= byte < 127 else '.' for byte in line)}"
+        for offset in range(0, len(data), HEX_DUMP_WIDTH)
+        for line in (data[offset : offset + HEX_DUMP_WIDTH],)
+    )
+
+
+##############################################################################
+def _as_text(data: bytes) -> str | None:
+    """Try and decode the start of a file as text.
+
+    Args:
+        data: The data from the start of the file.
+
+    Returns:
+        The text, or `None` if the data doesn't appear to be text.
+
+    Note:
+        The data could well end part-way through a character, so it is
+        decoded incrementally and anything left over at the end is ignored.
+    """
+    if b"\0" in data:
+        return None
+    try:
+        return getincrementaldecoder("utf-8")().decode(data, final=False)
+    except UnicodeDecodeError:
+        return None
+
+
+##############################################################################
+class FilePreviewer:
+    """Makes previews of the start of files, caching the results."""
+
+    def __init__(
+        self, cache_size: int = DEFAULT_CACHE_SIZE, window: int = DEFAULT_WINDOW
+    ) -> None:
+        """Initialise the previewer.
+
+        Args:
+            cache_size: The maximum number of previews to keep in the cache.
+            window: The number of bytes at the start of a file to preview.
+        """
+        self._cache_size = cache_size
+        """The maximum number of previews to keep in the cache."""
+        self.window = window
+        """The number of bytes at the start of a file to preview."""
+        self._previews: dict[tuple[Path, int], Preview] = {}
+        """The cache of previews."""
+        self._lock = Lock()
+        """Lock for updating the cache."""
+
+    def _head(self, location: Path, size: int) -> bytes:
+        """Read the head of a file.
+
+        Args:
+            location: The location of the file.
+            size: The size of the file.
+
+        Returns:
+            No more than the preview window's worth of data from the start
+                of the file.
+        """
+        length = min(size, self.window)
+        if isinstance(location, (PosixPath, WindowsPath)) and not isinstance(
+            location, ArchivePath
+        ):
+            from mmap import ACCESS_READ, mmap
+
+            with open(location, "rb") as file:
+                if not length:
+                    return b""
+                try:
+                    with mmap(file.fileno(), length, access=ACCESS_READ) as mapped:
+                        return mapped[:length]
+                except (OSError, ValueError):
+                    # Not every file can be mapped; those on some network
+                    # filesystems, for example. In that case fall back to a
+                    # bounded read.
+                    return file.read(length)
+        with location.open("rb") as file:
+            return file.read(length)
+
+    def preview(self, location: Path) -> Preview | None:
+        """Make a preview of a file.
+
+        Args:
+            location: The location of the file to preview.
+
+        Returns:
+            The preview of the file, or `None` if it isn't a regular file or
+                couldn't be read.
+        """
+        try:
+            details = location.stat()
+        except (OSError, NotImplementedError):
+            return None
+        # Only regular files are previewed; reading from something like a
+        # FIFO or a device could block or go on forever.
+        if not S_ISREG(details.st_mode):
+            return None
+        key = (location, details.st_mtime_ns)
+        if (preview := self._previews.get(key)) is not None:
+            return preview
+        try:
+            data = self._head(location, details.st_size)
+        except (OSError, NotImplementedError):
+            return None
+        text = _as_text(data)
+        preview = Preview(
+            _hex_dump(data[:HEX_DUMP_BYTES]) if text is None else text,
+            text is None,
+            details.st_size,
+            details.st_size > (len(data) if text is not None else HEX_DUMP_BYTES),
+        )
+        with self._lock:
+            self._previews.pop(key, None)
+            while len(self._previews) >= self._cache_size:
+                del self._previews[next(iter(self._previews))]
+            self._previews[key] = preview
+        return preview
+
+    def clear(self) -> None:
+        """Clear the cache of previews."""
+        with self._lock:
+            self._previews.clear()
+
+
+### file_preview.py ends here
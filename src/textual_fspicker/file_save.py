@@ -12,11 +12,14 @@ from pathlib import Path
 # Local imports.
 from .base_dialog import ButtonLabel
 from .file_dialog import BaseFileDialog
+from .ignore_rules import IgnoreRules
+from .listing_backends import AsyncListingBackend, ListingBackend
+from .listing_cache import ListingCache
 from .path_filters import Filters
 
 
 ##############################################################################
-class FileSave(BaseFileDialog):
+class FileSave(BaseFileDialog[Path]):
     """A file save dialog."""
 
     ERROR_OVERWRITE_IS_NOT_ALLOWED = "Overwrite is not allowed"
@@ -33,6 +36,9 @@ class FileSave(BaseFileDialog):
         can_overwrite: bool = True,
         default_file: str | Path | None = None,
         suggest_completions: bool = True,
+        ignore_rules: IgnoreRules | None = None,
+        listing_cache: ListingCache | None = None,
+        listing_backend: ListingBackend | AsyncListingBackend | None = None,
     ) -> None:
         """Initialise the `FileSave` dialog.
 
@@ -45,6 +51,9 @@ class FileSave(BaseFileDialog):
             can_overwrite: Flag to say if an existing file can be overwritten.
             default_file: The default filename to place in the input.
             suggest_completions: Should the `Input` suggest completions?
+            ignore_rules: Optional rules for entries that should be ignored.
+            listing_cache: Optional cache of listings to show while loading.
+            listing_backend: Optional backend to list directories with.
 
         Notes:
             `open_button` and `cancel_button` can either be strings that
@@ -59,6 +68,9 @@ class FileSave(BaseFileDialog):
             filters=filters,
             default_file=default_file,
             suggest_completions=suggest_completions,
+            ignore_rules=ignore_rules,
+            listing_cache=listing_cache,
+            listing_backend=listing_backend,
         )
         self._can_overwrite = can_overwrite
         """Can an existing file be overwritten?"""
@@ -73,7 +85,7 @@ class FileSave(BaseFileDialog):
             [`True`][True] if the file checks out okay, [`False`][False] if
             not.
         """
-        if candidate.exists() and not self._can_overwrite:
+        if self._exists(candidate) and not self._can_overwrite:
             self._set_error(self.ERROR_OVERWRITE_IS_NOT_ALLOWED)
             return False
         return True
@@ -0,0 +1,480 @@
+"""Provides a persistent index of the names of the entries below some directories.
+
+Walking a very large tree to find an entry, even with
+[a pool of processes][textual_fspicker.subtree_search.SubtreeSearch], can
+take a while. A [`FilenameIndex`][textual_fspicker.filename_index.FilenameIndex]
+keeps the names of everything below a chosen set of roots in an
+[SQLite](https://sqlite.org/) database, so that searching them is a matter
+of looking them up.
+
+The index is kept up to date in the same way as `locate` indexes are: the
+tree is walked again, but only the directories whose modification times
+have changed since the last walk are listed again.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import re
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import closing, contextmanager
+from os import scandir, sep, stat
+from os.path import join
+from pathlib import Path
+from threading import Lock, Thread
+from time import time
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    import sqlite3
+
+##############################################################################
+# Local imports.
+from .ignore_rules import IgnoreRules
+from .subtree_search import DEFAULT_MAX_RESULTS, SearchMatch
+from .user_cache import user_cache_directory
+
+##############################################################################
+DEFAULT_REFRESH_INTERVAL: Final[float] = 600.0
+"""The default time, in seconds, after which a root is updated again."""
+
+COMMIT_INTERVAL: Final[int] = 500
+"""How many directories to list between commits when updating the index."""
+
+_SCHEMA: Final[str] = """
+CREATE TABLE IF NOT EXISTS roots (
+    path    TEXT PRIMARY KEY,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS directories (
+    id       INTEGER PRIMARY KEY,
+    path     TEXT NOT NULL UNIQUE,
+    modified INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id        INTEGER PRIMARY KEY,
+    directory INTEGER NOT NULL,
+    name      TEXT NOT NULL,
+    folded    TEXT NOT NULL,
+    is_dir    INTEGER NOT NULL,
+    is_link   INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_by_name ON entries (folded);
+CREATE INDEX IF NOT EXISTS entries_by_directory ON entries (directory);
+"""
+"""The schema of the index."""
+
+_TRIGRAMS: Final[str] = """
+CREATE VIRTUAL TABLE IF NOT EXISTS trigrams USING fts5 (folded, tokenize = 'trigram')
+"""
+"""The table used to speed up substring searches, where SQLite supports it."""
+
+_PREFIX = re.compile(r"[^*?\[]+\*")
+"""Regular expression for spotting a glob that is really a prefix search."""
+
+
+##############################################################################
+class FilenameIndex:
+    """A persistent index of the names of the entries below some directories."""
+
+    def __init__(
+        self,
+        *roots: str | Path,
+        database: str | Path | None = None,
+        ignore_rules: IgnoreRules | None = None,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+    ) -> None:
+        """Initialise the index.
+
+        Args:
+            roots: The directories to index everything below.
+            database: The location of the database to keep the index in.
+            ignore_rules: Optional rules for entries to leave out of the index.
+            refresh_interval: The time, in seconds, after which a root
+                should be updated again.
+
+        If no database is given the index is kept in the user's cache
+        directory.
+
+        Example:
+            ```python
+            projects = FilenameIndex("~/projects", ignore_rules=IgnoreRules())
+            projects.update_in_background()
+            ```
+        """
+        self.roots = tuple(Path(root).expanduser().absolute() for root in roots)
+        """The directories to index everything below."""
+        self.database = (
+            user_cache_directory() / "filename-index.sqlite3"
+            if database is None
+            else Path(database)
+        )
+        """The location of the database the index is kept in."""
+        self._ignore_rules = ignore_rules
+        """The rules for entries to leave out of the index."""
+        self._refresh_interval = refresh_interval
+        """The time after which a root should be updated again."""
+        self._updater: Thread | None = None
+        """The thread updating the index in the background, if there is one."""
+        self._updater_lock = Lock()
+        """Lock for starting the background update."""
+        self._trigrams = False
+        """Is there a trigram table to speed up substring searches?"""
+        import sqlite3
+
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+            try:
+                connection.execute(_TRIGRAMS)
+                self._trigrams = True
+            except sqlite3.OperationalError:
+                pass
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection to the database.
+
+        Yields:
+            The connection, which is committed and closed when done with.
+
+        A connection is opened for each piece of work, so that the index
+        can be used from any thread.
+        """
+        import sqlite3
+
+        self.database.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.database, timeout=30)) as connection:
+            connection.execute("PRAGMA journal_mode = WAL")
+            with connection:
+                yield connection
+
+    @staticmethod
+    def _below(location: Path) -> tuple[str, str, str]:
+        """Get the values needed to look for paths at or below a location.
+
+        Args:
+            location: The location.
+
+        Returns:
+            The location itself, followed by the start and the end of the
+                range that every path below it falls within.
+        """
+        start = f"{str(location).rstrip(sep)}{sep}"
+        return str(location), start, f"{start[:-1]}{chr(ord(sep) + 1)}"
+
+    def _forget_entries(
+        self, connection: sqlite3.Connection, directories: Iterable[int]
+    ) -> None:
+        """Forget the entries of some directories.
+
+        Args:
+            connection: The connection to the database.
+            directories: The IDs of the directories.
+        """
+        for directory in directories:
+            if self._trigrams:
+                connection.execute(
+                    "DELETE FROM trigrams WHERE rowid IN "
+                    "(SELECT id FROM entries WHERE directory = ?)",
+                    (directory,),
+                )
+            connection.execute("DELETE FROM entries WHERE directory = ?", (directory,))
+
+    def _remember_entries(
+        self,
+        connection: sqlite3.Connection,
+        directory: int,
+        entries: list[tuple[str, bool, bool]],
+    ) -> None:
+        """Remember the entries of a directory.
+
+        Args:
+            connection: The connection to the database.
+            directory: The ID of the directory.
+            entries: The name of each entry, and if it's a directory and a link.
+        """
+        connection.executemany(
+            "INSERT INTO entries (directory, name, folded, is_dir, is_link) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                (directory, name, name.casefold(), is_dir, is_link)
+                for name, is_dir, is_link in entries
+            ),
+        )
+        if self._trigrams:
+            connection.execute(
+                "INSERT INTO trigrams (rowid, folded) "
+                "SELECT id, folded FROM entries WHERE directory = ?",
+                (directory,),
+            )
+
+    def _list(self, directory: str) -> list[tuple[str, bool, bool]] | None:
+        """List the entries of a directory.
+
+        Args:
+            directory: The directory to list.
+
+        Returns:
+            The name of each entry, and if it's a directory and a link, or
+                `None` if the directory couldn't be listed.
+        """
+        ignore = (
+            None
+            if self._ignore_rules is None
+            else self._ignore_rules.matcher(Path(directory))
+        )
+        listed: list[tuple[str, bool, bool]] = []
+        try:
+            with scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not (ignore and ignore.ignores(entry.name, is_dir)):
+                        listed.append((entry.name, is_dir, entry.is_symlink()))
+        except OSError:
+            return None
+        return listed
+
+    def update(
+        self, root: str | Path, is_cancelled: Callable[[], bool] = lambda: False
+    ) -> bool:
+        """Update the index of everything below a root.
+
+        Args:
+            root: The root to update the index for.
+            is_cancelled: A function that says if the update has been
+                cancelled.
+
+        Returns:
+            `True` if the update finished, `False` if it was cancelled.
+
+        Every directory below the root is looked at, but only those that
+        have been modified since they were last indexed are listed again.
+        """
+        root = Path(root).expanduser().absolute()
+        with self._connection() as connection:
+            known = {
+                path: (directory, modified)
+                for directory, path, modified in connection.execute(
+                    "SELECT id, path, modified FROM directories "
+                    "WHERE path = ? OR (path >= ? AND path < ?)",
+                    self._below(root),
+                )
+            }
+            seen: set[str] = set()
+            waiting = [str(root)]
+            listed = 0
+            while waiting:
+                if is_cancelled():
+                    return False
+                seen.add(directory := waiting.pop())
+                try:
+                    modified = stat(directory).st_mtime_ns
+                except OSError:
+                    continue
+                # If the directory hasn't changed, we already know which
+                # directories are within it.
+                if (cached := known.get(directory)) is not None and (
+                    cached[1] == modified
+                ):
+                    waiting.extend(
+                        join(directory, name)
+                        for (name,) in connection.execute(
+                            "SELECT name FROM entries "
+                            "WHERE directory = ? AND is_dir AND NOT is_link",
+                            (cached[0],),
+                        )
+                    )
+                    continue
+                if (entries := self._list(directory)) is None:
+                    continue
+                if cached is None:
+                    directory_id = connection.execute(
+                        "INSERT INTO directories (path, modified) VALUES (?, ?)",
+                        (directory, modified),
+                    ).lastrowid
+                    assert directory_id is not None
+                else:
+                    directory_id = cached[0]
+                    self._forget_entries(connection, [directory_id])
+                    connection.execute(
+                        "UPDATE directories SET modified = ? WHERE id = ?",
+                        (modified, directory_id),
+                    )
+                self._remember_entries(connection, directory_id, entries)
+                # Links aren't followed, so that a link that loops can't
+                # send the walk round in circles.
+                waiting.extend(
+                    join(directory, name)
+                    for name, is_dir, is_link in entries
+                    if is_dir and not is_link
+                )
+                if (listed := listed + 1) % COMMIT_INTERVAL == 0:
+                    connection.commit()
+
+            # Anything that was known about but that wasn't seen this time
+            # round has gone.
+            gone = [
+                directory for path, (directory, _) in known.items() if path not in seen
+            ]
+            self._forget_entries(connection, gone)
+            connection.executemany(
+                "DELETE FROM directories WHERE id = ?",
+                ((directory,) for directory in gone),
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO roots (path, updated) VALUES (?, ?)",
+                (str(root), time()),
+            )
+        return True
+
+    def _update_roots(self, force: bool) -> None:
+        """Update the roots that are due an update.
+
+        Args:
+            force: Update every root, whether it's due or not?
+        """
+        import sqlite3
+
+        for root in self.roots:
+            updated = self.updated(root)
+            if force or updated is None or time() - updated >= self._refresh_interval:
+                try:
+                    self.update(root)
+                except (OSError, sqlite3.Error):
+                    pass
+
+    def update_in_background(self, force: bool = False) -> None:
+        """Update the index of the roots in a background thread.
+
+        Args:
+            force: Update every root, even those that were updated recently.
+
+        If an update is already running in the background this does nothing.
+        """
+        with self._updater_lock:
+            if self.updating:
+                return
+            self._updater = Thread(
+                target=self._update_roots,
+                args=(force,),
+                name="fspicker-filename-index",
+                daemon=True,
+            )
+            self._updater.start()
+
+    @property
+    def updating(self) -> bool:
+        """Is the index being updated in the background?"""
+        return self._updater is not None and self._updater.is_alive()
+
+    def updated(self, location: str | Path) -> float | None:
+        """Get the time at which the index covering a location was updated.
+
+        Args:
+            location: The location to check.
+
+        Returns:
+            The time the index was last updated, or `None` if the location
+                isn't covered by the index.
+        """
+        location = Path(location).expanduser().absolute()
+        with self._connection() as connection:
+            covering = [
+                (len(path), updated)
+                for path, updated in connection.execute(
+                    "SELECT path, updated FROM roots"
+                )
+                if location.is_relative_to(path)
+            ]
+        return max(covering)[1] if covering else None
+
+    def search(
+        self,
+        location: str | Path,
+        query: str,
+        *,
+        include_hidden: bool = False,
+        directories_only: bool = False,
+        limit: int = DEFAULT_MAX_RESULTS,
+        file_filter: Callable[[str], bool] | None = None,
+    ) -> list[SearchMatch]:
+        """Search the index for entries below a location.
+
+        Args:
+            location: The location to search below.
+            query: The query to search for.
+            include_hidden: Should hidden entries be found?
+            directories_only: Should only directories be found?
+            limit: The maximum number of entries to find.
+            file_filter: An optional test of the name of a file that has to
+                pass for the file to be found.
+
+        Returns:
+            The entries that were found.
+
+        The query works in the same way as
+        [`SearchOptions.query`][textual_fspicker.subtree_search.SearchOptions.query];
+        a glob that is a plain prefix followed by a `*` is looked up as a
+        prefix, which is especially quick.
+        """
+        location = Path(location).expanduser().absolute()
+        itself, start, end = self._below(location)
+        conditions = [
+            "(directories.path = ? OR (directories.path >= ? AND directories.path < ?))"
+        ]
+        parameters: list[str | int] = [itself, start, end]
+        folded = query.casefold()
+        if _PREFIX.fullmatch(folded):
+            conditions.append("entries.folded >= ? AND entries.folded < ?")
+            parameters.extend((folded[:-1], f"{folded[:-1]}\U0010ffff"))
+        elif any(wildcard in folded for wildcard in "*?["):
+            conditions.append("entries.folded GLOB ?")
+            parameters.append(folded.replace("[!", "[^"))
+        elif self._trigrams and len(folded) >= 3:
+            conditions.append(
+                "entries.id IN (SELECT rowid FROM trigrams WHERE trigrams MATCH ?)"
+            )
+            parameters.append(f'"{folded.replace(chr(34), chr(34) * 2)}"')
+        else:
+            conditions.append("instr(entries.folded, ?) > 0")
+            parameters.append(folded)
+        if not include_hidden:
+            # As with the directory navigation, a name that starts with a
+            # dot is taken to be hidden; so is anything within a hidden
+            # directory below the location.
+            conditions.append("entries.name NOT LIKE '.%'")
+            conditions.append("substr(directories.path, ?) NOT LIKE ?")
+            parameters.extend((len(itself) + 1, f"%{sep}.%"))
+        if directories_only:
+            conditions.append("entries.is_dir")
+        search = (
+            "SELECT directories.path, entries.name, entries.is_dir "
+            "FROM entries JOIN directories ON directories.id = entries.directory "
+            f"WHERE {' AND '.join(conditions)}"
+        )
+        with self._connection() as connection:
+            if file_filter is None:
+                return [
+                    SearchMatch(join(path, name), bool(is_dir))
+                    for path, name, is_dir in connection.execute(
+                        f"{search} LIMIT ?", (*parameters, limit)
+                    )
+                ]
+            # The filter can't be run by the database, so the results are
+            # filtered as they're read, until there are enough of them.
+            found: list[SearchMatch] = []
+            for path, name, is_dir in connection.execute(search, parameters):
+                if is_dir or file_filter(name):
+                    found.append(SearchMatch(join(path, name), bool(is_dir)))
+                    if len(found) >= limit:
+                        break
+            return found
+
+
+### filename_index.py ends here
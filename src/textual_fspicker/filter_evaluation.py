@@ -0,0 +1,182 @@
+"""Support code for evaluating expensive filters.
+
+Some filters are costly to run; for example a filter that looks inside a
+file to see what type it really is. This module provides an evaluator that
+runs such filters in a pool of worker threads, and which caches the results
+so that a file need only be looked at once, until it changes.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from threading import Lock
+from typing import Final, TypeAlias
+
+##############################################################################
+# Local imports.
+from .entry_details import EntryDetails
+from .path_filters import Filter
+
+##############################################################################
+DEFAULT_CACHE_SIZE: Final[int] = 100_000
+"""The default number of results to keep in the cache."""
+
+DEFAULT_WORKERS: Final[int] = 8
+"""The default number of workers to use to evaluate filters."""
+
+CANCEL_CHECK_INTERVAL: Final[float] = 0.05
+"""How often, in seconds, to check if an evaluation has been cancelled."""
+
+
+##############################################################################
+_CacheKey: TypeAlias = tuple[Filter, str, int, float]
+"""The type of a key in the result cache."""
+
+
+##############################################################################
+class FilterEvaluator:
+    """Evaluates filters in a pool of workers, caching the results."""
+
+    def __init__(
+        self, cache_size: int = DEFAULT_CACHE_SIZE, workers: int = DEFAULT_WORKERS
+    ) -> None:
+        """Initialise the evaluator.
+
+        Args:
+            cache_size: The maximum number of results to keep in the cache.
+            workers: The maximum number of workers to evaluate filters with.
+        """
+        self._cache_size = cache_size
+        """The maximum number of results to keep in the cache."""
+        self._workers = workers
+        """The maximum number of workers to evaluate filters with."""
+        self._results: dict[_CacheKey, bool] = {}
+        """The cache of results."""
+        self._lock = Lock()
+        """Lock for updating the cache."""
+        self._pool: ThreadPoolExecutor | None = None
+        """The pool of workers, created when first needed."""
+
+    @staticmethod
+    def _key(file_filter: Filter, candidate: EntryDetails) -> _CacheKey:
+        """Get the cache key for a filter and a candidate.
+
+        Args:
+            file_filter: The filter.
+            candidate: The candidate.
+
+        Returns:
+            The key for the cache.
+        """
+        return (file_filter, str(candidate.location), candidate.size, candidate.mtime)
+
+    def cached(self, file_filter: Filter, candidate: EntryDetails) -> bool | None:
+        """Get the cached result of testing a candidate with a filter.
+
+        Args:
+            file_filter: The filter.
+            candidate: The candidate to get the result for.
+
+        Returns:
+            The result of the filter, or `None` if it isn't known yet.
+        """
+        return self._results.get(self._key(file_filter, candidate))
+
+    def _remember(
+        self, file_filter: Filter, candidate: EntryDetails, result: bool
+    ) -> None:
+        """Remember the result of testing a candidate with a filter.
+
+        Args:
+            file_filter: The filter.
+            candidate: The candidate that was tested.
+            result: The result of the test.
+        """
+        with self._lock:
+            while self._results and len(self._results) >= self._cache_size:
+                del self._results[next(iter(self._results))]
+            self._results[self._key(file_filter, candidate)] = result
+
+    @staticmethod
+    def _test(file_filter: Filter, candidate: EntryDetails) -> bool:
+        """Test a candidate with a filter.
+
+        Args:
+            file_filter: The filter.
+            candidate: The candidate to test.
+
+        Returns:
+            The result of the test.
+
+        Note:
+            Any error raised by the filter is taken to mean that the
+            candidate doesn't pass.
+        """
+        try:
+            return file_filter.test_details(candidate)
+        except Exception:
+            return False
+
+    def evaluate(
+        self,
+        file_filter: Filter,
+        candidates: Iterable[EntryDetails],
+        is_cancelled: Callable[[], bool] = lambda: False,
+    ) -> Iterator[tuple[EntryDetails, bool]]:
+        """Evaluate a filter against a collection of candidates.
+
+        Args:
+            file_filter: The filter to evaluate.
+            candidates: The candidates to test.
+            is_cancelled: A function that says if the evaluation has been
+                cancelled.
+
+        Yields:
+            Each candidate along with its result, in the order in which the
+                results became available.
+
+        Any result that is already in the cache is yielded straight away;
+        the rest are yielded as the workers finish with them. Cancellation
+        is checked for every
+        [`CANCEL_CHECK_INTERVAL`][textual_fspicker.filter_evaluation.CANCEL_CHECK_INTERVAL]
+        seconds, even while a filter is slow to finish.
+        """
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    self._workers, thread_name_prefix="fspicker-filter"
+                )
+            pool = self._pool
+        pending: dict[Future[bool], EntryDetails] = {}
+        for candidate in candidates:
+            if (result := self.cached(file_filter, candidate)) is not None:
+                yield candidate, result
+            else:
+                pending[pool.submit(self._test, file_filter, candidate)] = candidate
+        try:
+            while pending:
+                done, _ = wait(
+                    pending, timeout=CANCEL_CHECK_INTERVAL, return_when=FIRST_COMPLETED
+                )
+                if is_cancelled():
+                    return
+                for finished in done:
+                    candidate = pending.pop(finished)
+                    self._remember(file_filter, candidate, result := finished.result())
+                    yield candidate, result
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def clear(self) -> None:
+        """Clear the cache of results."""
+        with self._lock:
+            self._results.clear()
+
+
+### filter_evaluation.py ends here
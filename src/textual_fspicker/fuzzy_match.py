@@ -0,0 +1,168 @@
+"""Support code for narrowing a list of names with a fuzzy match.
+
+A name fuzzy-matches a query if all of the characters of the query appear
+in the name, in the same order, ignoring case. Names that match are given a
+score, so that the closest matches can be shown first.
+
+[`FuzzyNarrowing`][textual_fspicker.fuzzy_match.FuzzyNarrowing] keeps hold
+of the results of earlier queries so that, as the user types, each new
+character only means looking again at the names that survived the query
+before it.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import re
+from collections.abc import Callable, Iterable, Sequence
+from typing import Final
+
+##############################################################################
+CONSECUTIVE_BONUS: Final[int] = 5
+"""The bonus for a character that directly follows the one before it."""
+
+WORD_START_BONUS: Final[int] = 3
+"""The bonus for a character that starts a word in the name."""
+
+LENGTH_LIMIT: Final[int] = 256
+"""Names longer than this all count as being of this length when scoring."""
+
+CANCEL_CHECK_INTERVAL: Final[int] = 1_000
+"""How many names to look at between checks for cancellation."""
+
+
+##############################################################################
+def fuzzy_score(query: str, name: str) -> int | None:
+    """Score how well a name matches a query.
+
+    Args:
+        query: The query to match against.
+        name: The name to score.
+
+    Returns:
+        The score for the name, where higher is better, or `None` if the
+            name doesn't match the query at all.
+
+    Each character of the query that is found in the name scores a point,
+    with a bonus if it directly follows the previous character found, and
+    another if it starts a word within the name. Shorter names score
+    higher than longer names that otherwise match as well.
+    """
+    folded = name.casefold()
+    # Casefolding can turn one character into more than one (`ß` becomes
+    # `ss`, for example), in which case keep track of which character of
+    # the name each character of the folded name came from.
+    origin: Sequence[str] = name
+    if len(folded) != len(name):
+        origin = [character for character in name for _ in character.casefold()]
+    score = 0
+    position = 0
+    previous = -2
+    for character in query.casefold():
+        if (found := folded.find(character, position)) < 0:
+            return None
+        score += 1
+        if found == previous + 1:
+            score += CONSECUTIVE_BONUS
+        if (
+            found == 0
+            or not folded[found - 1].isalnum()
+            or (origin[found].isupper() and origin[found - 1].islower())
+        ):
+            score += WORD_START_BONUS
+        previous = found
+        position = found + 1
+    # The length of the name only ever breaks ties between otherwise equal
+    # scores.
+    return score * LENGTH_LIMIT - min(len(folded), LENGTH_LIMIT - 1)
+
+
+##############################################################################
+class FuzzyNarrowing:
+    """Narrows a list of names with a fuzzy match, as a query is typed."""
+
+    def __init__(self) -> None:
+        """Initialise the narrowing."""
+        self._results: dict[str, dict[str, int]] = {}
+        """The results of earlier queries, keyed by the query."""
+
+    @staticmethod
+    def _matcher(query: str) -> re.Pattern[str]:
+        """Make a regular expression that quickly finds likely matches.
+
+        Args:
+            query: The query to make the expression for.
+
+        Returns:
+            A regular expression that matches any name that might match.
+        """
+        return re.compile(
+            ".*?".join(re.escape(character) for character in query),
+            re.IGNORECASE | re.DOTALL,
+        )
+
+    def _survivors(self, query: str) -> Iterable[str] | None:
+        """Find the names that survived the closest earlier query.
+
+        Args:
+            query: The query about to be run.
+
+        Returns:
+            The names that matched the longest earlier query that the new
+                query starts with, or `None` if there isn't one.
+        """
+        for length in range(len(query), 0, -1):
+            if (earlier := self._results.get(query[:length])) is not None:
+                return earlier.keys()
+        return None
+
+    def narrow(
+        self,
+        query: str,
+        names: Iterable[str],
+        is_cancelled: Callable[[], bool] = lambda: False,
+    ) -> dict[str, int] | None:
+        """Narrow the names down to those that match a query.
+
+        Args:
+            query: The query to match against.
+            names: All of the names to be narrowed.
+            is_cancelled: A function that says if the narrowing has been
+                cancelled.
+
+        Returns:
+            The names that match, each with its score, or `None` if the
+                narrowing was cancelled.
+
+        If the query extends one that has been run before, only the names
+        that matched that earlier query are looked at; all of `names` is
+        only looked at when there is no such query.
+        """
+        if (results := self._results.get(query)) is not None:
+            return results
+        candidates = self._survivors(query)
+        matcher = self._matcher(query).search
+        results = {}
+        for count, name in enumerate(names if candidates is None else candidates):
+            if count % CANCEL_CHECK_INTERVAL == 0 and is_cancelled():
+                return None
+            if matcher(name) and (score := fuzzy_score(query, name)) is not None:
+                results[name] = score
+        # Only keep the results that later queries could build on.
+        self._results = {
+            earlier: matches
+            for earlier, matches in self._results.items()
+            if query.startswith(earlier)
+        }
+        self._results[query] = results
+        return results
+
+    def clear(self) -> None:
+        """Forget the results of all earlier queries."""
+        self._results = {}
+
+
+### fuzzy_match.py ends here
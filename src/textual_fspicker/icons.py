@@ -19,7 +19,7 @@ from __future__ import annotations
 # Python imports.
 from collections.abc import Callable
 from pathlib import Path
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
 ##############################################################################
 # Rich imports.
@@ -29,12 +29,93 @@ from rich.text import Text
 # Local imports.
 from .safe_tests import is_dir
 
+
+##############################################################################
+class LazyIcon:
+    """An icon that is only made from its markup the first time it's used.
+
+    Making a Rich [`Text`][rich.text.Text] from markup that contains an
+    emoji code means loading Rich's table of emoji; there's no sense in
+    doing that when the library is imported if no icon is ever shown. A
+    `LazyIcon` can be used as a class attribute, in which case looking it
+    up gives the icon itself.
+    """
+
+    def __init__(self, markup: str) -> None:
+        """Initialise the icon.
+
+        Args:
+            markup: The Rich markup for the icon.
+        """
+        self._markup = markup
+        """The Rich markup for the icon."""
+        self._icon: Text | None = None
+        """The icon, once it has been made."""
+
+    @property
+    def icon(self) -> Text:
+        """The icon."""
+        if self._icon is None:
+            self._icon = Text.from_markup(self._markup)
+        return self._icon
+
+    def __get__(self, instance: object, owner: type | None = None) -> Text:
+        """Get the icon, when used as a class attribute.
+
+        Args:
+            instance: The instance the icon is being looked up on, if any.
+            owner: The class the icon is being looked up on.
+
+        Returns:
+            The icon.
+        """
+        return self.icon
+
+
 ##############################################################################
 # Default icons.
-DEFAULT_FOLDER_ICON: Final[Text] = Text.from_markup(":file_folder:")
-"""The default icon to use for a folder."""
-DEFAULT_FILE_ICON: Final[Text] = Text.from_markup(":page_facing_up:")
-"""The default icon to use for a file."""
+_DEFAULT_ICONS: Final[dict[str, LazyIcon]] = {
+    "DEFAULT_FOLDER_ICON": LazyIcon(":file_folder:"),
+    "DEFAULT_FILE_ICON": LazyIcon(":page_facing_up:"),
+}
+"""The default icons, made the first time they're used."""
+
+if TYPE_CHECKING:
+    DEFAULT_FOLDER_ICON: Text
+    """The default icon to use for a folder."""
+    DEFAULT_FILE_ICON: Text
+    """The default icon to use for a file."""
+
+
+##############################################################################
+def __getattr__(name: str) -> Text:
+    """Get one of the default icons, making it the first time it's used.
+
+    Args:
+        name: The name of the icon.
+
+    Returns:
+        The icon.
+
+    Raises:
+        AttributeError: If there is no such icon.
+    """
+    if (icon := _DEFAULT_ICONS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return icon.icon
+
+
+##############################################################################
+def default_icon(is_dir: bool) -> Text:
+    """Get the default icon for a directory or a file.
+
+    Args:
+        is_dir: Is the icon for a directory?
+
+    Returns:
+        The icon as a Rich [`Text`][rich.text.Text] object.
+    """
+    return _DEFAULT_ICONS["DEFAULT_FOLDER_ICON" if is_dir else "DEFAULT_FILE_ICON"].icon
 
 
 ##############################################################################
@@ -47,7 +128,7 @@ def _default_icon_picker(location: Path) -> Text:
     Returns:
         The icon as a Rich [`Text`][rich.text.Text] object.
     """
-    return DEFAULT_FOLDER_ICON if is_dir(location) else DEFAULT_FILE_ICON
+    return default_icon(is_dir(location))
 
 
 ##############################################################################
@@ -110,15 +191,20 @@ class Icons:
         cls._picker = icon_picker
 
     @classmethod
-    def best_for(cls, location: str | Path) -> Text:
+    def best_for(cls, location: str | Path, is_dir: bool | None = None) -> Text:
         """Get the best icon for a given location.
 
         Args:
             location: The location to get an icon for.
+            is_dir: Whether the location is a directory, if that is already
+                known.
 
         Returns:
             The chosen icon for the location.
 
+        If it is already known whether the location is a directory, and the
+        default picker is in use, the filesystem isn't consulted.
+
         Example:
             ```
             >>> from textual_fspicker import Icons
@@ -128,6 +214,8 @@ class Icons:
             📄
             ```
         """
+        if is_dir is not None and cls._picker is _default_icon_picker:
+            return default_icon(is_dir)
         return cls._picker(Path(location))
 
 
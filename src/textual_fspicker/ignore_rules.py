@@ -0,0 +1,486 @@
+"""Support for ignoring entries in the filesystem using `.gitignore`-style rules.
+
+This module provides [`IgnoreRules`][textual_fspicker.ignore_rules.IgnoreRules],
+which can be handed to a dialog, or to the directory navigation widget, to
+have entries ignored while a directory is being loaded. Ignored entries are
+skipped as soon as their name is seen, so they are never looked at any
+further, never mind displayed.
+
+The rules follow the semantics of
+[`.gitignore`](https://git-scm.com/docs/gitignore) files: patterns are read
+from the ignore files found in the directory being loaded and, if it is
+within a git repository, in each of its parents up to the root of the
+repository; patterns in deeper directories take precedence over those
+further up, and later patterns take precedence over earlier ones. Patterns
+can also be supplied directly, in which case they have the lowest
+precedence of all.
+
+Note:
+    Unlike git, the contents of a directory are not ignored just because
+    the directory itself is ignored; if the user navigates into an ignored
+    directory they will see its contents.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import re
+from collections.abc import Iterable
+from pathlib import Path, PosixPath, WindowsPath
+from threading import Lock
+from typing import Final, NamedTuple, TypeVar
+
+##############################################################################
+DEFAULT_CACHE_SIZE: Final[int] = 1_000
+"""The default number of directories to keep the ignore rules of in the caches."""
+
+_Key = TypeVar("_Key")
+"""The type of the key of a cache."""
+
+_Value = TypeVar("_Value")
+"""The type of a value in a cache."""
+
+
+##############################################################################
+def _translate(pattern: str) -> str:
+    """Translate a `.gitignore` glob into a regular expression.
+
+    Args:
+        pattern: The glob to translate.
+
+    Returns:
+        The equivalent regular expression.
+    """
+    translated: list[str] = []
+    position = 0
+    while position < len(pattern):
+        character = pattern[position]
+        position += 1
+        if character == "*":
+            if pattern.startswith("*", position):
+                position += 1
+                at_start = position == 2 or pattern[position - 3] == "/"
+                if at_start and position == len(pattern):
+                    translated.append(".*")
+                    continue
+                if at_start and pattern.startswith("/", position):
+                    position += 1
+                    translated.append("(?:.*/)?")
+                    continue
+            translated.append("[^/]*")
+        elif character == "?":
+            translated.append("[^/]")
+        elif character == "[":
+            if (end := pattern.find("]", position + 1)) == -1:
+                translated.append(re.escape(character))
+                continue
+            members = pattern[position:end].replace("\\", "\\\\")
+            if members.startswith("!"):
+                members = f"^{members[1:]}"
+            translated.append(f"[{members}]")
+            position = end + 1
+        elif character == "\\" and position < len(pattern):
+            translated.append(re.escape(pattern[position]))
+            position += 1
+        else:
+            translated.append(re.escape(character))
+    return "".join(translated)
+
+
+##############################################################################
+class IgnorePattern(NamedTuple):
+    """A single compiled ignore pattern."""
+
+    matcher: re.Pattern[str]
+    """The compiled pattern."""
+
+    negated: bool
+    """Does this pattern re-include what it matches?"""
+
+    directory_only: bool
+    """Does this pattern only match directories?"""
+
+    anchored: bool
+    """Is the pattern anchored to the directory it was defined in?
+
+    An anchored pattern is matched against the path of an entry relative to
+    the directory the pattern was defined in; a pattern that isn't anchored
+    is matched against the name of the entry alone.
+    """
+
+    @classmethod
+    def parse(cls, line: str) -> IgnorePattern | None:
+        """Parse a line from an ignore file.
+
+        Args:
+            line: The line to parse.
+
+        Returns:
+            The compiled pattern, or `None` if the line holds no pattern.
+        """
+        # Trailing spaces are ignored, unless they're escaped.
+        line = line.rstrip("\n\r")
+        while line.endswith(" ") and not line.endswith("\\ "):
+            line = line[:-1]
+        if not line or line.startswith("#"):
+            return None
+        if (negated := line.startswith("!")) or line.startswith(("\\!", "\\#")):
+            line = line[1:]
+        if directory_only := line.endswith("/"):
+            line = line.rstrip("/")
+        if not line:
+            return None
+        if anchored := "/" in line:
+            line = line.lstrip("/")
+        return cls(
+            re.compile(f"{_translate(line)}\\Z", re.DOTALL),
+            negated,
+            directory_only,
+            anchored,
+        )
+
+
+##############################################################################
+class _Rule(NamedTuple):
+    """An ignore pattern as applied to the entries of a particular directory."""
+
+    pattern: IgnorePattern
+    """The pattern."""
+
+    prefix: str
+    """The path of the directory relative to where the pattern was defined."""
+
+
+##############################################################################
+class IgnoreSettings(NamedTuple):
+    """The settings that a set of ignore rules was made with.
+
+    Unlike the rules themselves, which keep caches of what they've read
+    from the filesystem, the settings are cheap to hand to another process.
+    """
+
+    patterns: tuple[str, ...]
+    """The patterns to apply everywhere."""
+
+    ignore_files: tuple[str, ...]
+    """The names of the files to read patterns from."""
+
+
+##############################################################################
+class IgnoreMatcher:
+    """Decides which entries of a single directory should be ignored.
+
+    Instances of this class are made by
+    [`IgnoreRules.matcher`][textual_fspicker.ignore_rules.IgnoreRules.matcher].
+    """
+
+    def __init__(self, rules: list[_Rule]) -> None:
+        """Initialise the matcher.
+
+        Args:
+            rules: The rules that apply to the directory, in order.
+        """
+        self._rules = rules[::-1]
+        """The rules that apply to the directory, in reverse order."""
+
+    def __bool__(self) -> bool:
+        """Are there any rules to apply?"""
+        return bool(self._rules)
+
+    def ignores(self, name: str, is_dir: bool | None = None) -> bool | None:
+        """Should an entry with the given name be ignored?
+
+        Args:
+            name: The name of the entry.
+            is_dir: Is the entry a directory, if that is known.
+
+        Returns:
+            `True` if the entry should be ignored, `False` if not, or `None`
+                if that depends on whether or not the entry is a directory
+                and that wasn't known.
+
+        Checking a name without saying if it's a directory or not means
+        that the filesystem need only be consulted about the entry if there
+        is a directory-only pattern that matches it.
+        """
+        for pattern, prefix in self._rules:
+            if pattern.matcher.match(f"{prefix}{name}" if pattern.anchored else name):
+                if pattern.directory_only:
+                    if is_dir is None:
+                        return None
+                    if not is_dir:
+                        continue
+                return not pattern.negated
+        return False
+
+
+##############################################################################
+class IgnoreRules:
+    """A set of `.gitignore`-style rules for ignoring filesystem entries."""
+
+    def __init__(
+        self,
+        *patterns: str,
+        ignore_files: Iterable[str] = (".gitignore",),
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """Initialise the ignore rules.
+
+        Args:
+            patterns: Patterns to apply everywhere.
+            ignore_files: The names of the files to read patterns from.
+            cache_size: The maximum number of directories to keep in each
+                of the caches.
+
+        Example:
+            ```python
+            IgnoreRules("node_modules/", ".venv/", "__pycache__/")
+            ```
+
+        To only use the given patterns, and not look for any ignore files
+        in the filesystem, pass an empty `ignore_files`.
+        """
+        self._given = patterns
+        """The patterns to apply everywhere, as they were given."""
+        self._patterns = [
+            pattern
+            for pattern in (IgnorePattern.parse(line) for line in patterns)
+            if pattern is not None
+        ]
+        """The patterns to apply everywhere."""
+        self._ignore_files = tuple(ignore_files)
+        """The names of the files to read patterns from."""
+        self._cache_size = cache_size
+        """The maximum number of directories to keep in each of the caches."""
+        self._defined: dict[Path, tuple[tuple[float, ...], list[IgnorePattern]]] = {}
+        """The patterns defined in each directory, along with the file times."""
+        self._matchers: dict[Path, tuple[tuple[float, ...], IgnoreMatcher]] = {}
+        """The matchers for each directory, along with the file times."""
+        self._roots: dict[Path, Path | None] = {}
+        """The root of the repository each directory is within, if it is in one."""
+        self._lock = Lock()
+        """Lock for updating the caches, as directories are loaded from many threads."""
+
+    @classmethod
+    def from_settings(cls, settings: IgnoreSettings) -> IgnoreRules:
+        """Make ignore rules from some settings.
+
+        Args:
+            settings: The settings to make the rules from.
+
+        Returns:
+            The ignore rules.
+        """
+        return cls(*settings.patterns, ignore_files=settings.ignore_files)
+
+    @property
+    def settings(self) -> IgnoreSettings:
+        """The settings these rules were made with."""
+        return IgnoreSettings(self._given, self._ignore_files)
+
+    def _recall(self, cache: dict[_Key, _Value], key: _Key) -> _Value | None:
+        """Recall a value from one of the caches, if it's there.
+
+        Args:
+            cache: The cache to look in.
+            key: The key of the value.
+
+        Returns:
+            The value, or `None` if it isn't in the cache.
+
+        A value that is recalled is moved to the end of the cache, so that
+        it is the last to make way for new values.
+        """
+        with self._lock:
+            if key in cache:
+                cache[key] = value = cache.pop(key)
+                return value
+        return None
+
+    def _remember(self, cache: dict[_Key, _Value], key: _Key, value: _Value) -> None:
+        """Remember a value in one of the caches.
+
+        Args:
+            cache: The cache to remember the value in.
+            key: The key of the value.
+            value: The value.
+        """
+        with self._lock:
+            cache.pop(key, None)
+            while cache and len(cache) >= self._cache_size:
+                del cache[next(iter(cache))]
+            cache[key] = value
+
+    @staticmethod
+    def _is_repository_root(directory: Path) -> bool:
+        """Is the given directory the root of a git repository?
+
+        Args:
+            directory: The directory to test.
+
+        Returns:
+            `True` if the directory looks like the root of a repository.
+        """
+        try:
+            return (directory / ".git").exists()
+        except OSError:
+            return False
+
+    def _file_times(self, directory: Path) -> tuple[float, ...]:
+        """Get the modification times of the ignore files in a directory.
+
+        Args:
+            directory: The directory to look in.
+
+        Returns:
+            The modification times of the ignore files, with `-1` for any
+                that don't exist.
+        """
+        times: list[float] = []
+        for ignore_file in self._ignore_files:
+            try:
+                times.append((directory / ignore_file).stat().st_mtime)
+            except OSError:
+                times.append(-1)
+        return tuple(times)
+
+    def _patterns_in(
+        self, directory: Path, times: tuple[float, ...]
+    ) -> list[IgnorePattern]:
+        """Get the patterns defined in the given directory.
+
+        Args:
+            directory: The directory to get the patterns for.
+            times: The modification times of the ignore files.
+
+        Returns:
+            The patterns defined in the directory.
+        """
+        defined = self._recall(self._defined, directory)
+        if defined is not None and defined[0] == times:
+            return defined[1]
+        patterns: list[IgnorePattern] = []
+        for ignore_file, file_time in zip(self._ignore_files, times, strict=True):
+            if file_time < 0:
+                continue
+            try:
+                lines = (directory / ignore_file).read_text(errors="replace")
+            except OSError:
+                continue
+            patterns.extend(
+                pattern
+                for pattern in (
+                    IgnorePattern.parse(line) for line in lines.splitlines()
+                )
+                if pattern is not None
+            )
+        self._remember(self._defined, directory, (times, patterns))
+        return patterns
+
+    def _repository_root(self, directory: Path) -> Path | None:
+        """Find the root of the repository that a directory is within.
+
+        Args:
+            directory: The directory to look for the repository of.
+
+        Returns:
+            The root of the repository, or `None` if the directory isn't
+                within one.
+
+        What's found is cached for each directory, so going into a
+        directory below one that has already been looked at only means
+        looking at that one directory.
+        """
+        root: Path | None
+        with self._lock:
+            if directory in self._roots:
+                self._roots[directory] = root = self._roots.pop(directory)
+                return root
+        if self._is_repository_root(directory):
+            root = directory
+        elif directory.parent == directory:
+            root = None
+        else:
+            root = self._repository_root(directory.parent)
+        self._remember(self._roots, directory, root)
+        return root
+
+    def matcher(self, directory: Path, discover: bool = True) -> IgnoreMatcher:
+        """Get the matcher for the entries of the given directory.
+
+        Args:
+            directory: The directory to get the matcher for.
+            discover: Should ignore files be looked for?
+
+        Returns:
+            The matcher for the entries of the directory.
+
+        The matcher is cached, and is only rebuilt if any of the ignore
+        files it was built from change.
+
+        Ignore files are only looked for in directories on the local
+        filesystem; for anywhere else, or if `discover` is `False`, only
+        the patterns given to the rules are used.
+        """
+        # Work out the chain of directories whose ignore files apply: from
+        # the root of the repository the directory is in, if it's in one,
+        # down to the directory itself.
+        chain = [directory]
+        discover = discover and isinstance(directory, (PosixPath, WindowsPath))
+        if (
+            discover
+            and self._ignore_files
+            and (root := self._repository_root(directory)) is not None
+        ):
+            while chain[-1] != root:
+                chain.append(chain[-1].parent)
+        chain.reverse()
+        times = (
+            tuple(time for ancestor in chain for time in self._file_times(ancestor))
+            if discover
+            else ()
+        )
+        cached = self._recall(self._matchers, directory)
+        if cached is not None and cached[0] == times:
+            return cached[1]
+
+        # Global patterns come first, so they have the lowest precedence,
+        # and are anchored at the top of the chain.
+        rules = [
+            _Rule(pattern, self._prefix(chain[0], directory))
+            for pattern in self._patterns
+        ]
+        width = len(self._ignore_files)
+        for index, ancestor in enumerate(chain if discover else ()):
+            prefix = self._prefix(ancestor, directory)
+            rules.extend(
+                _Rule(pattern, prefix)
+                for pattern in self._patterns_in(
+                    ancestor, times[index * width : (index + 1) * width]
+                )
+            )
+        self._remember(
+            self._matchers, directory, (times, matcher := IgnoreMatcher(rules))
+        )
+        return matcher
+
+    @staticmethod
+    def _prefix(ancestor: Path, directory: Path) -> str:
+        """Get the prefix to apply to names in a directory, relative to an ancestor.
+
+        Args:
+            ancestor: The ancestor directory.
+            directory: The directory whose entries are being matched.
+
+        Returns:
+            The prefix to apply to the names of entries in the directory.
+        """
+        if ancestor == directory:
+            return ""
+        return f"{directory.relative_to(ancestor).as_posix()}/"
+
+
+### ignore_rules.py ends here
@@ -0,0 +1,231 @@
+"""Support code for resolving symbolic links.
+
+This module provides a caching resolver for symbolic links. Resolving a link
+can mean following a long chain of links, or even a chain that loops back
+on itself; so rather than doing that work over and over the results are
+cached, keyed on the identity of the link itself, and any link that loops
+is detected and reported as such. The cache is limited in size, with the
+links that were least recently looked at making way for new ones, so that
+a long session of browsing doesn't keep hold of every link it ever saw.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import os
+from errno import ELOOP
+from pathlib import Path, PosixPath, WindowsPath
+from stat import S_ISLNK
+from threading import Lock
+from typing import Final, TypeVar
+
+##############################################################################
+MAXIMUM_LINK_DEPTH: Final[int] = 40
+"""The maximum number of links we'll follow before deciding we're looping."""
+
+DEFAULT_CACHE_SIZE: Final[int] = 10_000
+"""The default number of links to keep the resolution of in the cache."""
+
+_Key = TypeVar("_Key")
+"""The type of the key of a cache."""
+
+_Value = TypeVar("_Value")
+"""The type of a value in a cache."""
+
+
+##############################################################################
+class LinkLoopError(Exception):
+    """Exception raised when a symbolic link turns out to loop."""
+
+    def __init__(self, location: Path) -> None:
+        """Initialise the exception.
+
+        Args:
+            location: The location of the link that loops.
+        """
+        super().__init__(f"Symbolic link loop at {location}")
+        self.location = location
+        """The location of the link that loops."""
+
+
+##############################################################################
+class LinkResolver:
+    """A caching resolver for symbolic links."""
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initialise the resolver.
+
+        Args:
+            cache_size: The maximum number of links to keep in the cache.
+        """
+        self._cache_size = cache_size
+        """The maximum number of links to keep in the cache."""
+        self._targets: dict[tuple[int, int], str] = {}
+        """The targets of the links we've read, keyed on (dev, ino)."""
+        self._resolved: dict[tuple[str, int, int], Path | None] = {}
+        """The final resolved location for links, or `None` if they loop."""
+        self._lock = Lock()
+        """Lock for updating the cache, as links are resolved from many threads."""
+
+    def _recall(self, cache: dict[_Key, _Value], key: _Key) -> _Value | None:
+        """Recall a value from one of the caches, if it's there.
+
+        Args:
+            cache: The cache to look in.
+            key: The key of the value.
+
+        Returns:
+            The value, or `None` if it isn't in the cache.
+
+        A value that is recalled is moved to the end of the cache, so that
+        it is the last to make way for new values.
+        """
+        with self._lock:
+            if key in cache:
+                cache[key] = value = cache.pop(key)
+                return value
+        return None
+
+    def _remember(self, cache: dict[_Key, _Value], key: _Key, value: _Value) -> None:
+        """Remember a value in one of the caches.
+
+        Args:
+            cache: The cache to remember the value in.
+            key: The key of the value.
+            value: The value.
+        """
+        with self._lock:
+            cache.pop(key, None)
+            while cache and len(cache) >= self._cache_size:
+                del cache[next(iter(cache))]
+            cache[key] = value
+
+    @staticmethod
+    def _is_local(location: Path) -> bool:
+        """Is the given location one we can work with directly?
+
+        Args:
+            location: The location to test.
+
+        Returns:
+            `True` if the location is on the local filesystem, `False` if not.
+
+        Note:
+            Any [`Path`][pathlib.Path] that isn't a local path (for example
+            a [UPath](https://github.com/fsspec/universal_pathlib)) is left
+            to resolve itself.
+        """
+        return isinstance(location, (PosixPath, WindowsPath))
+
+    def _follow(self, location: Path, link: os.stat_result) -> Path | None:
+        """Follow a chain of links to its final location.
+
+        Args:
+            location: The location of the link to follow.
+            link: The `lstat` result for the link.
+
+        Returns:
+            The final location of the chain of links, or `None` if it loops.
+        """
+        seen: set[tuple[int, int]] = set()
+        current = location
+        while S_ISLNK(link.st_mode):
+            identity = (link.st_dev, link.st_ino)
+            if identity in seen or len(seen) >= MAXIMUM_LINK_DEPTH:
+                return None
+            seen.add(identity)
+            if (target := self._recall(self._targets, identity)) is None:
+                try:
+                    target = os.readlink(current)
+                except OSError:
+                    break
+                self._remember(self._targets, identity, target)
+            current = current.parent / target
+            try:
+                link = os.lstat(current)
+            except OSError as error:
+                if error.errno == ELOOP:
+                    return None
+                # Most likely a dangling link; in that case we'll let
+                # pathlib have the final say on what it resolves to.
+                break
+        try:
+            return current.resolve()
+        except RuntimeError:
+            # Before Python 3.13 a loop in the remaining components of the
+            # path would be reported as a RuntimeError.
+            return None
+
+    def _lookup(self, location: Path, link: os.stat_result) -> Path | None:
+        """Look up the resolution of a link, caching the result.
+
+        Args:
+            location: The location of the link.
+            link: The `lstat` result for the link.
+
+        Returns:
+            The final location of the link, or `None` if it loops.
+        """
+        key = (str(location), link.st_dev, link.st_ino)
+        with self._lock:
+            if key in self._resolved:
+                self._resolved[key] = resolved = self._resolved.pop(key)
+                return resolved
+        resolved = self._follow(location, link)
+        self._remember(self._resolved, key, resolved)
+        return resolved
+
+    def resolve(self, location: Path) -> Path:
+        """Resolve the given location.
+
+        Args:
+            location: The location to resolve.
+
+        Returns:
+            The resolved location.
+
+        Raises:
+            LinkLoopError: If the location is a link that loops.
+        """
+        if not self._is_local(location):
+            return location.resolve()
+        try:
+            link = os.lstat(location)
+        except OSError as error:
+            if error.errno == ELOOP:
+                raise LinkLoopError(location) from error
+            return location.resolve()
+        if not S_ISLNK(link.st_mode):
+            return location.resolve()
+        if (resolved := self._lookup(location, link)) is None:
+            raise LinkLoopError(location)
+        return resolved
+
+    def is_loop(self, location: Path) -> bool:
+        """Is the given location a link that loops?
+
+        Args:
+            location: The location to test.
+
+        Returns:
+            `True` if the location is a link that loops, `False` if not.
+        """
+        if not self._is_local(location):
+            return False
+        try:
+            link = os.lstat(location)
+        except OSError as error:
+            return error.errno == ELOOP
+        return S_ISLNK(link.st_mode) and self._lookup(location, link) is None
+
+    def clear(self) -> None:
+        """Clear the cache of resolved links."""
+        with self._lock:
+            self._targets.clear()
+            self._resolved.clear()
+
+
+### link_resolver.py ends here
@@ -0,0 +1,685 @@
+"""Provides the backends that directories are listed with.
+
+A [`ListingBackend`][textual_fspicker.listing_backends.ListingBackend] lists
+the content of a directory, providing the
+[`EntryDetails`][textual_fspicker.entry_details.EntryDetails] of each entry
+within it. Two backends are provided:
+
+- [`PathListing`][textual_fspicker.listing_backends.PathListing], which uses
+  the methods of the [`Path`][pathlib.Path] itself to list the directory and
+  look at each entry. This works with any sort of path; a directory on the
+  local filesystem is scanned with [`os.scandir`][os.scandir].
+- [`FsspecListing`][textual_fspicker.listing_backends.FsspecListing], which
+  lists a directory on an [fsspec](https://filesystem-spec.readthedocs.io/)
+  filesystem with a single call to its `ls` method; so listing a directory
+  on a remote filesystem takes a single round trip, rather than one or more
+  for every entry.
+
+[`FlatListing`][textual_fspicker.listing_backends.FlatListing] lists the
+whole tree below a local directory as one flat listing.
+
+Where the filesystem has an async API, an
+[`AsyncListingBackend`][textual_fspicker.listing_backends.AsyncListingBackend]
+can be used instead; its coroutines are awaited on the application's event
+loop rather than being run in a thread.
+[`AsyncFsspecListing`][textual_fspicker.listing_backends.AsyncFsspecListing]
+is provided for async fsspec filesystems.
+
+When a backend hasn't been chosen,
+[`backend_for`][textual_fspicker.listing_backends.backend_for] picks the
+best one for a given location.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime
+from functools import partial
+from inspect import iscoroutinefunction
+from os import DirEntry, scandir
+from pathlib import Path, PosixPath, WindowsPath
+from typing import Any, Final, Protocol, TypeGuard
+
+##############################################################################
+# Local imports.
+from .archives import ArchivePath
+from .entry_details import EntryDetails
+from .ignore_rules import IgnoreRules
+
+##############################################################################
+DEFAULT_FLAT_DEPTH: Final[int] = 8
+"""The default depth below a directory that a flat listing goes to."""
+
+
+##############################################################################
+class ListedEntry:
+    """An entry in the listing of a directory."""
+
+    __slots__ = ("name", "is_dir", "_details", "_look")
+
+    def __init__(
+        self,
+        name: str,
+        details: EntryDetails | Callable[[], EntryDetails],
+        is_dir: bool | None = None,
+    ) -> None:
+        """Initialise the listed entry.
+
+        Args:
+            name: The name of the entry.
+            details: The details of the entry, or a function that will look
+                them up.
+            is_dir: Is the entry a directory, if that is known without
+                looking at it?
+
+        A backend that gets the details of every entry at the same time as
+        it lists the directory provides the details; one that has to go
+        and look at each entry provides a function to do that, so that
+        entries that are ruled out on their name alone never need to be
+        looked at.
+        """
+        self.name = name
+        """The name of the entry."""
+        self.is_dir = details.is_dir if isinstance(details, EntryDetails) else is_dir
+        """Is the entry a directory? `None` if it isn't known without looking."""
+        self._details = details if isinstance(details, EntryDetails) else None
+        """The details of the entry, if they're known yet."""
+        self._look = None if isinstance(details, EntryDetails) else details
+        """The function to look up the details of the entry, if needed."""
+
+    @property
+    def looked_at(self) -> bool:
+        """Have the details of the entry been looked up?"""
+        return self._details is not None
+
+    @property
+    def details(self) -> EntryDetails:
+        """The details of the entry."""
+        if self._details is None:
+            assert self._look is not None
+            self._details = self._look()
+        return self._details
+
+
+##############################################################################
+class ListingBackend(Protocol):
+    """The protocol for a backend that lists directories."""
+
+    def listing(self, location: Path) -> Iterable[ListedEntry]:
+        """List the entries in a directory.
+
+        Args:
+            location: The location of the directory to list.
+
+        Returns:
+            The entries in the directory.
+
+        Raises:
+            PermissionError: If the directory can't be listed.
+        """
+
+    def details(self, location: Path) -> EntryDetails:
+        """Get the details of a single location.
+
+        Args:
+            location: The location to get the details of.
+
+        Returns:
+            The details of the location.
+        """
+
+
+##############################################################################
+def _scanned_is_dir(entry: DirEntry[str]) -> bool | None:
+    """Find out if a scanned entry is a directory, if the scan already knows.
+
+    Args:
+        entry: The entry, from [`os.scandir`][os.scandir].
+
+    Returns:
+        `True` if the entry is a directory, `False` if not, or `None` if
+            the entry would have to be looked at to know; that is, if it
+            is a link, which would have to be followed.
+    """
+    try:
+        return None if entry.is_symlink() else entry.is_dir()
+    except OSError:
+        return None
+
+
+##############################################################################
+class PathListing:
+    """A listing backend that uses the methods of the path itself."""
+
+    def listing(self, location: Path) -> Iterator[ListedEntry]:
+        """List the entries in a directory.
+
+        Args:
+            location: The location of the directory to list.
+
+        Yields:
+            The entries in the directory.
+        """
+        # A plain local directory is scanned, so that what the scan finds
+        # out about each entry can be used when it comes to looking at it.
+        if isinstance(location, (PosixPath, WindowsPath)) and not isinstance(
+            location, ArchivePath
+        ):
+            with scandir(location) as entries:
+                for scanned in entries:
+                    yield ListedEntry(
+                        scanned.name,
+                        partial(EntryDetails.scanned, location / scanned.name, scanned),
+                        _scanned_is_dir(scanned),
+                    )
+            return
+        for entry in location.iterdir():
+            yield ListedEntry(
+                entry.name, partial(EntryDetails.of, location / entry.name)
+            )
+
+    def details(self, location: Path) -> EntryDetails:
+        """Get the details of a single location.
+
+        Args:
+            location: The location to get the details of.
+
+        Returns:
+            The details of the location.
+        """
+        return EntryDetails.of(location)
+
+
+##############################################################################
+def _relative_details(location: Path, name: str) -> EntryDetails:
+    """Gather the details of an entry, named for its place in a flat listing.
+
+    Args:
+        location: The location of the entry.
+        name: The path of the entry relative to the listed directory.
+
+    Returns:
+        The details of the entry.
+    """
+    return EntryDetails.of(location)._replace(name=name)
+
+
+##############################################################################
+class FlatListing:
+    """A listing backend that lists everything below a directory in one go.
+
+    Rather than listing the entries in a directory, this walks the tree
+    below it, with [`os.scandir`][os.scandir], and lists every file (or,
+    if asked, every directory) found along the way; each entry is named for
+    its path relative to the directory being listed, for display, while
+    its location keeps its own name for filtering. The walk is
+    breadth-first, so entries nearer the top of the tree are listed first,
+    and it streams the entries out as it goes. Links to directories aren't
+    followed, so a link that loops can't send the walk round in circles.
+
+    This only works for directories on the local filesystem.
+    """
+
+    def __init__(
+        self,
+        max_depth: int = DEFAULT_FLAT_DEPTH,
+        include_hidden: bool = False,
+        ignore_rules: IgnoreRules | None = None,
+        directories: bool = False,
+    ) -> None:
+        """Initialise the backend.
+
+        Args:
+            max_depth: How many levels below the directory to go.
+            include_hidden: Should hidden entries be listed and walked into?
+            ignore_rules: Rules for entries that should be ignored, if any.
+            directories: Should directories be listed, rather than files?
+        """
+        self._max_depth = max_depth
+        """How many levels below the directory to go."""
+        self._include_hidden = include_hidden
+        """Should hidden entries be listed and walked into?"""
+        self._ignore_rules = ignore_rules
+        """Rules for entries that should be ignored, if any."""
+        self._directories = directories
+        """Should directories be listed, rather than files?"""
+
+    def listing(self, location: Path) -> Iterator[ListedEntry]:
+        """List the entries below a directory.
+
+        Args:
+            location: The location of the directory to list.
+
+        Yields:
+            The entries below the directory.
+
+        Raises:
+            PermissionError: If the directory itself can't be listed.
+        """
+        waiting: deque[tuple[Path, str, int]] = deque([(location, "", 0)])
+        while waiting:
+            directory, prefix, depth = waiting.popleft()
+            ignore = (
+                None
+                if self._ignore_rules is None
+                else self._ignore_rules.matcher(directory)
+            )
+            try:
+                with scandir(directory) as entries:
+                    for entry in entries:
+                        # As with the directory navigation, a name that
+                        # starts with a dot is taken to be hidden.
+                        if not self._include_hidden and entry.name.startswith("."):
+                            continue
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if ignore and ignore.ignores(entry.name, is_dir):
+                            continue
+                        name = f"{prefix}{entry.name}"
+                        if is_dir == self._directories:
+                            yield ListedEntry(
+                                name,
+                                partial(
+                                    _relative_details, directory / entry.name, name
+                                ),
+                                is_dir,
+                            )
+                        if (
+                            is_dir
+                            and depth < self._max_depth
+                            and not entry.is_symlink()
+                        ):
+                            waiting.append(
+                                (directory / entry.name, f"{name}/", depth + 1)
+                            )
+            except PermissionError:
+                if not depth:
+                    raise
+            except OSError:
+                pass
+
+    def details(self, location: Path) -> EntryDetails:
+        """Get the details of a single location.
+
+        Args:
+            location: The location to get the details of.
+
+        Returns:
+            The details of the location.
+        """
+        return EntryDetails.of(location)
+
+
+##############################################################################
+class FsspecFilesystem(Protocol):
+    """The parts of an fsspec filesystem that are used to list directories."""
+
+    def ls(self, path: str, detail: bool = True) -> list[dict[str, Any]]:
+        """List the content of a directory.
+
+        Args:
+            path: The path of the directory to list.
+            detail: Should the details of each entry be included?
+
+        Returns:
+            The details of each entry in the directory.
+        """
+
+    def info(self, path: str) -> dict[str, Any]:
+        """Get the details of a location.
+
+        Args:
+            path: The path of the location.
+
+        Returns:
+            The details of the location.
+        """
+
+
+##############################################################################
+_MTIME_KEYS: Final[tuple[str, ...]] = (
+    "mtime",
+    "modified",
+    "LastModified",
+    "last_modified",
+    "updated",
+    "created",
+)
+"""The keys that fsspec filesystems use for the modification time of an entry."""
+
+
+##############################################################################
+def _mtime(info: dict[str, Any]) -> float:
+    """Get the modification time out of the fsspec details of an entry.
+
+    Args:
+        info: The details of the entry.
+
+    Returns:
+        The modification time of the entry, or `0` if it isn't known.
+
+    Note:
+        Different filesystems give the time under different keys, and in
+        different forms; this handles the common ones.
+    """
+    for key in _MTIME_KEYS:
+        if (when := info.get(key)) is None:
+            continue
+        try:
+            if isinstance(when, datetime):
+                return when.timestamp()
+            if isinstance(when, str):
+                return datetime.fromisoformat(when.replace("Z", "+00:00")).timestamp()
+            return float(when)
+        except (OverflowError, TypeError, ValueError):
+            continue
+    return 0.0
+
+
+##############################################################################
+def _fsspec_details(location: Path, info: dict[str, Any]) -> EntryDetails:
+    """Turn the fsspec details of an entry into entry details.
+
+    Args:
+        location: The location of the entry.
+        info: The fsspec details of the entry.
+
+    Returns:
+        The details of the entry.
+    """
+    return EntryDetails(
+        location,
+        location.name,
+        info.get("type") == "directory",
+        info.get("type") == "file",
+        bool(info.get("islink", False)),
+        int(info.get("size") or 0),
+        _mtime(info),
+    )
+
+
+##############################################################################
+def _fsspec_listing(
+    location: Path, listing: Iterable[dict[str, Any]]
+) -> list[ListedEntry]:
+    """Turn an fsspec listing of a directory into listed entries.
+
+    Args:
+        location: The location of the directory that was listed.
+        listing: The fsspec details of each entry in the directory.
+
+    Returns:
+        The entries in the directory.
+    """
+    listed: list[ListedEntry] = []
+    for info in listing:
+        name = str(info["name"]).rstrip("/").rpartition("/")[-1]
+        if name and name not in (".", ".."):
+            listed.append(ListedEntry(name, _fsspec_details(location / name, info)))
+    return listed
+
+
+##############################################################################
+def _unknown(location: Path, error: Exception) -> EntryDetails:
+    """Make the details of a location that couldn't be looked at.
+
+    Args:
+        location: The location.
+        error: The error that stopped the location being looked at.
+
+    Returns:
+        The details of the location.
+
+    Note:
+        As with [`EntryDetails.of`][textual_fspicker.entry_details.EntryDetails.of],
+        a location that can't be looked at for want of permission is taken
+        to be a file; anything else is taken not to exist.
+    """
+    return EntryDetails(
+        location,
+        location.name,
+        False,
+        isinstance(error, PermissionError),
+        False,
+        0,
+        0.0,
+    )
+
+
+##############################################################################
+class FsspecListing:
+    """A listing backend for paths on an fsspec filesystem."""
+
+    def __init__(self, filesystem: FsspecFilesystem | None = None) -> None:
+        """Initialise the backend.
+
+        Args:
+            filesystem: The filesystem to list directories on.
+
+        If no filesystem is given, each path is taken to know its own
+        filesystem, as a [UPath](https://github.com/fsspec/universal_pathlib)
+        does, by way of its `fs` and `path` attributes. If a filesystem is
+        given, paths are handed to it in their POSIX form.
+        """
+        self._filesystem = filesystem
+        """The filesystem to list directories on, if it has been given."""
+
+    def _on(self, location: Path) -> tuple[FsspecFilesystem, str]:
+        """Get the filesystem a location is on, and its path within it.
+
+        Args:
+            location: The location.
+
+        Returns:
+            The filesystem and the path of the location within it.
+        """
+        if self._filesystem is None:
+            return location.fs, location.path  # type: ignore[attr-defined]
+        return self._filesystem, location.as_posix()
+
+    def listing(self, location: Path) -> list[ListedEntry]:
+        """List the entries in a directory.
+
+        Args:
+            location: The location of the directory to list.
+
+        Returns:
+            The entries in the directory.
+
+        The whole directory, along with the details of every entry, is
+        listed with a single call to the filesystem.
+        """
+        filesystem, path = self._on(location)
+        return _fsspec_listing(location, filesystem.ls(path, detail=True))
+
+    def details(self, location: Path) -> EntryDetails:
+        """Get the details of a single location.
+
+        Args:
+            location: The location to get the details of.
+
+        Returns:
+            The details of the location.
+        """
+        filesystem, path = self._on(location)
+        try:
+            return _fsspec_details(location, filesystem.info(path))
+        except (OSError, ValueError) as error:
+            return _unknown(location, error)
+
+
+##############################################################################
+class AsyncListingBackend(Protocol):
+    """The protocol for a backend that lists directories with coroutines.
+
+    An async backend is awaited on the application's event loop, rather
+    than being run in a thread; so many listings can be in flight at once
+    without a thread for each of them, and a listing that is no longer
+    wanted is abandoned by cancelling it.
+    """
+
+    async def listing(self, location: Path) -> list[ListedEntry]:
+        """List the entries in a directory.
+
+        Args:
+            location: The location of the directory to list.
+
+        Returns:
+            The entries in the directory.
+
+        Raises:
+            PermissionError: If the directory can't be listed.
+        """
+
+    async def details(self, location: Path) -> EntryDetails:
+        """Get the details of a single location.
+
+        Args:
+            location: The location to get the details of.
+
+        Returns:
+            The details of the location.
+        """
+
+
+##############################################################################
+class AsyncFsspecFilesystem(Protocol):
+    """The parts of an async fsspec filesystem that are used to list directories."""
+
+    async def _ls(self, path: str, detail: bool = True) -> list[dict[str, Any]]:
+        """List the content of a directory.
+
+        Args:
+            path: The path of the directory to list.
+            detail: Should the details of each entry be included?
+
+        Returns:
+            The details of each entry in the directory.
+        """
+
+    async def _info(self, path: str) -> dict[str, Any]:
+        """Get the details of a location.
+
+        Args:
+            path: The path of the location.
+
+        Returns:
+            The details of the location.
+        """
+
+
+##############################################################################
+class AsyncFsspecListing:
+    """An async listing backend for paths on an async fsspec filesystem.
+
+    This works with any fsspec filesystem that is built on
+    `fsspec.asyn.AsyncFileSystem` (HTTP, S3, GCS, Azure and so on), awaiting
+    its coroutine methods directly.
+    """
+
+    def __init__(self, filesystem: AsyncFsspecFilesystem | None = None) -> None:
+        """Initialise the backend.
+
+        Args:
+            filesystem: The filesystem to list directories on.
+
+        As with [`FsspecListing`][textual_fspicker.listing_backends.FsspecListing],
+        if no filesystem is given each path is taken to know its own
+        filesystem.
+
+        Note:
+            The filesystem should be created with `asynchronous=True`, on
+            the application's event loop.
+        """
+        self._filesystem = filesystem
+        """The filesystem to list directories on, if it has been given."""
+
+    def _on(self, location: Path) -> tuple[AsyncFsspecFilesystem, str]:
+        """Get the filesystem a location is on, and its path within it.
+
+        Args:
+            location: The location.
+
+        Returns:
+            The filesystem and the path of the location within it.
+        """
+        if self._filesystem is None:
+            return location.fs, location.path  # type: ignore[attr-defined]
+        return self._filesystem, location.as_posix()
+
+    async def listing(self, location: Path) -> list[ListedEntry]:
+        """List the entries in a directory.
+
+        Args:
+            location: The location of the directory to list.
+
+        Returns:
+            The entries in the directory.
+        """
+        filesystem, path = self._on(location)
+        return _fsspec_listing(location, await filesystem._ls(path, detail=True))
+
+    async def details(self, location: Path) -> EntryDetails:
+        """Get the details of a single location.
+
+        Args:
+            location: The location to get the details of.
+
+        Returns:
+            The details of the location.
+        """
+        filesystem, path = self._on(location)
+        try:
+            return _fsspec_details(location, await filesystem._info(path))
+        except (OSError, ValueError) as error:
+            return _unknown(location, error)
+
+
+##############################################################################
+_PATH: Final[PathListing] = PathListing()
+"""The shared backend for listing with a path's own methods."""
+
+_FSSPEC: Final[FsspecListing] = FsspecListing()
+"""The shared backend for listing paths that know their fsspec filesystem."""
+
+
+##############################################################################
+def is_async_backend(
+    backend: ListingBackend | AsyncListingBackend,
+) -> TypeGuard[AsyncListingBackend]:
+    """Is a listing backend an async backend?
+
+    Args:
+        backend: The backend to test.
+
+    Returns:
+        `True` if the backend lists directories with coroutines, `False` if
+            not.
+    """
+    return iscoroutinefunction(backend.listing)
+
+
+##############################################################################
+def backend_for(location: Path) -> ListingBackend:
+    """Pick the best listing backend for a location.
+
+    Args:
+        location: The location to pick a backend for.
+
+    Returns:
+        An fsspec backend if the location knows its fsspec filesystem,
+            otherwise a backend that uses the path's own methods.
+    """
+    if hasattr(location, "fs") and hasattr(location, "path"):
+        return _FSSPEC
+    return _PATH
+
+
+### listing_backends.py ends here
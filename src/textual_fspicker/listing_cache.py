@@ -0,0 +1,246 @@
+"""Provides a cache of directory listings that is kept between runs.
+
+Listing a directory on a slow network mount can take a while, and an
+application that is run, used briefly, and then closed pays that cost every
+time it's run. A [`ListingCache`][textual_fspicker.listing_cache.ListingCache]
+keeps the listings of the directories that have been looked at on disk, so
+that the next time the directory is opened its last-known listing can be
+shown straight away while the real listing is being loaded.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import json
+import zlib
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    import sqlite3
+
+##############################################################################
+# Local imports.
+from .entry_details import EntryDetails
+from .user_cache import user_cache_directory
+
+##############################################################################
+DEFAULT_MAX_SIZE: Final[int] = 64 * 1024 * 1024
+"""The default maximum size, in bytes, of the cached listings."""
+
+_SCHEMA: Final[str] = """
+CREATE TABLE IF NOT EXISTS listings (
+    path    TEXT PRIMARY KEY,
+    used    REAL NOT NULL,
+    size    INTEGER NOT NULL,
+    listing BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS listings_by_use ON listings (used);
+CREATE TABLE IF NOT EXISTS total (
+    size INTEGER NOT NULL
+);
+INSERT INTO total (size)
+    SELECT (SELECT COALESCE(SUM(size), 0) FROM listings)
+    WHERE NOT EXISTS (SELECT * FROM total);
+CREATE TRIGGER IF NOT EXISTS listing_added AFTER INSERT ON listings BEGIN
+    UPDATE total SET size = size + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS listing_changed AFTER UPDATE OF size ON listings BEGIN
+    UPDATE total SET size = size - OLD.size + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS listing_removed AFTER DELETE ON listings BEGIN
+    UPDATE total SET size = size - OLD.size;
+END;
+"""
+"""The schema of the cache.
+
+The total size of the listings is kept up to date as listings come and go,
+so that the size of the cache can be checked without going through it.
+"""
+
+
+##############################################################################
+class ListingCache:
+    """A cache of directory listings, kept on disk between runs."""
+
+    def __init__(
+        self,
+        *,
+        database: str | Path | None = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        excluded: Iterable[str | Path] = (),
+    ) -> None:
+        """Initialise the cache.
+
+        Args:
+            database: The location of the database to keep the cache in.
+            max_size: The maximum size, in bytes, of the cached listings.
+            excluded: Directories whose listings, and the listings of
+                everything below them, should never be cached.
+
+        If no database is given the cache is kept in the user's cache
+        directory. When the cached listings grow beyond `max_size` the
+        listings that were used least recently are thrown away.
+        """
+        self.database = (
+            user_cache_directory() / "listing-cache.sqlite3"
+            if database is None
+            else Path(database)
+        )
+        """The location of the database the cache is kept in."""
+        self._max_size = max_size
+        """The maximum size of the cached listings."""
+        self._excluded = tuple(
+            Path(directory).expanduser().absolute() for directory in excluded
+        )
+        """The directories that shouldn't be cached."""
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection to the database.
+
+        Yields:
+            The connection, which is committed and closed when done with.
+        """
+        import sqlite3
+
+        self.database.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.database, timeout=30)) as connection:
+            connection.execute("PRAGMA journal_mode = WAL")
+            with connection:
+                yield connection
+
+    def caches(self, location: Path) -> bool:
+        """Should the listing of a location be cached?
+
+        Args:
+            location: The location to check.
+
+        Returns:
+            `True` if the listing should be cached, `False` if not.
+        """
+        return not any(location.is_relative_to(excluded) for excluded in self._excluded)
+
+    def fetch(self, location: Path) -> list[EntryDetails] | None:
+        """Fetch the cached listing of a location.
+
+        Args:
+            location: The location to fetch the listing of.
+
+        Returns:
+            The details of the entries in the cached listing, or `None` if
+                there isn't one.
+
+        Note:
+            The listing could be out of date; it is up to the caller to
+            check it against the filesystem.
+        """
+        import sqlite3
+
+        if not self.caches(location):
+            return None
+        try:
+            with self._connection() as connection:
+                found = connection.execute(
+                    "SELECT listing FROM listings WHERE path = ?", (str(location),)
+                ).fetchone()
+                if found is None:
+                    return None
+                connection.execute(
+                    "UPDATE listings SET used = ? WHERE path = ?",
+                    (time(), str(location)),
+                )
+            return [
+                EntryDetails(location / name, name, *details)
+                for name, *details in json.loads(zlib.decompress(found[0]))
+            ]
+        except (OSError, sqlite3.Error, ValueError, TypeError, zlib.error):
+            return None
+
+    def store(self, location: Path, entries: Iterable[EntryDetails]) -> None:
+        """Store the listing of a location.
+
+        Args:
+            location: The location the listing is of.
+            entries: The details of the entries in the listing.
+        """
+        import sqlite3
+
+        if not self.caches(location):
+            return
+        listing = zlib.compress(
+            json.dumps(
+                [
+                    [
+                        entry.name,
+                        entry.is_dir,
+                        entry.is_file,
+                        entry.is_link,
+                        entry.size,
+                        entry.mtime,
+                    ]
+                    for entry in entries
+                ],
+                separators=(",", ":"),
+            ).encode()
+        )
+        try:
+            with self._connection() as connection:
+                # Note that the listing is updated in place, if it's already
+                # there, rather than replaced, so that the total size is
+                # kept up to date.
+                connection.execute(
+                    "INSERT INTO listings (path, used, size, listing) "
+                    "VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (path) DO UPDATE SET "
+                    "used = excluded.used, size = excluded.size, "
+                    "listing = excluded.listing",
+                    (str(location), time(), len(listing), listing),
+                )
+                self._evict(connection)
+        except (OSError, sqlite3.Error):
+            pass
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Throw away the least-recently used listings, if the cache is too big.
+
+        Args:
+            connection: The connection to the database.
+        """
+        ((total,),) = connection.execute("SELECT size FROM total")
+        if total <= self._max_size:
+            return
+        evicted: list[tuple[str]] = []
+        for path, size in connection.execute(
+            "SELECT path, size FROM listings ORDER BY used"
+        ):
+            if total <= self._max_size:
+                break
+            evicted.append((path,))
+            total -= size
+        connection.executemany("DELETE FROM listings WHERE path = ?", evicted)
+
+    def forget(self, location: Path) -> None:
+        """Forget the cached listing of a location.
+
+        Args:
+            location: The location to forget.
+        """
+        with self._connection() as connection:
+            connection.execute("DELETE FROM listings WHERE path = ?", (str(location),))
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._connection() as connection:
+            connection.execute("DELETE FROM listings")
+
+
+### listing_cache.py ends here
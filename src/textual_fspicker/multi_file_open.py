@@ -0,0 +1,141 @@
+"""Provides a dialog for opening more than one file."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from asyncio import TimeoutError as AsyncTimeoutError
+from asyncio import gather, to_thread, wait_for
+from pathlib import Path
+
+##############################################################################
+# Textual imports.
+from textual import on, work
+from textual.events import Mount
+
+##############################################################################
+# Local imports.
+from .file_open import BaseFileOpen
+from .parts import DirectoryNavigation
+
+
+##############################################################################
+class MultiFileOpen(BaseFileOpen[list[Path]]):
+    """A file opening dialog that lets the user choose more than one file.
+
+    The user marks the files they want to open (see
+    [`multi_select`][textual_fspicker.parts.DirectoryNavigation.multi_select]),
+    moving between directories as they go, and then confirms the choice;
+    any file named in the input is chosen along with the marked files. The
+    dialog hands back the list of chosen files, in the order in which they
+    were marked.
+    """
+
+    ERROR_ALL_FILES_MUST_EXIST = "All of the chosen files must exist"
+    """An error to show a user when all of the chosen files must exist."""
+
+    @on(Mount)
+    def _allow_marking(self) -> None:
+        """Allow files to be marked once the DOM is ready."""
+        self.query_one(DirectoryNavigation).multi_select = True
+
+    def _reopened(self) -> None:
+        """Get the dialog ready to be used again, after it has been reopened."""
+        super()._reopened()
+        self.query_one(DirectoryNavigation).clear_marks()
+
+    def _should_return(self, candidate: Path) -> bool:
+        """Perform the final checks on the chosen file.
+
+        Args:
+            candidate: The file to check.
+
+        Returns:
+            `True`, always.
+
+        The final checks are made on all of the chosen files together,
+        once the choice has been confirmed.
+        """
+        del candidate
+        return True
+
+    def _nothing_chosen(self) -> None:
+        """Handle the user confirming without having typed a file name."""
+        if marked := self.query_one(DirectoryNavigation).marked:
+            self._check_chosen(marked)
+        else:
+            super()._nothing_chosen()
+
+    def _return(self, chosen: Path) -> None:
+        """Check the chosen files, and hand them back if they pass.
+
+        Args:
+            chosen: The file that was named in the input.
+        """
+        self._check_chosen(
+            list(dict.fromkeys((*self.query_one(DirectoryNavigation).marked, chosen)))
+        )
+
+    def _check_chosen(self, chosen: list[Path]) -> None:
+        """Start the final checks on all of the chosen files.
+
+        Args:
+            chosen: The files that were chosen.
+
+        The dialog shows that it is confirming the choice from now until
+        the checks are done, so a second confirmation can't be made while
+        they are running.
+        """
+        self._set_confirming(True)
+        self._confirm_chosen(chosen)
+
+    async def _all_exist(self, chosen: list[Path]) -> bool:
+        """Do all of the chosen files exist?
+
+        Args:
+            chosen: The files that were chosen.
+
+        Returns:
+            `True` if every chosen file exists, `False` if not.
+        """
+        navigation = self.query_one(DirectoryNavigation)
+        if navigation.is_async:
+            found = await gather(*(navigation.details_of(file) for file in chosen))
+            return all(
+                details.is_dir or details.is_file or details.is_link
+                for details in found
+            )
+        return await to_thread(lambda: all(file.exists() for file in chosen))
+
+    @work(exclusive=True, group="check")
+    async def _confirm_chosen(self, chosen: list[Path]) -> None:
+        """Make the final checks on all of the chosen files.
+
+        Args:
+            chosen: The files that were chosen.
+
+        All of the files are checked in a single pass, away from the UI, so
+        that checking dozens of files on a slow filesystem doesn't hold it
+        up; the checks are given up on if they take longer than
+        [`CONFIRM_TIMEOUT`][textual_fspicker.file_dialog.BaseFileDialog.CONFIRM_TIMEOUT].
+        """
+        try:
+            exist = not self._must_exist or await wait_for(
+                self._all_exist(chosen), self.CONFIRM_TIMEOUT
+            )
+        except AsyncTimeoutError:
+            error = self.ERROR_CONFIRM_TIMED_OUT
+        except PermissionError:
+            error = self.ERROR_PERMISSION_ERROR
+        else:
+            error = "" if exist else self.ERROR_ALL_FILES_MUST_EXIST
+        self._set_confirming(False)
+        if error:
+            self._set_error(error)
+        else:
+            self.dismiss(result=chosen)
+
+
+### multi_file_open.py ends here
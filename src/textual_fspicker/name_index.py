@@ -0,0 +1,249 @@
+"""Provides a sorted index of names, for fast lookups by prefix.
+
+A [`NameIndex`][textual_fspicker.name_index.NameIndex] is built once from a
+collection of names, and can then find the names that start with a given
+prefix with a binary search, rather than by looking at every name in turn.
+
+[`DirectoryNames`][textual_fspicker.name_index.DirectoryNames] keeps a cache
+of such indexes, one per directory, each of which is thrown away as soon as
+the directory it was made from changes.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from threading import Lock
+from typing import Final, Generic, TypeVar
+
+##############################################################################
+IndexedT = TypeVar("IndexedT")
+"""The type of the values held in the index."""
+
+##############################################################################
+DEFAULT_DIRECTORY_CACHE_SIZE: Final[int] = 64
+"""The default number of directories to keep the names of."""
+
+
+##############################################################################
+class NameIndex(Generic[IndexedT]):
+    """A sorted index of names."""
+
+    def __init__(
+        self, names: Iterable[tuple[str, IndexedT]], case_sensitive: bool = False
+    ) -> None:
+        """Initialise the index.
+
+        Args:
+            names: Pairs of names and the values to index them against.
+            case_sensitive: Should lookups be case-sensitive?
+        """
+        self._case_sensitive = case_sensitive
+        """Are lookups case-sensitive?"""
+        ordered = sorted(
+            ((self._fold(name), name, value) for name, value in names),
+            key=lambda item: item[:2],
+        )
+        self._keys = [key for key, _, _ in ordered]
+        """The sorted keys of the index."""
+        self._names = [name for _, name, _ in ordered]
+        """The names, in the same order as the keys."""
+        self._values = [value for _, _, value in ordered]
+        """The values, in the same order as the keys."""
+
+    def _fold(self, name: str) -> str:
+        """Fold a name into the form used as a key.
+
+        Args:
+            name: The name to fold.
+
+        Returns:
+            The key for the name.
+        """
+        return name if self._case_sensitive else name.casefold()
+
+    def __len__(self) -> int:
+        """The number of names in the index."""
+        return len(self._keys)
+
+    def _matches(self, prefix: str) -> Iterator[int]:
+        """Find the positions of the names that start with a prefix.
+
+        Args:
+            prefix: The prefix to look for.
+
+        Yields:
+            The position within the index of each match, in sorted order.
+        """
+        prefix = self._fold(prefix)
+        position = bisect_left(self._keys, prefix)
+        while position < len(self._keys) and self._keys[position].startswith(prefix):
+            yield position
+            position += 1
+
+    def first(self, prefix: str) -> IndexedT | None:
+        """Find the value for the first name that starts with a prefix.
+
+        Args:
+            prefix: The prefix to look for.
+
+        Returns:
+            The value for the first name, in sorted order, that starts with
+                the prefix, or `None` if there is no such name.
+        """
+        return next(
+            (self._values[position] for position in self._matches(prefix)), None
+        )
+
+    def values(self, prefix: str) -> Iterator[IndexedT]:
+        """Find the values for the names that start with a prefix.
+
+        Args:
+            prefix: The prefix to look for.
+
+        Yields:
+            The value for each name that starts with the prefix, in sorted
+                order.
+        """
+        for position in self._matches(prefix):
+            yield self._values[position]
+
+    def names(self, prefix: str) -> Iterator[str]:
+        """Find the names that start with a prefix.
+
+        Args:
+            prefix: The prefix to look for.
+
+        Yields:
+            Each name that starts with the prefix, in sorted order.
+        """
+        for position in self._matches(prefix):
+            yield self._names[position]
+
+
+##############################################################################
+class DirectoryNames:
+    """A cache of the names of the entries in directories.
+
+    The names of each directory are held in a case-sensitive
+    [`NameIndex`][textual_fspicker.name_index.NameIndex], along with the
+    modification time of the directory at the time the names were listed;
+    if the directory has been modified since, the names are listed again.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_DIRECTORY_CACHE_SIZE) -> None:
+        """Initialise the cache.
+
+        Args:
+            cache_size: The maximum number of directories to keep the names of.
+        """
+        self._cache_size = cache_size
+        """The maximum number of directories to keep the names of."""
+        self._indexes: dict[Path, tuple[int, NameIndex[str]]] = {}
+        """The index of names for each directory, with its modification time."""
+        self._lock = Lock()
+        """Lock for updating the cache."""
+
+    @staticmethod
+    def modified(directory: Path) -> int | None:
+        """Get the modification time of a directory.
+
+        Args:
+            directory: The directory to look at.
+
+        Returns:
+            The modification time of the directory, in nanoseconds, or
+                `None` if it couldn't be found.
+        """
+        try:
+            return directory.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def modified_at(mtime: float) -> int | None:
+        """Convert a modification time into the form used by the cache.
+
+        Args:
+            mtime: The modification time, in seconds since the epoch.
+
+        Returns:
+            The modification time, in nanoseconds, or `None` if the time
+                isn't known.
+
+        This is for directories whose details come from somewhere other
+        than [`stat`][os.stat], such as a listing backend.
+        """
+        return round(mtime * 1_000_000_000) or None
+
+    def remember(
+        self, directory: Path, modified: int, names: Iterable[str]
+    ) -> NameIndex[str]:
+        """Remember the names of the entries in a directory.
+
+        Args:
+            directory: The directory the names were listed from.
+            modified: The modification time of the directory from before
+                the names were listed.
+            names: The names of all of the entries in the directory.
+
+        Returns:
+            The index of the names.
+        """
+        index = NameIndex(((name, name) for name in names), case_sensitive=True)
+        with self._lock:
+            self._indexes.pop(directory, None)
+            while len(self._indexes) >= self._cache_size:
+                del self._indexes[next(iter(self._indexes))]
+            self._indexes[directory] = (modified, index)
+        return index
+
+    def cached(self, directory: Path, modified: int) -> NameIndex[str] | None:
+        """Get the cached index of the names of the entries in a directory.
+
+        Args:
+            directory: The directory to get the names for.
+            modified: The current modification time of the directory.
+
+        Returns:
+            The index of the names, or `None` if they aren't cached or the
+                directory has been modified since they were listed.
+        """
+        if (cached := self._indexes.get(directory)) is not None and (
+            cached[0] == modified
+        ):
+            return cached[1]
+        return None
+
+    def names(self, directory: Path) -> NameIndex[str] | None:
+        """Get the index of the names of the entries in a directory.
+
+        Args:
+            directory: The directory to get the names for.
+
+        Returns:
+            The index of the names, or `None` if the directory couldn't be
+                read.
+        """
+        if (modified := self.modified(directory)) is None:
+            return None
+        if (cached := self.cached(directory, modified)) is not None:
+            return cached
+        try:
+            names = [entry.name for entry in directory.iterdir()]
+        except OSError:
+            return None
+        return self.remember(directory, modified, names)
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._indexes.clear()
+
+
+### name_index.py ends here
@@ -5,9 +5,17 @@
 from .current_directory import CurrentDirectory
 from .directory_navigation import DirectoryNavigation
 from .drive_navigation import DriveNavigation
+from .file_preview import FilePreview
+from .search_results import SearchResults
 
 ##############################################################################
 # Export public items.
-__all__ = ["CurrentDirectory", "DirectoryNavigation", "DriveNavigation"]
+__all__ = [
+    "CurrentDirectory",
+    "DirectoryNavigation",
+    "DriveNavigation",
+    "FilePreview",
+    "SearchResults",
+]
 
 ### __init__.py ends here
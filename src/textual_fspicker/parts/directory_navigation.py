@@ -6,15 +6,20 @@ from __future__ import annotations
 
 ##############################################################################
 # Python imports.
-from collections.abc import Iterable
+from asyncio import gather, to_thread
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
-from typing import ClassVar, Final, NamedTuple
+from heapq import heappush, heapreplace
+from pathlib import Path, PosixPath, WindowsPath
+from time import monotonic
+from typing import ClassVar, Final, NamedTuple, cast
 
 ##############################################################################
 # Rich imports.
-from rich.console import RenderableType
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.measure import Measurement
+from rich.segment import Segment
 from rich.style import Style
 from rich.table import Table
 from rich.text import Text
@@ -30,10 +35,30 @@ from textual.worker import get_current_worker
 
 ##############################################################################
 # Local imports.
-from ..icons import Icons
-from ..path_filters import Filter
+from ..archives import ArchivePath
+from ..directory_sizes import DirectorySize, DirectorySizer
+from ..entry_details import EntryDetails
+from ..filter_evaluation import FilterEvaluator
+from ..fuzzy_match import FuzzyNarrowing
+from ..icons import Icons, LazyIcon
+from ..ignore_rules import IgnoreRules
+from ..link_resolver import LinkLoopError, LinkResolver
+from ..listing_backends import (
+    DEFAULT_FLAT_DEPTH,
+    AsyncListingBackend,
+    FlatListing,
+    ListedEntry,
+    ListingBackend,
+    PathListing,
+    backend_for,
+    is_async_backend,
+)
+from ..listing_cache import ListingCache
+from ..name_index import DirectoryNames, NameIndex
+from ..path_filters import Filter, FilterNeeds
 from ..path_maker import MakePath
-from ..safe_tests import is_dir, is_file, is_symlink
+from ..safe_tests import is_file
+from ..sort_modes import SortKey, SortMode
 
 
 ##############################################################################
@@ -53,21 +78,177 @@ class DirectoryEntryStyling(NamedTuple):
     """Styling for a time."""
 
 
+##############################################################################
+class _Mark:
+    """The mark shown against a directory entry, if it is marked.
+
+    The mark is worked out when the entry is rendered, so an entry whose
+    mark changes while it's not on display is right when it's shown again.
+    """
+
+    def __init__(self, entry: DirectoryEntry) -> None:
+        """Initialise the mark.
+
+        Args:
+            entry: The entry the mark is for.
+        """
+        self._entry = entry
+        """The entry the mark is for."""
+
+    def __rich__(self) -> RenderableType:
+        """Render the mark.
+
+        Returns:
+            The mark, if the entry is marked.
+        """
+        return DirectoryEntry.MARK_ICON if self._entry.marked else ""
+
+
+##############################################################################
+class _Prompt:
+    """The prompt of a directory entry, rendered once for any given width.
+
+    Replacing the prompt of any one option makes the option list measure
+    every option again, which means rendering each of them; so the
+    rendering of the prompt is kept, and only done again if the width it
+    is rendered to, or the mark of the entry, changes.
+    """
+
+    def __init__(self, entry: DirectoryEntry, row: Table) -> None:
+        """Initialise the prompt.
+
+        Args:
+            entry: The entry the prompt is for.
+            row: The row that makes up the prompt.
+        """
+        self._entry = entry
+        """The entry the prompt is for."""
+        self._row = row
+        """The row that makes up the prompt."""
+        self._rendered: tuple[tuple[int, bool], list[Segment]] | None = None
+        """The last rendering of the row, along with the width and mark it was for."""
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        """Render the prompt.
+
+        Args:
+            console: The console being rendered to.
+            options: The options for the rendering.
+
+        Yields:
+            The segments that make up the prompt.
+        """
+        key = (options.max_width, self._entry.marked)
+        if self._rendered is None or self._rendered[0] != key:
+            self._rendered = (key, list(console.render(self._row, options)))
+        yield from self._rendered[1]
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        """Measure the prompt.
+
+        Args:
+            console: The console being measured for.
+            options: The options for the measurement.
+
+        Returns:
+            The measurement of the prompt.
+        """
+        return Measurement.get(console, options, self._row)
+
+
 ##############################################################################
 class DirectoryEntry(Option):
     """A directory entry for the `DirectoryNavigation` class."""
 
-    LINK_ICON: Final[Text] = Text.from_markup(":link:")
+    LINK_ICON = LazyIcon(":link:")
     """The icon to use for links."""
 
-    def __init__(self, location: Path, styles: DirectoryEntryStyling) -> None:
-        self.location: Path = location.absolute()
+    LINK_LOOP_ICON = LazyIcon(":repeat:")
+    """The icon to use for links that loop."""
+
+    MARK_ICON: Final[Text] = Text("✓", style="bold")
+    """The icon to use for entries that are marked."""
+
+    def __init__(
+        self, details: EntryDetails, styles: DirectoryEntryStyling, marked: bool = False
+    ) -> None:
+        """Initialise the directory entry.
+
+        Args:
+            details: The details of the entry.
+            styles: The styles to use when rendering the entry.
+            marked: Is the entry marked?
+        """
+        self.details = details
+        """The details of this directory entry."""
+        self.location: Path = details.location.absolute()
         """The location of this directory entry."""
+        self.is_link_loop = (
+            details.is_link
+            and not (details.is_dir or details.is_file)
+            and DirectoryNavigation.links.is_loop(self.location)
+        )
+        """Is this entry a symbolic link that loops?"""
+        self.total: DirectorySize | None = None
+        """The total size of the content of this entry, if it is a directory that has been measured."""
+        self.marked = marked
+        """Is this entry marked?"""
+        self._sort_keys: dict[SortMode, SortKey] = {}
+        """The sort keys that have been made for this entry."""
         self._styles = styles
-        super().__init__(self._as_renderable(location))
+        super().__init__(self._as_renderable(details.location))
+
+    @property
+    def name(self) -> str:
+        """The name of this directory entry."""
+        return self.details.name
+
+    @property
+    def is_dir(self) -> bool:
+        """Is this entry a directory?"""
+        return self.details.is_dir
+
+    def sort_key(self, mode: SortMode) -> SortKey:
+        """Get the sort key for this entry.
 
-    @classmethod
-    def _name(cls, location: Path) -> Text:
+        Args:
+            mode: The sort mode to get the key for.
+
+        Returns:
+            The sort key.
+
+        The key for any given mode is only made once, and is then reused
+        every time the entries are sorted in that mode. Once the total size
+        of a directory is known, that is the size it is sorted by.
+        """
+        try:
+            return self._sort_keys[mode]
+        except KeyError:
+            key = self._sort_keys[mode] = mode.key(
+                self.details
+                if self.total is None
+                else self.details._replace(size=self.total.size)
+            )
+            return key
+
+    def measured(self, total: DirectorySize) -> RenderableType:
+        """Record the total size of the content of this entry.
+
+        Args:
+            total: The total size of the content of the entry.
+
+        Returns:
+            The renderable for the entry, updated to show the total size.
+        """
+        self.total = total
+        self._sort_keys.clear()
+        return self._as_renderable(self.details.location)
+
+    def _name(self, location: Path) -> Text:
         """Get a formatted name for the given location.
 
         Args:
@@ -76,24 +257,29 @@ class DirectoryEntry(Option):
         Returns:
             The formatted name.
         """
-        return Text.assemble(
-            location.name, " ", cls.LINK_ICON if is_symlink(location) else ""
+        if self.is_link_loop:
+            return Text.assemble(self.name, " ", self.LINK_LOOP_ICON)
+        name = Text.assemble(
+            self.name, " ", self.LINK_ICON if self.details.is_link else ""
         )
+        if self.total is not None:
+            name.rstrip()
+            name.append(
+                f" ({self.total.items:,} item{'' if self.total.items == 1 else 's'})",
+                style="dim",
+            )
+        return name
 
     @staticmethod
-    def _mtime(location: Path) -> str:
-        """Get a formatted modification time for the given location.
+    def _mtime(mtime: float) -> str:
+        """Get a formatted modification time.
 
         Args:
-            location: The location to get the modification time for.
+            mtime: The modification time to format.
 
         Returns:
             The formatted modification time, to the nearest second.
         """
-        try:
-            mtime = location.stat().st_mtime
-        except FileNotFoundError:
-            mtime = 0
         try:
             mdatetime = datetime.fromtimestamp(int(mtime))
         except OSError:
@@ -106,21 +292,17 @@ class DirectoryEntry(Option):
         return mdatetime.isoformat().replace("T", " ")
 
     @staticmethod
-    def _size(location: Path) -> str:
-        """Get a formatted size for the given location.
+    def _size(size: int) -> str:
+        """Get a formatted size.
 
         Args:
-            location: The location to get the size for.
+            size: The size to format.
 
         Returns:
             The formatted size.
         """
-        try:
-            entry_size = location.stat().st_size
-        except FileNotFoundError:
-            entry_size = 0
         # TODO: format well for a file browser.
-        return str(entry_size)
+        return str(size)
 
     def _style(self, base: Style, location: Path) -> Style:
         """Decide the best style to use.
@@ -174,14 +356,129 @@ class DirectoryEntry(Option):
         )
         prompt.add_column(no_wrap=True, width=1)
         prompt.add_row(
-            "",
-            Icons.best_for(location),
+            _Mark(self),
+            Icons.best_for(location, self.details.is_dir),
             self._name(location),
-            self._size(location),
-            self._mtime(location),
+            self._size(self.details.size if self.total is None else self.total.size),
+            self._mtime(self.details.mtime),
             "",
         )
-        return prompt
+        return _Prompt(self, prompt)
+
+
+##############################################################################
+class _Ranked:
+    """Wrapper for ranking an entry within the first page of a display."""
+
+    __slots__ = ("entry", "_key", "_reverse")
+
+    def __init__(self, entry: DirectoryEntry, mode: SortMode, reverse: bool) -> None:
+        """Initialise the ranked entry.
+
+        Args:
+            entry: The entry being ranked.
+            mode: The sort mode being used.
+            reverse: Is the sort being done in reverse?
+        """
+        self.entry = entry
+        """The entry being ranked."""
+        self._key = entry.sort_key(mode)
+        """The sort key for the entry."""
+        self._reverse = reverse
+        """Is the sort being done in reverse?"""
+
+    def __lt__(self, other: _Ranked) -> bool:
+        """Does this entry rank below the other entry?
+
+        Args:
+            other: The other entry.
+
+        Returns:
+            `True` if this entry would be displayed after the other entry.
+
+        Note:
+            The ordering is deliberately the opposite of the display order,
+            so that the top of a heap of these is the entry that is next in
+            line to fall off the first page.
+        """
+        if self.entry.is_dir != other.entry.is_dir:
+            return other.entry.is_dir
+        if self._reverse:
+            return self._key < other._key
+        return other._key < self._key
+
+
+##############################################################################
+class _FirstPage:
+    """Keeps track of the entries that belong on the first page of a display."""
+
+    def __init__(self, size: int, mode: SortMode, reverse: bool, sort: bool) -> None:
+        """Initialise the first page.
+
+        Args:
+            size: The number of entries that fit on the page.
+            mode: The sort mode being used.
+            reverse: Is the sort being done in reverse?
+            sort: Is the display being sorted at all?
+        """
+        self._size = size
+        """The number of entries that fit on the page."""
+        self._mode = mode
+        """The sort mode being used."""
+        self._reverse = reverse
+        """Is the sort being done in reverse?"""
+        self._sort = sort
+        """Is the display being sorted at all?"""
+        self._heap: list[_Ranked] = []
+        """The heap of entries on the page, if sorting; the top is the lowest ranked."""
+        self._arrived: list[DirectoryEntry] = []
+        """The entries on the page, if not sorting, in the order they arrived."""
+        self.changed = False
+        """Has the page changed since it was last shown?"""
+
+    def offer(self, entry: DirectoryEntry) -> None:
+        """Offer an entry up for a place on the first page.
+
+        Args:
+            entry: The entry to offer.
+        """
+        if not self._sort:
+            # Without sorting, the display is in the order the entries
+            # arrive in, so the first page is simply the first to arrive.
+            if len(self._arrived) < self._size:
+                self._arrived.append(entry)
+                self.changed = True
+        elif len(self._heap) < self._size:
+            heappush(self._heap, _Ranked(entry, self._mode, self._reverse))
+            self.changed = True
+        elif self._heap[0] < (candidate := _Ranked(entry, self._mode, self._reverse)):
+            heapreplace(self._heap, candidate)
+            self.changed = True
+
+    @property
+    def entries(self) -> list[DirectoryEntry]:
+        """The entries on the page, in display order."""
+        self.changed = False
+        if self._sort:
+            return [ranked.entry for ranked in sorted(self._heap, reverse=True)]
+        return list(self._arrived)
+
+
+##############################################################################
+class _Fetched(NamedTuple):
+    """A directory listing that was fetched with an async backend."""
+
+    location: Path
+    """The location that was listed."""
+
+    entries: list[ListedEntry]
+    """The entries in the location."""
+
+    modified: int | None
+    """The modification time of the location, in nanoseconds, if known."""
+
+    parent: EntryDetails | None
+    """The details of the parent of the location, if it has one."""
 
 
 ##############################################################################
@@ -195,8 +492,17 @@ class DirectoryNavigation(OptionList):
 
     BINDINGS = [
         ("backspace", "navigate_up"),
+        ("space", "toggle_mark"),
+        ("shift+space", "mark_range"),
+        ("shift+up", "mark_up"),
+        ("shift+down", "mark_down"),
     ]
 
+    MARKING_ACTIONS: Final[frozenset[str]] = frozenset(
+        ("toggle_mark", "mark_range", "mark_up", "mark_down")
+    )
+    """The actions that are only available when marking is allowed."""
+
     COMPONENT_CLASSES: ClassVar[set[str]] = {
         "directory-navigation--hidden",
         "directory-navigation--name",
@@ -210,6 +516,11 @@ class DirectoryNavigation(OptionList):
         border: blank;
     }
 
+    DirectoryNavigation.-stale {
+        border-subtitle-color: $text-muted;
+        border-subtitle-style: italic;
+    }
+
     DirectoryNavigation > .directory-navigation--hidden {
         color: $text-muted;
         text-style: italic;
@@ -260,6 +571,51 @@ class DirectoryNavigation(OptionList):
     class PermissionError(_PathMessage):
         """Message sent when there's a permission problem with a path."""
 
+    class LinkLoop(_PathMessage):
+        """Message sent when a selected symbolic link turns out to loop."""
+
+    links: ClassVar[LinkResolver] = LinkResolver()
+    """The resolver used to resolve symbolic links.
+
+    This is shared between all instances of the widget so that the work of
+    following links carries over from one dialog to the next.
+    """
+
+    filter_evaluator: ClassVar[FilterEvaluator] = FilterEvaluator()
+    """The evaluator used to run expensive filters.
+
+    This is shared between all instances of the widget so that the results
+    of expensive filters carry over from one dialog to the next.
+    """
+
+    directory_names: ClassVar[DirectoryNames] = DirectoryNames()
+    """The cache of the names of the entries in directories that have been loaded.
+
+    This is shared between all instances of the widget, and with
+    [`SuggestPath`][textual_fspicker.suggest_path.SuggestPath], so that
+    suggestions for the directory being looked at come straight from what
+    was loaded.
+    """
+
+    directory_sizer: ClassVar[DirectorySizer] = DirectorySizer()
+    """The sizer used to work out the total size of directories.
+
+    This is shared between all instances of the widget so that the sizes of
+    directories carry over from one dialog to the next.
+    """
+
+    FILTER_STREAM_INTERVAL: ClassVar[float] = 0.1
+    """How often, in seconds, to stream the results of an expensive filter."""
+
+    FIRST_PAGE_INTERVAL: ClassVar[float] = 0.1
+    """How often, in seconds, to refresh the first page when loading early."""
+
+    MEASURE_STREAM_INTERVAL: ClassVar[float] = 0.1
+    """How often, in seconds, to stream the total sizes of directories."""
+
+    TYPE_AHEAD_TIMEOUT: ClassVar[float] = 1.0
+    """How long, in seconds, a pause in typing has to be to start a new search."""
+
     _location: var[Path] = var[Path](MakePath.of(".").absolute(), init=False)
     """The current location for the directory."""
 
@@ -275,24 +631,151 @@ class DirectoryNavigation(OptionList):
     sort_display: var[bool] = var(True)
     """Should the display be sorted?"""
 
+    sort_mode: var[SortMode] = var(SortMode.NAME)
+    """The mode to use when sorting the display."""
+
+    sort_reverse: var[bool] = var(False)
+    """Should the display be sorted in reverse?
+
+    Note:
+        Directories are always shown before files, regardless of the
+        direction of the sort.
+    """
+
+    ignore_rules: var[IgnoreRules | None] = var[IgnoreRules | None](None, init=False)
+    """The rules for entries that should be ignored when loading a directory."""
+
+    narrow: var[str] = var("")
+    """A query to narrow the display down to the entries that fuzzy-match it.
+
+    When this isn't empty only the entries whose names contain all of the
+    characters of the query, in order and ignoring case, are shown; they
+    are ranked so that the closest matches come first. Narrowing is applied
+    on top of any file filter, and is cleared when the location changes.
+    """
+
+    early_first_page: var[bool] = var(True)
+    """Should the first page of a directory be shown before it's fully loaded?
+
+    When this is `True`, and a directory takes a while to load, the first
+    page's worth of entries (in the correct sorted position) is shown while
+    the load is still going on; the rest of the entries are merged in once
+    the load has finished. A directory that loads quickly is simply shown
+    once it has loaded.
+    """
+
+    measure_directories: var[bool] = var(False)
+    """Should the total size of the content of directories be worked out?
+
+    When this is `True` the tree below each directory in the display is
+    walked in the background, and the total size and number of entries
+    within are filled in as they become known. When sorting by size,
+    directories are sorted by their total size.
+    """
+
+    browse_archives: var[bool] = var(False, init=False)
+    """Should zip and tar archives be browsed as if they were directories?
+
+    When this is `True` archives are shown as directories, and the members
+    of an archive can be browsed and selected without the archive being
+    extracted; see [`ArchivePath`][textual_fspicker.archives.ArchivePath]
+    for the details. Archives are only browsed on the local filesystem.
+    """
+
+    listing_backend: var[ListingBackend | AsyncListingBackend | None] = var[
+        ListingBackend | AsyncListingBackend | None
+    ](None, init=False)
+    """The backend used to list directories.
+
+    If this is `None` the best backend for the current location is used;
+    see [`backend_for`][textual_fspicker.listing_backends.backend_for].
+
+    If this is an
+    [`AsyncListingBackend`][textual_fspicker.listing_backends.AsyncListingBackend]
+    the listing and the lookups that go with it are awaited on the
+    application's event loop, and a listing that is no longer wanted is
+    cancelled; only the work of turning the listing into entries for the
+    display is done in a thread.
+    """
+
+    flat_view: var[bool] = var(False, init=False)
+    """Should the whole tree below the current location be shown as one list?
+
+    When this is `True` every file below the current location, down to
+    [`flat_depth`][textual_fspicker.parts.DirectoryNavigation.flat_depth]
+    levels, is listed, named for its path relative to the current location;
+    if files aren't being shown, every directory is listed instead. The
+    filter and the hidden and ignore settings apply as they do to a normal
+    listing. See [`FlatListing`][textual_fspicker.listing_backends.FlatListing]
+    for the details. The flat view is only available on the local
+    filesystem.
+    """
+
+    flat_depth: var[int] = var(DEFAULT_FLAT_DEPTH, init=False)
+    """How many levels below the current location the flat view goes."""
+
+    multi_select: var[bool] = var(False)
+    """Can files be marked, so that more than one of them can be chosen?
+
+    When this is `True` the user can mark and unmark the highlighted file
+    with <kbd>space</kbd>, mark every file between the last one marked and
+    the highlighted entry with <kbd>shift</kbd>+<kbd>space</kbd>, and mark
+    files as they move with <kbd>shift</kbd>+<kbd>up</kbd> and
+    <kbd>shift</kbd>+<kbd>down</kbd>. Marks are kept as the user moves from
+    one directory to another; see
+    [`marked`][textual_fspicker.parts.DirectoryNavigation.marked].
+    """
+
     def __init__(
         self,
         location: Path | str = ".",
         double_click_directories: bool = True,
+        ignore_rules: IgnoreRules | None = None,
+        listing_cache: ListingCache | None = None,
+        listing_backend: ListingBackend | AsyncListingBackend | None = None,
     ) -> None:
         """Initialise the directory navigation widget.
 
         Args:
             location: The starting location.
+            double_click_directories: Double click to open directories.
+            ignore_rules: Optional rules for entries that should be ignored.
+            listing_cache: Optional cache of directory listings to show
+                while directories load.
+            listing_backend: Optional backend to list directories with.
         """
         super().__init__()
+        self.set_reactive(DirectoryNavigation.ignore_rules, ignore_rules)
+        self.set_reactive(DirectoryNavigation.listing_backend, listing_backend)
         self.location = MakePath.of(location).expanduser().absolute()
         self._entries: list[DirectoryEntry] = []
         """The entries in the list of directories."""
+        self._set_aside = False
+        """Were files left out of the entries because the filter ruled out their names?"""
         self._double_click_directories = double_click_directories
         """Should the user need to double-click to select a directory with the mouse?"""
         self._open_directory = False
         """Flag to track if a directory should be opened."""
+        self._listing_cache = listing_cache
+        """The cache of directory listings, if there is one."""
+        self._parent_details: EntryDetails | None = None
+        """The details of the parent of the current location, once looked up."""
+        self._loaded_names: NameIndex[DirectoryEntry] | None = None
+        """The index of the names of the loaded entries, once loading has finished."""
+        self._positions: dict[DirectoryEntry, int] | None = None
+        """Where each entry is in the display, worked out when first needed."""
+        self._type_ahead = ""
+        """The text typed so far when jumping to an entry by name."""
+        self._type_ahead_at = 0.0
+        """The time at which the last character was typed ahead."""
+        self._narrowing = FuzzyNarrowing()
+        """The fuzzy narrowing of the names in the current directory."""
+        self._narrowed: dict[str, int] | None = None
+        """The scores of the entries that survive narrowing, if narrowing."""
+        self._marked: dict[Path, None] = {}
+        """The locations of the marked files, in the order they were marked."""
+        self._mark_anchor: int | None = None
+        """The index of the entry that a range of marks starts from."""
 
     @property
     def location(self) -> Path:
@@ -316,6 +799,98 @@ class DirectoryNavigation(OptionList):
         if self.highlighted is None:
             self.highlighted = 0
 
+    @property
+    def _browsed(self) -> Path:
+        """The current location, as it should be browsed."""
+        if self.browse_archives and isinstance(
+            self._location, (PosixPath, WindowsPath)
+        ):
+            return ArchivePath(self._location)
+        return self._location
+
+    @property
+    def _backend(self) -> ListingBackend | AsyncListingBackend:
+        """The backend to list the current location with."""
+        return self.listing_backend or backend_for(self._location)
+
+    @property
+    def _flat(self) -> bool:
+        """Is the current location being shown as a flat view?"""
+        return self.flat_view and isinstance(self._location, (PosixPath, WindowsPath))
+
+    @property
+    def _local(self) -> bool:
+        """Is the current location being listed from the local filesystem?"""
+        return isinstance(self._backend, PathListing) and isinstance(
+            self._location, (PosixPath, WindowsPath)
+        )
+
+    def _modified(self, location: Path) -> int | None:
+        """Get the modification time of a location, for the cache of names.
+
+        Args:
+            location: The location to look at.
+
+        Returns:
+            The modification time of the location, in nanoseconds, if known.
+
+        A location on the local filesystem is looked at directly; anywhere
+        else the listing backend is asked for its details, so that it is
+        looked at on the same filesystem that it is listed from.
+        """
+        if self._local:
+            return self.directory_names.modified(location)
+        return self.directory_names.modified_at(
+            cast(ListingBackend, self._backend).details(location).mtime
+        )
+
+    @property
+    def is_async(self) -> bool:
+        """Is the current location being listed with an async backend?"""
+        return is_async_backend(self._backend)
+
+    def _parent_entry(self, styles: DirectoryEntryStyling) -> DirectoryEntry:
+        """Make the entry for the parent of the current location.
+
+        Args:
+            styles: The styles to use when rendering the entry.
+
+        Returns:
+            The entry for the parent.
+
+        The details of the parent are only looked up once for any given
+        location. With an async backend they're looked up along with the
+        listing; until then the parent is simply taken to be a directory.
+        """
+        parent = self._browsed / ".."
+        if self._parent_details is None or self._parent_details.location != parent:
+            if is_async_backend(backend := self._backend):
+                return DirectoryEntry(
+                    EntryDetails(parent, "..", True, False, False, 0, 0.0), styles
+                )
+            self._parent_details = (
+                cast(ListingBackend, backend)
+                .details(self._browsed.parent)
+                ._replace(location=parent, name="..")
+            )
+        return DirectoryEntry(self._parent_details, styles)
+
+    async def details_of(self, location: Path) -> EntryDetails:
+        """Get the details of a location, using the current listing backend.
+
+        Args:
+            location: The location to get the details of.
+
+        Returns:
+            The details of the location.
+
+        With an async backend the details are awaited on the event loop;
+        otherwise they're looked up in a thread.
+        """
+        if is_async_backend(backend := self._backend):
+            return await backend.details(location)
+        return await to_thread(cast(ListingBackend, backend).details, location)
+
     @property
     def is_root(self) -> bool:
         """Are we at the root of the filesystem?"""
@@ -336,7 +911,19 @@ class DirectoryNavigation(OptionList):
             I'll extend this to detect hidden files in the most appropriate
             way for the current operating system.
         """
-        return path.name.startswith(".") and path.name != ".."
+        return DirectoryNavigation._is_hidden_name(path.name)
+
+    @staticmethod
+    def _is_hidden_name(name: str) -> bool:
+        """Does the given name appear to be that of a hidden entry?
+
+        Args:
+            name: The name to test.
+
+        Returns:
+            `True` if the name appears to be hidden, `False` if not.
+        """
+        return name.startswith(".") and name != ".."
 
     def hide(self, path: Path) -> bool:
         """Should we hide the given path?
@@ -358,18 +945,209 @@ class DirectoryNavigation(OptionList):
         # passed so far; not do final checks.
         return self.is_hidden(path) and not self.show_hidden
 
+    def _hide_entry(self, entry: DirectoryEntry) -> bool:
+        """Should we hide the given entry?
+
+        Args:
+            entry: The entry to test.
+
+        Returns:
+            `True` if the entry should be hidden, `False` if not.
+
+        Note:
+            This is the same test as
+            [`hide`][textual_fspicker.parts.DirectoryNavigation.hide], but
+            it makes use of what is already known about the entry, and of
+            any name-only test the filter has, to avoid going back to the
+            filesystem.
+        """
+        # Testing for hidden only needs the name, so do that first. Note
+        # that the name tested is that of the entry itself, as in a flat
+        # view the entry is named for its path below the current location.
+        if self._is_hidden_name(entry.location.name) and not self.show_hidden:
+            return True
+        if self._narrowed is not None and entry.name not in self._narrowed:
+            return True
+        if self.file_filter is None or entry.is_dir:
+            return False
+        if self.file_filter.expensive:
+            # Expensive filters are run in the background, so until we know
+            # the result the entry stays hidden.
+            return not self.filter_evaluator.cached(self.file_filter, entry.details)
+        return not self.file_filter.test_details(entry.details)
+
     def action_navigate_up(self) -> None:
         """Navigate to the parent location"""
         self._location = self._location.parent
 
     def _sort(self, entries: Iterable[DirectoryEntry]) -> Iterable[DirectoryEntry]:
-        """Sort the entries as per the value of `sort_display`."""
-        if self.sort_display:
-            return sorted(
-                entries,
-                key=lambda entry: (not is_dir(entry.location), entry.location.name),
+        """Sort the entries as per the value of `sort_display`.
+
+        Args:
+            entries: The entries to sort.
+
+        Returns:
+            The entries, sorted as per `sort_mode` and `sort_reverse`, with
+                directories first.
+        """
+        if not self.sort_display:
+            return entries
+        directories: list[DirectoryEntry] = []
+        files: list[DirectoryEntry] = []
+        for entry in entries:
+            (directories if entry.is_dir else files).append(entry)
+        mode = self.sort_mode
+
+        def key(entry: DirectoryEntry) -> SortKey:
+            return entry.sort_key(mode)
+
+        directories.sort(key=key, reverse=self.sort_reverse)
+        files.sort(key=key, reverse=self.sort_reverse)
+        if (scores := self._narrowed) is not None:
+            # Sorts are stable, so ranking by score keeps entries with the
+            # same score in the order they were just sorted into.
+            directories.sort(key=lambda entry: scores[entry.name], reverse=True)
+            files.sort(key=lambda entry: scores[entry.name], reverse=True)
+        return directories + files
+
+    @property
+    def marked(self) -> list[Path]:
+        """The locations of the marked files, in the order they were marked."""
+        return list(self._marked)
+
+    def clear_marks(self) -> None:
+        """Clear all of the marks."""
+        shown = [
+            index
+            for index in range(self.option_count)
+            if cast(DirectoryEntry, self.get_option_at_index(index)).marked
+        ]
+        self._marked.clear()
+        self._mark_anchor = None
+        self._marks_changed(shown)
+        for entry in self._entries:
+            entry.marked = False
+
+    def _refresh_entries(self, indices: Iterable[int]) -> None:
+        """Refresh the display of some entries whose prompts have changed.
+
+        Args:
+            indices: The indices of the entries to refresh.
+
+        All of the entries are refreshed together, so that the option list
+        only measures its options again, and the display is only updated,
+        the once.
+        """
+        with self.app.batch_update():
+            for index in indices:
+                self.replace_option_prompt_at_index(
+                    index, self.get_option_at_index(index).prompt
+                )
+
+    def _marks_changed(self, indices: Iterable[int]) -> None:
+        """Refresh the display after the marks have changed.
+
+        Args:
+            indices: The indices of the entries whose marks may have changed.
+        """
+        changed: list[int] = []
+        for index in indices:
+            option = cast(DirectoryEntry, self.get_option_at_index(index))
+            if option.marked != (option.location in self._marked):
+                option.marked = not option.marked
+                changed.append(index)
+        self._refresh_entries(changed)
+        self.border_title = f"{len(self._marked):,} marked" if self._marked else ""
+
+    def _set_mark(self, index: int, marked: bool) -> None:
+        """Mark or unmark the entry at a given position in the display.
+
+        Args:
+            index: The index of the entry.
+            marked: Should the entry be marked?
+
+        Only files can be marked; anything else is left alone.
+        """
+        entry = cast(DirectoryEntry, self.get_option_at_index(index))
+        if entry.is_dir or entry.is_link_loop:
+            return
+        if marked:
+            self._marked[entry.location] = None
+        else:
+            self._marked.pop(entry.location, None)
+
+    def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:
+        """Check if an action may run.
+
+        Args:
+            action: The action to check.
+            parameters: The parameters of the action.
+
+        Returns:
+            `True` if the action can run, `False` if not.
+        """
+        if action in self.MARKING_ACTIONS:
+            return self.multi_select
+        return super().check_action(action, parameters)
+
+    def action_toggle_mark(self) -> None:
+        """Toggle the mark on the highlighted entry, and move on."""
+        if (index := self.highlighted) is not None:
+            self._set_mark(
+                index,
+                cast(DirectoryEntry, self.get_option_at_index(index)).location
+                not in self._marked,
             )
-        return entries
+            self._mark_anchor = index
+            self._marks_changed([index])
+            self.action_cursor_down()
+
+    def action_mark_range(self) -> None:
+        """Mark every entry between the last one marked and the highlighted one."""
+        if (index := self.highlighted) is not None:
+            anchor = index if self._mark_anchor is None else self._mark_anchor
+            marking = range(min(anchor, index), max(anchor, index) + 1)
+            for marked in marking:
+                self._set_mark(marked, True)
+            self._marks_changed(marking)
+
+    def _mark_moving(self, move: Callable[[], None]) -> None:
+        """Mark the highlighted entry, move, and mark the new one too.
+
+        Args:
+            move: The function that moves the highlight.
+        """
+        if (before := self.highlighted) is not None:
+            self._set_mark(before, True)
+            move()
+            if (after := self.highlighted) is not None:
+                self._set_mark(after, True)
+                self._mark_anchor = after
+            self._marks_changed(index for index in (before, after) if index is not None)
+
+    def action_mark_up(self) -> None:
+        """Mark entries while moving up."""
+        self._mark_moving(self.action_cursor_up)
+
+    def action_mark_down(self) -> None:
+        """Mark entries while moving down."""
+        self._mark_moving(self.action_cursor_down)
+
+    def cycle_sort_mode(self) -> None:
+        """Switch to the next sort mode."""
+        self.sort_mode = self.sort_mode.next
+
+    def toggle_sort_reverse(self) -> None:
+        """Toggle the direction of the sort."""
+        self.sort_reverse = not self.sort_reverse
+
+    def toggle_measure_directories(self) -> None:
+        """Toggle working out the total size of directories."""
+        self.measure_directories = not self.measure_directories
+
+    def toggle_flat_view(self) -> None:
+        """Toggle showing the tree below the current location as one list."""
+        self.flat_view = not self.flat_view
 
     @property
     def _styles(self) -> DirectoryEntryStyling:
@@ -381,23 +1159,355 @@ class DirectoryNavigation(OptionList):
             self.get_component_rich_style("directory-navigation--time", partial=True),
         )
 
-    def _repopulate_display(self) -> None:
-        """Repopulate the display of directories."""
+    def _repopulate_display(self, evaluate: bool = True) -> None:
+        """Repopulate the display of directories.
+
+        Args:
+            evaluate: Should any pending expensive filtering be started?
+        """
         styles = self._styles
+        self._positions = None
         with self.app.batch_update():
             self.clear_options()
             if not self.is_root:
-                self.add_option(DirectoryEntry(self._location / "..", styles))
+                self.add_option(self._parent_entry(styles))
             self.add_options(
                 self._sort(
-                    entry for entry in self._entries if not self.hide(entry.location)
+                    entry for entry in self._entries if not self._hide_entry(entry)
                 )
             )
         self._settle_highlight()
+        if evaluate:
+            self._start_expensive_filter()
+
+    def _start_expensive_filter(self) -> None:
+        """Start evaluating an expensive filter, if there's work to do."""
+        if self.file_filter is None or not self.file_filter.expensive:
+            return
+        if pending := [
+            entry
+            for entry in self._entries
+            if not entry.is_dir
+            and (self.show_hidden or not self._is_hidden_name(entry.location.name))
+            and self.filter_evaluator.cached(self.file_filter, entry.details) is None
+        ]:
+            self._evaluate_filter(self._location, self.file_filter, pending)
+
+    @work(exclusive=True, thread=True, group="filter")
+    def _evaluate_filter(
+        self, location: Path, file_filter: Filter, entries: list[DirectoryEntry]
+    ) -> None:
+        """Evaluate an expensive filter against some entries.
+
+        Args:
+            location: The location the entries were loaded from.
+            file_filter: The filter to evaluate.
+            entries: The entries to evaluate the filter against.
+
+        Entries that pass the filter are streamed into the display as the
+        results become available.
+        """
+        worker = get_current_worker()
+        candidates = {entry.details: entry for entry in entries}
+        passed: list[DirectoryEntry] = []
+        last_streamed = monotonic()
+        for candidate, result in self.filter_evaluator.evaluate(
+            file_filter, candidates, lambda: worker.is_cancelled
+        ):
+            if result:
+                passed.append(candidates[candidate])
+            if passed and monotonic() - last_streamed >= self.FILTER_STREAM_INTERVAL:
+                self.app.call_from_thread(
+                    self._stream_filtered, location, file_filter, passed
+                )
+                passed = []
+                last_streamed = monotonic()
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._filter_evaluated, location, file_filter)
+
+    def _stream_filtered(
+        self, location: Path, file_filter: Filter, entries: list[DirectoryEntry]
+    ) -> None:
+        """Stream entries that have passed an expensive filter into the display.
+
+        Args:
+            location: The location the entries were loaded from.
+            file_filter: The filter the entries passed.
+            entries: The entries to add to the display.
+        """
+        if location == self._location and file_filter == self.file_filter:
+            self._positions = None
+            self.add_options(self._sort(entries))
+            self._settle_highlight()
+
+    def _filter_evaluated(self, location: Path, file_filter: Filter) -> None:
+        """Finish off the display once an expensive filter has been evaluated.
+
+        Args:
+            location: The location the entries were loaded from.
+            file_filter: The filter that was evaluated.
+        """
+        if location == self._location and file_filter == self.file_filter:
+            # Entries were streamed in as they passed the filter, so now we
+            # repopulate to get everything in the right order.
+            self._repopulate_keeping_highlight(evaluate=False)
+
+    def _start_measuring(self) -> None:
+        """Start working out the total size of directories, if there's work to do."""
+        if not self.measure_directories:
+            return
+        if pending := [
+            entry
+            for entry in self._entries
+            if entry.is_dir and entry.total is None and not entry.is_link_loop
+        ]:
+            self._measure_directories(self._location, pending)
+
+    @work(exclusive=True, thread=True, group="measure")
+    def _measure_directories(
+        self, location: Path, entries: list[DirectoryEntry]
+    ) -> None:
+        """Work out the total size of the content of some directories.
+
+        Args:
+            location: The location the entries were loaded from.
+            entries: The directory entries to measure.
+
+        The sizes are streamed into the display as they become available.
+        """
+        worker = get_current_worker()
+        directories = {entry.location: entry for entry in entries}
+        measured: list[tuple[DirectoryEntry, DirectorySize]] = []
+        last_streamed = monotonic()
+        for directory, total in self.directory_sizer.measure(
+            directories, lambda: worker.is_cancelled
+        ):
+            measured.append((directories[directory], total))
+            if monotonic() - last_streamed >= self.MEASURE_STREAM_INTERVAL:
+                self.app.call_from_thread(self._stream_measured, location, measured)
+                measured = []
+                last_streamed = monotonic()
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._stream_measured, location, measured)
+            self.app.call_from_thread(self._directories_measured, location)
+
+    def _stream_measured(
+        self, location: Path, measured: list[tuple[DirectoryEntry, DirectorySize]]
+    ) -> None:
+        """Stream the total sizes of some directories into the display.
+
+        Args:
+            location: The location the entries were loaded from.
+            measured: The entries along with their total sizes.
+        """
+        if location != self._location or not measured:
+            return
+        updated = {entry.location: entry.measured(total) for entry, total in measured}
+        with self.app.batch_update():
+            for index, option in enumerate(self.options):
+                if (
+                    prompt := updated.get(cast(DirectoryEntry, option).location)
+                ) is not None:
+                    self.replace_option_prompt_at_index(index, prompt)
+
+    def _directories_measured(self, location: Path) -> None:
+        """Finish off the display once the sizes of directories are known.
+
+        Args:
+            location: The location the entries were loaded from.
+        """
+        if (
+            location == self._location
+            and self.sort_display
+            and self.sort_mode == SortMode.SIZE
+        ):
+            # The sizes were streamed in where the directories already
+            # were, so now we repopulate to get everything in size order.
+            self._repopulate_keeping_highlight(evaluate=False)
+
+    def _repopulate_keeping_highlight(self, evaluate: bool = True) -> None:
+        """Repopulate the display, keeping the highlight on the same entry.
+
+        Args:
+            evaluate: Should any pending expensive filtering be started?
+        """
+        highlighted = (
+            None
+            if self.highlighted is None
+            else cast(DirectoryEntry, self.get_option_at_index(self.highlighted))
+        )
+        self._repopulate_display(evaluate=evaluate)
+        if highlighted is not None:
+            for index in range(self.option_count):
+                option = cast(DirectoryEntry, self.get_option_at_index(index))
+                if option.location == highlighted.location:
+                    self.highlighted = index
+                    break
+
+    def _show_first_page(self, location: Path, entries: list[DirectoryEntry]) -> None:
+        """Show the first page of a directory that is still being loaded.
+
+        Args:
+            location: The location the entries were loaded from.
+            entries: The entries that belong on the first page.
+        """
+        if location != self._location:
+            return
+        highlighted = self.highlighted
+        self._positions = None
+        with self.app.batch_update():
+            self.clear_options()
+            if not self.is_root:
+                self.add_option(self._parent_entry(self._styles))
+            self.add_options(entries)
+        if highlighted is not None and highlighted < self.option_count:
+            self.highlighted = highlighted
+        self._settle_highlight()
+
+    def _show_cached(self, location: Path, entries: list[DirectoryEntry]) -> None:
+        """Show the cached listing of a directory that is being loaded.
+
+        Args:
+            location: The location the listing is of.
+            entries: The entries in the cached listing.
+        """
+        if location == self._location:
+            self._show_first_page(location, entries)
+            self._mark_stale(True)
+
+    def _mark_stale(self, stale: bool) -> None:
+        """Mark the display as possibly being out of date, or not.
+
+        Args:
+            stale: Is the display possibly out of date?
+        """
+        self.set_class(stale, "-stale")
+        self.border_subtitle = "Possibly out of date; refreshing..." if stale else ""
 
-    @work(exclusive=True, thread=True)
     def _load(self) -> None:
         """Load the current directory data."""
+        if not self._flat and is_async_backend(backend := self._backend):
+            self._fetch(backend)
+        else:
+            self.workers.cancel_group(self, "fetch")
+            self._load_listing()
+
+    @work(exclusive=True, group="fetch")
+    async def _fetch(self, backend: AsyncListingBackend) -> None:
+        """Fetch the listing of the current location with an async backend.
+
+        Args:
+            backend: The backend to fetch the listing with.
+
+        The listing, the details of the location and the details of its
+        parent are all awaited at once, on the event loop; if the location
+        changes in the meantime this worker is replaced and the fetch is
+        cancelled. What's fetched is then handed on to be loaded.
+        """
+        location = self._location
+        browsed = self._browsed
+        # Make sure nothing that was being loaded before the fetch started
+        # turns up in the meantime.
+        self.workers.cancel_group(self, "default")
+        try:
+            listing, details, parent = await gather(
+                backend.listing(browsed),
+                backend.details(browsed),
+                backend.details(browsed.parent),
+            )
+        except PermissionError:
+            self.post_message(self.PermissionError(self, location))
+            fetched = _Fetched(location, [], None, None)
+        else:
+            fetched = _Fetched(
+                location,
+                listing,
+                self.directory_names.modified_at(details.mtime),
+                None
+                if self.is_root
+                else parent._replace(location=browsed / "..", name=".."),
+            )
+        if location == self._location:
+            self._load_listing(fetched)
+
+    def _listing(self, fetched: _Fetched | None, flat: bool) -> Iterable[ListedEntry]:
+        """Get the listing of the current location.
+
+        Args:
+            fetched: The listing, if it has already been fetched.
+            flat: Should the location be listed as a flat view?
+
+        Returns:
+            The entries in the listing.
+        """
+        if fetched is not None:
+            return fetched.entries
+        if flat:
+            return FlatListing(
+                self.flat_depth,
+                self.show_hidden,
+                self.ignore_rules,
+                not self.show_files,
+            ).listing(self._location)
+        return cast(ListingBackend, self._backend).listing(self._browsed)
+
+    def recheck(self) -> None:
+        """Reload the current directory if it has changed since it was loaded.
+
+        This is for when the widget is shown again after a while, such as
+        when a dialog is reused; the listing that is already showing is
+        kept, along with the highlight, unless the directory has changed.
+        Any work on the listing that was interrupted, such as by a dialog
+        being dismissed, is picked up again.
+
+        Note:
+            Only directories listed with a synchronous backend, outside of
+            a flat view, are checked.
+        """
+        if self._loaded_names is None:
+            # The listing never finished loading.
+            self._load()
+            return
+        if not self._flat and not self.is_async:
+            self._recheck(self._location)
+        self._start_expensive_filter()
+        self._start_measuring()
+
+    @work(exclusive=True, thread=True, group="recheck")
+    def _recheck(self, location: Path) -> None:
+        """Check if a directory has changed since it was loaded.
+
+        Args:
+            location: The location of the directory to check.
+        """
+        if (
+            (modified := self._modified(location)) is None
+            or self.directory_names.cached(location, modified) is None
+        ) and not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._reload, location)
+
+    def _reload(self, location: Path) -> None:
+        """Reload a directory, keeping the highlight.
+
+        Args:
+            location: The location of the directory to reload.
+        """
+        if location == self._location:
+            self._load_listing(keep_highlight=True)
+
+    @work(exclusive=True, thread=True)
+    def _load_listing(
+        self, fetched: _Fetched | None = None, keep_highlight: bool = False
+    ) -> None:
+        """Load the listing of the current directory.
+
+        Args:
+            fetched: The listing of the directory, if it has already been
+                fetched with an async backend.
+            keep_highlight: Should the highlight be kept on the same entry?
+        """
+        if fetched is not None and fetched.location != self._location:
+            return
 
         # Because we might end up slicing and dicing the list, and there's
         # little point in reloading the data from the filesystem again if
@@ -406,34 +1516,301 @@ class DirectoryNavigation(OptionList):
         # parallel copy of *all* possible options for the list and then
         # populate from that.
         self._entries = []
+        self._loaded_names = None
 
         # Now loop over the directory, looking for directories within and
         # streaming them into the list via the app thread.
         worker = get_current_worker()
         styles = self._styles
+        sort_mode = self.sort_mode
+        location = self._location
+        first_page = (
+            _FirstPage(
+                max(self.size.height, 1),
+                sort_mode,
+                self.sort_reverse,
+                self.sort_display,
+            )
+            if self.early_first_page
+            else None
+        )
+        page_shown = False
+        last_shown = monotonic()
+        flat = fetched is None and self._flat
+
+        # If the filter only needs the names of entries, files that it rules
+        # out can be left out of the listing without ever being looked at.
+        file_filter = self.file_filter
+        name_filter = (
+            file_filter.name_tester
+            if file_filter is not None
+            and file_filter.needs == FilterNeeds.NAME
+            and not file_filter.expensive
+            else None
+        )
+        set_aside = False
+
+        # If there's a cached listing for the directory, show that while
+        # the directory is loaded; the display will be brought up to date
+        # once the load has finished.
+        if (
+            self._listing_cache is not None
+            and not flat
+            and (cached := self._listing_cache.fetch(location))
+        ):
+            # Only the first page of the cached listing is shown; there's
+            # no sense in filling the display with a large listing that is
+            # about to be replaced.
+            cached_page = _FirstPage(
+                max(self.size.height, 1),
+                sort_mode,
+                self.sort_reverse,
+                self.sort_display,
+            )
+            for details in cached:
+                if worker.is_cancelled:
+                    return
+                if (
+                    details.is_dir
+                    or (details.is_file and self.show_files)
+                    or (details.is_link and not details.is_file)
+                ) and not self._hide_entry(
+                    cached_entry := DirectoryEntry(
+                        details, styles, details.location in self._marked
+                    )
+                ):
+                    cached_page.offer(cached_entry)
+            self.app.call_from_thread(self._show_cached, location, cached_page.entries)
+            first_page = None
+            page_shown = True
+        listed: list[EntryDetails] = []
+        # A flat listing applies the ignore rules itself, as it goes. Ignore
+        # files are only looked for on the local filesystem.
+        ignore = (
+            None
+            if self.ignore_rules is None or flat
+            else self.ignore_rules.matcher(self._location, self._local)
+        )
+        # Keep hold of every name seen, along with when the directory was
+        # last modified, so that they can be used to suggest completions.
+        names: list[str] = []
+        if fetched is None:
+            modified = None if flat else self._modified(location)
+            if not self.is_root:
+                # Look up the parent now, while we're off the UI thread.
+                self._parent_entry(styles)
+        else:
+            modified = fetched.modified
+            self._parent_details = fetched.parent
         try:
-            for entry in self._location.iterdir():
+            for entry in self._listing(fetched, flat):
                 if worker.is_cancelled:
                     return
-                if is_dir(entry) or (is_file(entry) and self.show_files):
+                names.append(entry.name)
+                # If there are ignore rules, see if we can rule the entry out
+                # on its name alone, before we go anywhere near the
+                # filesystem to find out more.
+                if ignore and (ignored := ignore.ignores(entry.name)) is not False:
+                    if ignored:
+                        continue
+                    details = entry.details
+                    if ignore.ignores(entry.name, details.is_dir):
+                        continue
+                elif (
+                    name_filter is not None
+                    and entry.is_dir is False
+                    and not entry.looked_at
+                    and not name_filter(entry.name.rpartition("/")[-1])
+                ):
+                    # Note that the name tested is that of the entry itself,
+                    # as in a flat view the entry is named for its path.
+                    set_aside = True
+                    continue
+                else:
+                    details = entry.details
+                listed.append(details)
+                # Note that links that loop are neither directories nor
+                # files, but we still want to show them so that the user can
+                # see why they can't go anywhere with them.
+                if (
+                    details.is_dir
+                    or (details.is_file and self.show_files)
+                    or (details.is_link and self.links.is_loop(details.location))
+                ):
                     self._entries.append(
-                        DirectoryEntry(self._location / entry.name, styles)
+                        loaded := DirectoryEntry(
+                            details, styles, details.location in self._marked
+                        )
                     )
+                    # Make the sort key now, while we're off the UI thread.
+                    loaded.sort_key(sort_mode)
+                    if first_page is not None and not self._hide_entry(loaded):
+                        first_page.offer(loaded)
+                        if (
+                            first_page.changed
+                            and monotonic() - last_shown >= self.FIRST_PAGE_INTERVAL
+                        ):
+                            self.app.call_from_thread(
+                                self._show_first_page, location, first_page.entries
+                            )
+                            page_shown = True
+                            last_shown = monotonic()
         except PermissionError:
             self.post_message(self.PermissionError(self, self._location))
+        else:
+            # A flat listing isn't the listing of the directory, so it
+            # doesn't belong in the caches of directory listings.
+            if modified is not None and not flat:
+                self.directory_names.remember(location, modified, names)
+            if self._listing_cache is not None and not flat:
+                self._listing_cache.store(location, listed)
+
+        # If files were left out for a filter that has since been changed,
+        # they could be wanted after all; so load the directory again.
+        self._set_aside = set_aside
+        if set_aside and self.file_filter is not file_filter:
+            self.app.call_from_thread(self._reload, location)
+            return
+
+        # Index the names of what's been loaded now, while we're off the UI
+        # thread, so that the user can jump to entries by name.
+        self._loaded_names = NameIndex((entry.name, entry) for entry in self._entries)
 
         # Now that we've loaded everything up, let's make the call to update
         # the display.
-        self.app.call_from_thread(self._repopulate_display)
+        self.app.call_from_thread(
+            self._repopulate_keeping_highlight
+            if page_shown or keep_highlight
+            else self._repopulate_display
+        )
+        self.app.call_from_thread(self._mark_stale, False)
+        self.app.call_from_thread(self._start_measuring)
+
+        # If the display is being narrowed, what's just been loaded needs
+        # narrowing too.
+        if self.narrow:
+            self.app.call_from_thread(self._start_narrowing, True)
+
+    def _start_narrowing(self, reloaded: bool = False) -> None:
+        """Start narrowing the display down to entries that match `narrow`.
+
+        Args:
+            reloaded: Have the entries been reloaded since the last narrowing?
+        """
+        if reloaded:
+            self._narrowing.clear()
+        if self.narrow:
+            self._narrow_entries(self._location, self.narrow, self._entries)
+        else:
+            self.workers.cancel_group(self, "narrow")
+            if self._narrowed is not None:
+                self._narrowed = None
+                self._repopulate_keeping_highlight()
+
+    @work(exclusive=True, thread=True, group="narrow")
+    def _narrow_entries(
+        self, location: Path, query: str, entries: list[DirectoryEntry]
+    ) -> None:
+        """Narrow the entries down to those that match a query.
+
+        Args:
+            location: The location the entries were loaded from.
+            query: The query to narrow with.
+            entries: The entries to narrow.
+
+        Only the entries that matched the previous query are scored again
+        if the new query extends it, so this gets quicker as the user types.
+        """
+        worker = get_current_worker()
+        scores = self._narrowing.narrow(
+            query,
+            (entry.name for entry in entries),
+            lambda: worker.is_cancelled,
+        )
+        if scores is not None and not worker.is_cancelled:
+            self.app.call_from_thread(self._narrowing_done, location, query, scores)
+
+    def _narrowing_done(
+        self, location: Path, query: str, scores: dict[str, int]
+    ) -> None:
+        """Show the result of narrowing the display.
+
+        Args:
+            location: The location the entries were loaded from.
+            query: The query that was narrowed with.
+            scores: The scores of the entries that matched.
+        """
+        if location == self._location and query == self.narrow:
+            self._narrowed = scores
+            self._repopulate_keeping_highlight()
+
+    @work(exclusive=True, thread=True, group="enter")
+    def _enter(self, location: Path) -> None:
+        """Enter the given directory.
+
+        Args:
+            location: The location of the directory to enter.
+
+        Resolving the location could mean following a chain of links, so
+        that work is done in a thread to keep the UI responsive.
+        """
+        try:
+            resolved = self.links.resolve(location)
+        except LinkLoopError:
+            self.post_message(self.LinkLoop(self, location))
+            return
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(setattr, self, "_location", resolved)
 
     def _watch__location(self) -> None:
         """Reload the content if the location changes."""
+        self._type_ahead = ""
+        self._mark_anchor = None
+        self._mark_stale(False)
+        self.workers.cancel_group(self, "measure")
+        self.workers.cancel_group(self, "narrow")
+        self._narrowing.clear()
+        self._narrowed = None
+        self.narrow = ""
         self.post_message(self.Changed(self))
         self._load()
 
     def _watch_show_hidden(self) -> None:
-        """Refresh the display if the show-hidden flag has changed."""
-        self._repopulate_display()
+        """Refresh the display if the show-hidden flag has changed.
+
+        A flat view is loaded again, as it only walks into hidden
+        directories if hidden entries are being shown.
+        """
+        if self._flat:
+            self._load()
+        else:
+            self._repopulate_display()
+
+    def _watch_ignore_rules(self) -> None:
+        """Reload the content if the ignore rules have changed."""
+        self._load()
+
+    def _watch_listing_backend(self) -> None:
+        """Reload the content if the listing backend has changed."""
+        self._load()
+
+    def _watch_browse_archives(self) -> None:
+        """Reload the content if the browse-archives flag has changed."""
+        self._load()
+
+    def _watch_flat_view(self) -> None:
+        """Reload the content if the flat-view flag has changed."""
+        self._load()
+
+    def _watch_flat_depth(self) -> None:
+        """Reload the content if the depth of the flat view has changed."""
+        if self.flat_view:
+            self._load()
+
+    def _watch_multi_select(self) -> None:
+        """Clear any marks if marking is no longer allowed."""
+        if not self.multi_select:
+            self.clear_marks()
 
     def _watch_show_files(self) -> None:
         """Reload the content if the show-files flag has changed."""
@@ -443,10 +1820,37 @@ class DirectoryNavigation(OptionList):
         """Refresh the display if the sort option has been changed."""
         self._repopulate_display()
 
-    def _watch_file_filter(self) -> None:
-        """Refresh the display when the file filter has been changed."""
+    def _watch_sort_mode(self) -> None:
+        """Refresh the display if the sort mode has been changed."""
         self._repopulate_display()
 
+    def _watch_sort_reverse(self) -> None:
+        """Refresh the display if the sort direction has been changed."""
+        self._repopulate_display()
+
+    def _watch_measure_directories(self) -> None:
+        """Start or stop working out the total size of directories."""
+        if self.measure_directories:
+            self._start_measuring()
+        else:
+            self.workers.cancel_group(self, "measure")
+
+    def _watch_narrow(self) -> None:
+        """Narrow the display when the narrowing query has been changed."""
+        self._start_narrowing()
+
+    def _watch_file_filter(self) -> None:
+        """Refresh the display when the file filter has been changed.
+
+        If files were left out of the listing because the filter ruled out
+        their names, the directory is loaded again so that they can be
+        looked at in the light of the new filter.
+        """
+        if self._set_aside:
+            self._reload(self._location)
+        else:
+            self._repopulate_display()
+
     def toggle_hidden(self) -> None:
         """Toggle the display of hidden filesystem entries."""
         self.show_hidden = not self.show_hidden
@@ -470,6 +1874,74 @@ class DirectoryNavigation(OptionList):
 
     def on_key(self, event: events.Key) -> None:
         self._open_directory = True
+        if self._jump_ahead(event):
+            event.stop()
+            event.prevent_default()
+
+    @property
+    def _names(self) -> NameIndex[DirectoryEntry]:
+        """The index of the names of the entries that can be jumped to."""
+        if self._loaded_names is not None:
+            return self._loaded_names
+        # While the directory is still loading there's only a page or so of
+        # entries on display, so they're quick enough to index here. The
+        # entry for the parent directory isn't something anyone would want
+        # to jump to by name.
+        return NameIndex(
+            (cast(DirectoryEntry, option).name, cast(DirectoryEntry, option))
+            for option in self.options[0 if self.is_root else 1 :]
+        )
+
+    @property
+    def _display_positions(self) -> dict[DirectoryEntry, int]:
+        """Where each entry is in the display."""
+        if self._positions is None:
+            self._positions = {
+                cast(DirectoryEntry, option): index
+                for index, option in enumerate(self.options)
+            }
+        return self._positions
+
+    def _jump_ahead(self, event: events.Key) -> bool:
+        """Jump to an entry by name, as the user types it.
+
+        Args:
+            event: The key event to handle.
+
+        Returns:
+            `True` if the key was used, `False` if not.
+
+        Each printable character that is typed is added to the text typed so
+        far, and the highlight is moved to the first entry on display whose
+        name starts with that text (ignoring case). A pause in typing that is longer than
+        [`TYPE_AHEAD_TIMEOUT`][textual_fspicker.parts.DirectoryNavigation.TYPE_AHEAD_TIMEOUT]
+        starts a new search.
+
+        Note:
+            A space or a full stop at the start of a search isn't used, so
+            that those keys are still free to be bound to other actions.
+        """
+        if not event.is_printable or event.character is None:
+            return False
+        if monotonic() - self._type_ahead_at > self.TYPE_AHEAD_TIMEOUT:
+            self._type_ahead = ""
+        if not self._type_ahead and event.character in " .":
+            return False
+        self._type_ahead += event.character
+        self._type_ahead_at = monotonic()
+        positions = self._display_positions
+        if (
+            index := min(
+                (
+                    positions[entry]
+                    for entry in self._names.values(self._type_ahead)
+                    if entry in positions
+                ),
+                default=None,
+            )
+        ) is not None:
+            self.highlighted = index
+        return True
 
     def _on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle an entry in the list being selected.
@@ -480,10 +1952,12 @@ class DirectoryNavigation(OptionList):
         event.stop()
         assert isinstance(event.option, DirectoryEntry)
         # If the user has selected a directory...
-        if is_dir(event.option.location):
+        if event.option.is_link_loop:
+            self.post_message(self.LinkLoop(self, event.option.location))
+        elif event.option.is_dir:
             if self._open_directory:
                 # ...we do navigation and don't post anything from here.
-                self._location = event.option.location.resolve()
+                self._enter(event.option.location)
         else:
             # If it's not a directory it should be a file; that should be a
             # selection event.
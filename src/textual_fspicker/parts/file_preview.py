@@ -0,0 +1,126 @@
+"""Provides a widget for previewing the start of a file."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from pathlib import Path
+from typing import ClassVar, Final
+
+##############################################################################
+# Rich imports.
+from rich.text import Text
+
+##############################################################################
+# Textual imports.
+from textual import work
+from textual.timer import Timer
+from textual.widgets import Static
+from textual.worker import get_current_worker
+
+##############################################################################
+# Local imports.
+from ..file_preview import FilePreviewer, Preview
+
+
+##############################################################################
+class FilePreview(Static):
+    """A widget that previews the start of the highlighted file.
+
+    The preview follows the highlight, but only once it has settled; moving
+    quickly through a long list of files doesn't mean reading every one of
+    them along the way.
+    """
+
+    DEFAULT_CSS = """
+    FilePreview {
+        width: 1fr;
+        height: 1fr;
+        overflow: hidden;
+        padding: 0 1;
+        border: blank;
+        border-left: solid $border;
+        border-title-color: $text;
+        border-subtitle-color: $text-muted;
+        &.-binary {
+            color: $text-muted;
+        }
+    }
+    """
+
+    DEBOUNCE: Final[float] = 0.15
+    """How long, in seconds, the highlight has to settle before previewing."""
+
+    previewer: ClassVar[FilePreviewer] = FilePreviewer()
+    """The previewer shared by all previews, and so its cache too."""
+
+    def __init__(self) -> None:
+        """Initialise the preview."""
+        super().__init__()
+        self._location: Path | None = None
+        """The location of the file being previewed, if there is one."""
+        self._pending: Timer | None = None
+        """The timer for the preview that is waiting for the highlight to settle."""
+
+    def preview(self, location: Path | None) -> None:
+        """Preview a file, once the highlight has settled.
+
+        Args:
+            location: The location of the file to preview, or `None` to
+                clear the preview.
+        """
+        self._location = location
+        if self._pending is not None:
+            self._pending.stop()
+            self._pending = None
+        if location is None:
+            self.workers.cancel_group(self, "preview")
+            self._show(None, None)
+        else:
+            self._pending = self.set_timer(self.DEBOUNCE, self._start_preview)
+
+    def resume(self) -> None:
+        """Make the preview again, in case making it was interrupted."""
+        self.preview(self._location)
+
+    def _start_preview(self) -> None:
+        """Start previewing the file that was last asked for."""
+        self._pending = None
+        if self._location is not None:
+            self._make_preview(self._location)
+
+    @work(exclusive=True, thread=True, group="preview")
+    def _make_preview(self, location: Path) -> None:
+        """Make the preview of a file.
+
+        Args:
+            location: The location of the file to preview.
+        """
+        preview = self.previewer.preview(location)
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._show, location, preview)
+
+    def _show(self, location: Path | None, preview: Preview | None) -> None:
+        """Show a preview.
+
+        Args:
+            location: The location of the file that was previewed.
+            preview: The preview to show.
+        """
+        if location != self._location:
+            return
+        self.set_class(preview is not None and preview.binary, "-binary")
+        if location is None or preview is None:
+            self.border_title = self.border_subtitle = None
+            self.update("")
+        else:
+            self.border_title = location.name
+            self.border_subtitle = (
+                f"{preview.size:,} bytes{' (start)' if preview.truncated else ''}"
+            )
+            self.update(Text(preview.content, no_wrap=True, overflow="ellipsis"))
+
+
+### file_preview.py ends here
@@ -0,0 +1,305 @@
+"""Provides a widget for showing the results of a search below a directory."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from collections.abc import Iterable
+from dataclasses import dataclass
+from os import sep
+from pathlib import Path
+from time import time
+from typing import ClassVar
+
+##############################################################################
+# Rich imports.
+from rich.text import Text
+
+##############################################################################
+# Textual imports.
+from textual import work
+from textual.message import Message
+from textual.widgets import OptionList
+from textual.widgets.option_list import Option
+from textual.worker import get_current_worker
+
+##############################################################################
+# Local imports.
+from ..filename_index import FilenameIndex
+from ..icons import default_icon
+from ..ignore_rules import IgnoreRules
+from ..path_filters import Filter
+from ..subtree_search import (
+    DEFAULT_MAX_DEPTH,
+    DEFAULT_MAX_RESULTS,
+    SearchMatch,
+    SearchOptions,
+    SubtreeSearch,
+)
+
+
+##############################################################################
+def _age(when: float) -> str:
+    """Describe how long ago something happened.
+
+    Args:
+        when: The time at which it happened.
+
+    Returns:
+        A description of how long ago that was.
+    """
+    if (minutes := int(time() - when) // 60) < 1:
+        return "just now"
+    for size, unit in ((24 * 60, "day"), (60, "hour"), (1, "minute")):
+        if minutes >= size:
+            count = minutes // size
+            return f"{count} {unit}{'' if count == 1 else 's'} ago"
+    return "just now"
+
+
+##############################################################################
+class SearchResult(Option):
+    """A result of a search below a directory."""
+
+    def __init__(self, root: Path, match: SearchMatch) -> None:
+        """Initialise the result.
+
+        Args:
+            root: The directory that was searched.
+            match: The match that was found.
+        """
+        self.location = Path(match.location)
+        """The location of the result."""
+        self.is_dir = match.is_dir
+        """Is the result a directory?"""
+        super().__init__(
+            Text.assemble(
+                default_icon(match.is_dir),
+                " ",
+                f"{self.location.relative_to(root)}{sep if match.is_dir else ''}",
+            )
+        )
+
+
+##############################################################################
+class SearchResults(OptionList):
+    """A widget that searches below a directory and shows what it finds."""
+
+    DEFAULT_CSS = """
+    SearchResults, SearchResults:focus {
+        border: blank;
+    }
+    """
+
+    searcher: ClassVar[SubtreeSearch] = SubtreeSearch()
+    """The searcher used to search below a directory.
+
+    This is shared between all instances of the widget so that the pool of
+    processes used to search is only started once.
+    """
+
+    @dataclass
+    class Selected(Message):
+        """Message sent when a search result is selected."""
+
+        results: SearchResults
+        """The search results widget sending the message."""
+
+        path: Path
+        """The path of the result that was selected."""
+
+        is_dir: bool
+        """Is the result a directory?"""
+
+        @property
+        def control(self) -> SearchResults:
+            """An alias for `results`."""
+            return self.results
+
+    def __init__(
+        self,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        max_results: int = DEFAULT_MAX_RESULTS,
+    ) -> None:
+        """Initialise the search results widget.
+
+        Args:
+            max_depth: How many levels below the directory to search.
+            max_results: The maximum number of results to show.
+        """
+        super().__init__()
+        self.max_depth = max_depth
+        """How many levels below the directory to search."""
+        self.max_results = max_results
+        """The maximum number of results to show."""
+        self._search_number = 0
+        """The number of the search being shown."""
+
+    def search(
+        self,
+        root: Path,
+        query: str,
+        *,
+        include_hidden: bool = False,
+        directories_only: bool = False,
+        ignore_rules: IgnoreRules | None = None,
+        file_filter: Filter | None = None,
+        filename_index: FilenameIndex | None = None,
+    ) -> None:
+        """Start a new search, abandoning any search that is in progress.
+
+        Args:
+            root: The directory to search below.
+            query: The query to search for.
+            include_hidden: Should hidden entries be searched?
+            directories_only: Should only directories be found?
+            ignore_rules: Optional rules for entries that should be ignored.
+            file_filter: An optional filter for the files that are found.
+            filename_index: An optional index to search, rather than
+                walking the filesystem.
+
+        If a filename index is given, and it covers the directory being
+        searched, the search is made in the index rather than the
+        filesystem; in that case the ignore rules and depth limit are those
+        that the index was built with. Otherwise, only directories on the
+        local filesystem can be searched.
+
+        See [`SearchOptions.query`][textual_fspicker.subtree_search.SearchOptions.query]
+        for how the query is matched against names.
+
+        Note:
+            Only filters that can decide on the name of a file alone are
+            applied to what is found; other filters are ignored.
+        """
+        self.clear_options()
+        self._search_number += 1
+        if query:
+            self.border_subtitle = "Searching..."
+            self._search(
+                self._search_number,
+                root,
+                SearchOptions(
+                    query,
+                    self.max_depth,
+                    include_hidden,
+                    directories_only,
+                    None if ignore_rules is None else ignore_rules.settings,
+                ),
+                file_filter,
+                filename_index,
+            )
+        else:
+            self.cancel()
+
+    def cancel(self) -> None:
+        """Cancel any search that is in progress."""
+        self.workers.cancel_group(self, "search")
+        self.border_subtitle = ""
+
+    @work(exclusive=True, thread=True, group="search")
+    def _search(
+        self,
+        search_number: int,
+        root: Path,
+        options: SearchOptions,
+        file_filter: Filter | None,
+        filename_index: FilenameIndex | None,
+    ) -> None:
+        """Search below a directory, streaming the results into the display.
+
+        Args:
+            search_number: The number of the search.
+            root: The directory to search below.
+            options: The options for the search.
+            file_filter: An optional filter for the files that are found.
+            filename_index: An optional index to search.
+        """
+        worker = get_current_worker()
+        name_tester = None if file_filter is None else file_filter.name_tester
+        found: Iterable[list[SearchMatch]]
+        if (
+            filename_index is not None
+            and (updated := filename_index.updated(root)) is not None
+        ):
+            found = [
+                filename_index.search(
+                    root,
+                    options.query,
+                    include_hidden=options.include_hidden,
+                    directories_only=options.directories_only,
+                    limit=self.max_results,
+                    file_filter=name_tester,
+                )
+            ]
+            freshness = f"index updated {_age(updated)}"
+        elif not self.searcher.can_search(root):
+            self.app.call_from_thread(self._cannot_search, search_number)
+            return
+        else:
+            found = self.searcher.search(
+                root,
+                options,
+                self.max_results,
+                lambda: worker.is_cancelled,
+                name_tester,
+            )
+            freshness = ""
+        for matches in found:
+            if results := [SearchResult(root, match) for match in matches]:
+                self.app.call_from_thread(self._add_results, search_number, results)
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._search_done, search_number, freshness)
+
+    def _add_results(self, search_number: int, results: list[SearchResult]) -> None:
+        """Add some results to the display.
+
+        Args:
+            search_number: The number of the search the results are for.
+            results: The results to add.
+        """
+        if search_number == self._search_number:
+            self.add_options(results)
+            if self.highlighted is None:
+                self.highlighted = 0
+
+    def _search_done(self, search_number: int, freshness: str) -> None:
+        """Finish off the display once a search has finished.
+
+        Args:
+            search_number: The number of the search that finished.
+            freshness: A description of how fresh the results are, if
+                they came from an index.
+        """
+        if search_number == self._search_number:
+            found = (
+                f"First {self.option_count} found"
+                if self.option_count >= self.max_results
+                else f"{self.option_count} found"
+            )
+            self.border_subtitle = f"{found}, {freshness}" if freshness else found
+
+    def _cannot_search(self, search_number: int) -> None:
+        """Let the user know that a search can't be made.
+
+        Args:
+            search_number: The number of the search that can't be made.
+        """
+        if search_number == self._search_number:
+            self.border_subtitle = "Only the local filesystem can be searched"
+
+    def _on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        """Handle a result being selected.
+
+        Args:
+            event: The event to handle.
+        """
+        event.stop()
+        assert isinstance(event.option, SearchResult)
+        self.post_message(
+            self.Selected(self, event.option.location, event.option.is_dir)
+        )
+
+
+### search_results.py ends here
@@ -6,14 +6,47 @@ from __future__ import annotations
 
 ##############################################################################
 # Python imports.
+import re
 from collections.abc import Callable
+from enum import IntEnum
+from fnmatch import translate
 from pathlib import Path
 from typing import NamedTuple, TypeAlias
 
+##############################################################################
+# Local imports.
+from .entry_details import EntryDetails
+
 ##############################################################################
 FilterFunction: TypeAlias = Callable[[Path], bool]
 """Type of a path filter function."""
 
+NameFilterFunction: TypeAlias = Callable[[str], bool]
+"""Type of a filter function that works on the name of an entry alone."""
+
+DetailsFilterFunction: TypeAlias = Callable[[EntryDetails], bool]
+"""Type of a filter function that works on the details of an entry."""
+
+
+##############################################################################
+class FilterNeeds(IntEnum):
+    """What a filter needs to know about an entry to do its work.
+
+    The values are ordered by how costly it is to provide what is needed.
+    """
+
+    NAME = 0
+    """The filter only needs the name of the entry."""
+
+    KIND = 1
+    """The filter needs to know what kind of entry it is looking at."""
+
+    STAT = 2
+    """The filter needs the full details of the entry, such as size and time."""
+
+    PATH = 3
+    """The filter needs the [`Path`][pathlib.Path] and could do anything with it."""
+
 
 ##############################################################################
 class Filter(NamedTuple):
@@ -33,6 +66,38 @@ class Filter(NamedTuple):
     [`Path`][pathlib.Path] passes the filter.
     """
 
+    name_tester: NameFilterFunction | None = None
+    """An optional test function that works on the name of an entry alone.
+
+    When this is provided it will be used in preference to
+    [`tester`][textual_fspicker.path_filters.Filter.tester] when filtering
+    the entries of a directory, as it needs no [`Path`][pathlib.Path] and no
+    access to the filesystem to do its work.
+    """
+
+    expensive: bool = False
+    """Is the filter expensive to run?
+
+    An expensive filter is run in a pool of workers rather than on the UI
+    thread, and its results are cached; see
+    [`FilterEvaluator`][textual_fspicker.filter_evaluation.FilterEvaluator].
+    Mark a filter as expensive if it does something costly, such as reading
+    the content of the file it is testing.
+    """
+
+    details_tester: DetailsFilterFunction | None = None
+    """An optional test function that works on the details of an entry.
+
+    When this is provided it will be used in preference to
+    [`tester`][textual_fspicker.path_filters.Filter.tester] when filtering
+    the entries of a directory, and will be handed the
+    [`EntryDetails`][textual_fspicker.entry_details.EntryDetails] that were
+    gathered when the directory was loaded.
+    """
+
+    needs: FilterNeeds = FilterNeeds.PATH
+    """What the filter needs to know about an entry to do its work."""
+
     def __call__(self, path: Path) -> bool:
         """Test the given path to see if it passes the filter.
 
@@ -45,6 +110,177 @@ class Filter(NamedTuple):
         """
         return self.tester(path)
 
+    def test_details(self, details: EntryDetails) -> bool:
+        """Test the given entry details to see if they pass the filter.
+
+        Args:
+            details: The details of the entry to test.
+
+        Returns:
+            [`True`][True] if the entry passes the filter condition,
+                [`False`][False] if not.
+
+        The cheapest available test function is used. Name-only tests are
+        given the name of the entry itself, even where the entry is shown
+        by its path below the directory being viewed.
+        """
+        if self.name_tester is not None:
+            return self.name_tester(details.location.name)
+        if self.details_tester is not None:
+            return self.details_tester(details)
+        return self.tester(details.location)
+
+    @classmethod
+    def from_details(
+        cls,
+        name: str,
+        details_tester: DetailsFilterFunction,
+        needs: FilterNeeds = FilterNeeds.STAT,
+        *,
+        expensive: bool = False,
+    ) -> Filter:
+        """Create a filter that works on the details of an entry.
+
+        Args:
+            name: The name of the filter.
+            details_tester: The function that tests the details of an entry.
+            needs: What the filter needs to know about an entry.
+            expensive: Is the filter expensive to run?
+
+        Returns:
+            A filter that tests the details of an entry.
+
+        Example:
+            ```python
+            Filter.from_details("Large files", lambda entry: entry.size > 2**30)
+            ```
+
+        The details handed to the test function are those that were
+        gathered when the directory was loaded, so a filter made this way
+        costs no extra calls to the filesystem.
+        """
+        return cls(
+            name,
+            lambda path: details_tester(EntryDetails.of(path)),
+            expensive=expensive,
+            details_tester=details_tester,
+            needs=needs,
+        )
+
+    @classmethod
+    def all_of(cls, name: str, *filters: Filter) -> Filter:
+        """Create a filter that passes entries that pass all the given filters.
+
+        Args:
+            name: The name of the filter.
+            filters: The filters to combine.
+
+        Returns:
+            A filter that combines all of the given filters.
+
+        The filters are tested in order of cost, cheapest first, so that an
+        entry that fails a name-only test never gets as far as a test that
+        needs more details.
+        """
+        ordered = sorted(filters, key=lambda test: (test.expensive, test.needs))
+        needs = max((test.needs for test in ordered), default=FilterNeeds.NAME)
+
+        name_testers = [
+            test.name_tester for test in ordered if test.name_tester is not None
+        ]
+
+        def name_tester(entry_name: str) -> bool:
+            return all(test(entry_name) for test in name_testers)
+
+        return cls(
+            name,
+            lambda path: all(test(path) for test in ordered),
+            name_tester if len(name_testers) == len(ordered) else None,
+            any(test.expensive for test in ordered),
+            lambda details: all(test.test_details(details) for test in ordered),
+            needs,
+        )
+
+    @classmethod
+    def from_globs(cls, name: str, *globs: str, case_sensitive: bool = False) -> Filter:
+        """Create a filter that matches names against glob patterns.
+
+        Args:
+            name: The name of the filter.
+            globs: The glob patterns to match against.
+            case_sensitive: Should the matching be case-sensitive?
+
+        Returns:
+            A filter that passes any name that matches any of the globs.
+
+        Example:
+            ```python
+            Filter.from_globs("Images", "*.png", "*.jp*g", "*.gif")
+            ```
+
+        All of the globs are compiled into a single regular expression, so
+        testing an entry costs one match against its name.
+        """
+        matcher = re.compile(
+            "|".join(f"(?:{translate(glob)})" for glob in globs) or "(?!)",
+            0 if case_sensitive else re.IGNORECASE,
+        ).match
+
+        def name_tester(entry_name: str) -> bool:
+            return matcher(entry_name) is not None
+
+        return cls(
+            name,
+            lambda path: name_tester(path.name),
+            name_tester,
+            needs=FilterNeeds.NAME,
+        )
+
+    @classmethod
+    def from_suffixes(
+        cls, name: str, *suffixes: str, case_sensitive: bool = False
+    ) -> Filter:
+        """Create a filter that matches names against a set of suffixes.
+
+        Args:
+            name: The name of the filter.
+            suffixes: The suffixes to match against.
+            case_sensitive: Should the matching be case-sensitive?
+
+        Returns:
+            A filter that passes any name that has one of the suffixes.
+
+        Example:
+            ```python
+            Filter.from_suffixes("C", ".c", ".h")
+            ```
+
+        The suffixes can be given with or without their leading `.`.
+        Suffixes made of more than one part (`.tar.gz`, for example) are
+        supported too.
+        """
+        wanted = [
+            suffix if suffix.startswith(".") else f".{suffix}" for suffix in suffixes
+        ]
+        if not case_sensitive:
+            wanted = [suffix.lower() for suffix in wanted]
+        simple = frozenset(suffix for suffix in wanted if suffix.count(".") == 1)
+        compound = tuple(suffix for suffix in wanted if suffix.count(".") > 1)
+
+        def name_tester(entry_name: str) -> bool:
+            if not case_sensitive:
+                entry_name = entry_name.lower()
+            if (dot := entry_name.rfind(".")) > 0 and entry_name[dot:] in simple:
+                return True
+            return bool(compound) and entry_name.endswith(compound)
+
+        return cls(
+            name,
+            lambda path: name_tester(path.name),
+            name_tester,
+            needs=FilterNeeds.NAME,
+        )
+
 
 ##############################################################################
 class Filters:
@@ -12,18 +12,28 @@ from pathlib import Path
 # Textual imports.
 from textual import on
 from textual.app import ComposeResult
+from textual.binding import Binding
 from textual.widgets import Button
 
 ##############################################################################
 # Local imports.
 from .base_dialog import ButtonLabel, FileSystemPickerScreen
+from .filename_index import FilenameIndex
+from .ignore_rules import IgnoreRules
+from .listing_backends import AsyncListingBackend, ListingBackend
+from .listing_cache import ListingCache
 from .parts import CurrentDirectory, DirectoryNavigation
 
 
 ##############################################################################
-class SelectDirectory(FileSystemPickerScreen):
+class SelectDirectory(FileSystemPickerScreen[Path]):
     """A directory selection dialog."""
 
+    BINDINGS = [
+        Binding("ctrl+g", "search"),
+    ]
+    """The bindings for the dialog."""
+
     DEFAULT_CSS = """
     SelectDirectory CurrentDirectory {
         height: 3;
@@ -39,6 +49,10 @@ class SelectDirectory(FileSystemPickerScreen):
         select_button: ButtonLabel = "",
         cancel_button: ButtonLabel = "",
         double_click_directories: bool = True,
+        ignore_rules: IgnoreRules | None = None,
+        filename_index: FilenameIndex | None = None,
+        listing_cache: ListingCache | None = None,
+        listing_backend: ListingBackend | AsyncListingBackend | None = None,
     ) -> None:
         """Initialise the dialog.
 
@@ -48,6 +62,10 @@ class SelectDirectory(FileSystemPickerScreen):
             select_button: The label for the select button.
             cancel_button: The label for the cancel button.
             double_click_directories: Double click to open directories.
+            ignore_rules: Optional rules for entries that should be ignored.
+            filename_index: Optional index to search below the current directory.
+            listing_cache: Optional cache of listings to show while loading.
+            listing_backend: Optional backend to list directories with.
 
         Notes:
             `select_button` and `cancel_button` can either be strings that
@@ -60,6 +78,10 @@ class SelectDirectory(FileSystemPickerScreen):
             select_button=select_button,
             cancel_button=cancel_button,
             double_click_directories=double_click_directories,
+            ignore_rules=ignore_rules,
+            filename_index=filename_index,
+            listing_cache=listing_cache,
+            listing_backend=listing_backend,
         )
 
     def on_mount(self) -> None:
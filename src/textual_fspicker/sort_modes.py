@@ -0,0 +1,179 @@
+"""Provides the ways in which the entries of a directory can be sorted.
+
+Each [`SortMode`][textual_fspicker.sort_modes.SortMode] knows how to make a
+sort key from the [`EntryDetails`][textual_fspicker.entry_details.EntryDetails]
+of an entry; as those details are gathered when a directory is loaded,
+sorting the entries never needs to go back to the filesystem.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import re
+from collections.abc import Callable
+from enum import Enum
+from typing import Any, TypeAlias
+
+##############################################################################
+# Local imports.
+from .entry_details import EntryDetails
+
+##############################################################################
+SortKey: TypeAlias = tuple[Any, ...]
+"""The type of a sort key."""
+
+##############################################################################
+_DIGITS = re.compile(r"(\d+)")
+"""Regular expression for splitting the digits out of a name."""
+
+
+##############################################################################
+def _by_name(details: EntryDetails) -> SortKey:
+    """Make a sort key for sorting by exact name.
+
+    Args:
+        details: The details of the entry.
+
+    Returns:
+        The sort key.
+    """
+    return (details.name,)
+
+
+##############################################################################
+def _by_casefolded_name(details: EntryDetails) -> SortKey:
+    """Make a sort key for sorting by name, ignoring case.
+
+    Args:
+        details: The details of the entry.
+
+    Returns:
+        The sort key.
+    """
+    return (details.name.casefold(), details.name)
+
+
+##############################################################################
+def _by_natural_name(details: EntryDetails) -> SortKey:
+    """Make a sort key for sorting by name, with numbers in numeric order.
+
+    Args:
+        details: The details of the entry.
+
+    Returns:
+        The sort key.
+
+    With this key `file2` sorts before `file10`.
+    """
+    # Splitting on a capturing group means that the text and the digits
+    # always alternate, starting with text; so the parts always compare
+    # like with like.
+    return (
+        tuple(
+            int(part) if index % 2 else part.casefold()
+            for index, part in enumerate(_DIGITS.split(details.name))
+        ),
+        details.name,
+    )
+
+
+##############################################################################
+def _by_size(details: EntryDetails) -> SortKey:
+    """Make a sort key for sorting by size.
+
+    Args:
+        details: The details of the entry.
+
+    Returns:
+        The sort key.
+    """
+    return (details.size, details.name)
+
+
+##############################################################################
+def _by_mtime(details: EntryDetails) -> SortKey:
+    """Make a sort key for sorting by modification time.
+
+    Args:
+        details: The details of the entry.
+
+    Returns:
+        The sort key.
+    """
+    return (details.mtime, details.name)
+
+
+##############################################################################
+def _by_extension(details: EntryDetails) -> SortKey:
+    """Make a sort key for sorting by extension.
+
+    Args:
+        details: The details of the entry.
+
+    Returns:
+        The sort key.
+    """
+    extension = (
+        details.name[dot + 1 :].casefold()
+        if (dot := details.name.rfind(".")) > 0
+        else ""
+    )
+    return (extension, details.name.casefold(), details.name)
+
+
+##############################################################################
+class SortMode(Enum):
+    """The ways in which the entries of a directory can be sorted."""
+
+    NAME = ("Name", _by_name)
+    """Sort by name."""
+
+    CASEFOLDED_NAME = ("Name, ignoring case", _by_casefolded_name)
+    """Sort by name, ignoring case."""
+
+    NATURAL_NAME = ("Name, in natural order", _by_natural_name)
+    """Sort by name, with any numbers in numeric order."""
+
+    SIZE = ("Size", _by_size)
+    """Sort by size."""
+
+    MTIME = ("Modification time", _by_mtime)
+    """Sort by modification time."""
+
+    EXTENSION = ("Extension", _by_extension)
+    """Sort by extension."""
+
+    def __init__(self, label: str, key: Callable[[EntryDetails], SortKey]) -> None:
+        """Initialise the sort mode.
+
+        Args:
+            label: The label for the sort mode.
+            key: The function that makes the sort key.
+        """
+        self.label = label
+        """The label for the sort mode."""
+        self._key = key
+        """The function that makes the sort key."""
+
+    def key(self, details: EntryDetails) -> SortKey:
+        """Make the sort key for the given entry details.
+
+        Args:
+            details: The details of the entry.
+
+        Returns:
+            The sort key.
+        """
+        return self._key(details)
+
+    @property
+    def next(self) -> SortMode:
+        """The sort mode that follows this one."""
+        modes = list(SortMode)
+        return modes[(modes.index(self) + 1) % len(modes)]
+
+
+### sort_modes.py ends here
@@ -0,0 +1,375 @@
+"""Support code for searching for entries by name below a directory.
+
+The search walks the tree below a directory using
+[`os.scandir`][os.scandir], with the work split across a pool of processes.
+Each task handed to the pool only looks at a limited number of entries
+before handing back what it found, along with the directories it didn't get
+to; those directories are then shared out as new tasks. This means that
+matches can be streamed back as they're found, and that a search can be
+abandoned quickly, no matter how large the tree is.
+
+Only trees on the local filesystem can be searched this way.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import re
+import sys
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from fnmatch import translate
+from functools import lru_cache
+from logging import getLogger
+from os import scandir
+from pathlib import Path, PosixPath, WindowsPath
+from typing import Final, NamedTuple, TypeAlias
+
+##############################################################################
+# Local imports.
+from .archives import ArchivePath
+from .ignore_rules import IgnoreRules, IgnoreSettings
+
+##############################################################################
+_LOG: Final = getLogger(__name__)
+"""The log for problems with searching."""
+
+##############################################################################
+DEFAULT_WORKERS: Final[int] = 4
+"""The default number of processes to search with."""
+
+DEFAULT_TASK_BUDGET: Final[int] = 5_000
+"""The default number of entries a single task looks at before reporting back."""
+
+DEFAULT_MAX_DEPTH: Final[int] = 16
+"""The default depth below the starting directory to search to."""
+
+DEFAULT_MAX_RESULTS: Final[int] = 1_000
+"""The default maximum number of matches to find."""
+
+CANCEL_CHECK_INTERVAL: Final[float] = 0.05
+"""How often, in seconds, to check if a search has been cancelled."""
+
+
+##############################################################################
+class SearchMatch(NamedTuple):
+    """An entry that was found by a search."""
+
+    location: str
+    """The location of the entry."""
+
+    is_dir: bool
+    """Is the entry a directory?"""
+
+
+##############################################################################
+class SearchOptions(NamedTuple):
+    """The options for a search."""
+
+    query: str
+    """The query to search for.
+
+    If the query contains any of `*`, `?` or `[` it is treated as a glob
+    that has to match the whole name; otherwise a name matches if it
+    contains the query. Either way case is ignored.
+    """
+
+    max_depth: int = DEFAULT_MAX_DEPTH
+    """How many levels below the starting directory to search."""
+
+    include_hidden: bool = False
+    """Should hidden entries be searched?"""
+
+    directories_only: bool = False
+    """Should only directories be matched?"""
+
+    ignore: IgnoreSettings | None = None
+    """The settings of the rules for entries that should be ignored, if any.
+
+    The settings are given, rather than the rules themselves, so that each
+    process makes and keeps its own rules.
+    """
+
+
+##############################################################################
+_Directory: TypeAlias = tuple[str, int]
+"""The type of a directory waiting to be searched, along with its depth."""
+
+_TaskResult: TypeAlias = tuple[list[SearchMatch], list[_Directory]]
+"""The type of the result of a search task."""
+
+
+##############################################################################
+def _name_matcher(query: str) -> Callable[[str], bool]:
+    """Make a function that tests if a name matches a query.
+
+    Args:
+        query: The query to match names against.
+
+    Returns:
+        A function that tests a name.
+    """
+    if any(wildcard in query for wildcard in "*?["):
+        return re.compile(translate(query), re.IGNORECASE).match  # type: ignore[return-value]
+    folded = query.casefold()
+    return lambda name: folded in name.casefold()
+
+
+##############################################################################
+@lru_cache(maxsize=16)
+def _ignore_rules(settings: IgnoreSettings) -> IgnoreRules:
+    """Get the ignore rules made with some settings.
+
+    Args:
+        settings: The settings of the rules.
+
+    Returns:
+        The ignore rules.
+
+    The rules are kept, so that what they've read from the filesystem is
+    used again by later tasks in the same process.
+    """
+    return IgnoreRules.from_settings(settings)
+
+
+##############################################################################
+def _search(
+    directories: list[_Directory], options: SearchOptions, budget: int
+) -> _TaskResult:
+    """Search some directories for entries that match a query.
+
+    Args:
+        directories: The directories to search, along with their depths.
+        options: The options for the search.
+        budget: The number of entries to look at before stopping.
+
+    Returns:
+        The matches found, and the directories still to be searched.
+
+    Note:
+        This runs in a separate process, so everything it is given and
+        everything it returns has to be picklable.
+    """
+    matches = _name_matcher(options.query)
+    rules = None if options.ignore is None else _ignore_rules(options.ignore)
+    found: list[SearchMatch] = []
+    waiting = deque(directories)
+    seen = 0
+    while waiting and seen < budget:
+        directory, depth = waiting.popleft()
+        ignore = None if rules is None else rules.matcher(Path(directory))
+        try:
+            with scandir(directory) as entries:
+                for entry in entries:
+                    seen += 1
+                    # As with the directory navigation, a name that starts
+                    # with a dot is taken to be hidden.
+                    if not options.include_hidden and entry.name.startswith("."):
+                        continue
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if ignore and ignore.ignores(entry.name, is_dir):
+                        continue
+                    if (is_dir or not options.directories_only) and matches(entry.name):
+                        found.append(SearchMatch(entry.path, is_dir))
+                    # Links aren't followed, so that a link that loops can't
+                    # send the search round in circles.
+                    if is_dir and depth < options.max_depth and not entry.is_symlink():
+                        waiting.append((entry.path, depth + 1))
+        except OSError:
+            pass
+    return found, list(waiting)
+
+
+##############################################################################
+class SubtreeSearch:
+    """Searches the tree below a directory for entries that match a query."""
+
+    def __init__(
+        self, workers: int = DEFAULT_WORKERS, task_budget: int = DEFAULT_TASK_BUDGET
+    ) -> None:
+        """Initialise the search.
+
+        Args:
+            workers: The number of processes to search with.
+            task_budget: The number of entries a task looks at before
+                reporting back.
+        """
+        self._workers = workers
+        """The number of processes to search with."""
+        self._task_budget = task_budget
+        """The number of entries a task looks at before reporting back."""
+        self._pool: Executor | None = None
+        """The pool of workers, created when first needed."""
+
+    @staticmethod
+    def can_search(root: Path) -> bool:
+        """Can the tree below a directory be searched?
+
+        Args:
+            root: The directory to search below.
+
+        Returns:
+            `True` if the directory is on the local filesystem, `False` if
+                not.
+        """
+        return isinstance(root, (PosixPath, WindowsPath)) and not (
+            isinstance(root, ArchivePath) and root.archive is not None
+        )
+
+    @property
+    def _executor(self) -> Executor:
+        """The pool of workers to search with.
+
+        Where processes can't be used, threads are used instead.
+        """
+        if self._pool is None:
+            # Pulling in multiprocessing takes a while, so it's only done
+            # once there's a search to do.
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing import get_context
+
+            try:
+                self._pool = ProcessPoolExecutor(
+                    self._workers,
+                    mp_context=get_context(
+                        "spawn" if sys.platform == "win32" else "forkserver"
+                    ),
+                )
+            except (ImportError, NotImplementedError, OSError, ValueError):
+                self._use_threads()
+        assert self._pool is not None
+        return self._pool
+
+    def _use_threads(self) -> None:
+        """Switch to searching with a pool of threads."""
+        if self._pool is not None:
+            # Tasks left in a broken pool fail by themselves, and are then
+            # handed on to the new pool, so they aren't cancelled here.
+            self._pool.shutdown(wait=False)
+        self._pool = ThreadPoolExecutor(
+            self._workers, thread_name_prefix="fspicker-search"
+        )
+
+    def _submit(
+        self, directories: list[_Directory], options: SearchOptions
+    ) -> dict[Future[_TaskResult], list[_Directory]]:
+        """Share some directories out between new search tasks.
+
+        Args:
+            directories: The directories to search.
+            options: The options for the search.
+
+        Returns:
+            The new tasks, along with the directories each was given.
+        """
+        return {
+            self._executor.submit(_search, share, options, self._task_budget): share
+            for share in (
+                directories[offset :: self._workers] for offset in range(self._workers)
+            )
+            if share
+        }
+
+    def search(
+        self,
+        root: Path,
+        options: SearchOptions,
+        max_results: int = DEFAULT_MAX_RESULTS,
+        is_cancelled: Callable[[], bool] = lambda: False,
+        file_filter: Callable[[str], bool] | None = None,
+    ) -> Iterator[list[SearchMatch]]:
+        """Search below a directory.
+
+        Args:
+            root: The directory to search below.
+            options: The options for the search.
+            max_results: The maximum number of matches to find.
+            is_cancelled: A function that says if the search has been
+                cancelled.
+            file_filter: An optional test of the name of a file that has to
+                pass for the file to count as a match.
+
+        Yields:
+            Batches of matches, as they are found.
+
+        The order in which matches are found isn't fixed; in general
+        matches nearer the root are found first. Matches are filtered
+        before they are counted, so the search only stops early once
+        `max_results` filtered matches have been found.
+
+        If the pool of processes breaks, the search carries on with a pool
+        of threads.
+
+        Nothing is found below a directory that [can't be
+        searched][textual_fspicker.subtree_search.SubtreeSearch.can_search].
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        if not self.can_search(root):
+            return
+        pending = self._submit([(str(root), 0)], options)
+        found = 0
+        try:
+            while pending:
+                done, _ = wait(
+                    pending, timeout=CANCEL_CHECK_INTERVAL, return_when=FIRST_COMPLETED
+                )
+                if is_cancelled():
+                    return
+                for task in done:
+                    directories = pending.pop(task)
+                    try:
+                        matches, waiting = task.result()
+                    except BrokenProcessPool:
+                        # Only switch once; other tasks that were running
+                        # in the broken pool will fail in the same way.
+                        if isinstance(self._pool, ProcessPoolExecutor):
+                            _LOG.warning(
+                                "The search process pool broke; searching with threads",
+                                exc_info=True,
+                            )
+                            self._use_threads()
+                        pending.update(self._submit(directories, options))
+                        continue
+                    except Exception:
+                        _LOG.exception("Searching %r failed", directories)
+                        continue
+                    if file_filter is not None:
+                        matches = [
+                            match
+                            for match in matches
+                            if match.is_dir or file_filter(Path(match.location).name)
+                        ]
+                    if matches:
+                        matches = matches[: max_results - found]
+                        found += len(matches)
+                        yield matches
+                        if found >= max_results:
+                            return
+                    pending.update(self._submit(waiting, options))
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def shutdown(self) -> None:
+        """Shut down the pool of workers, if it's running."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+### subtree_search.py ends here
@@ -6,18 +6,34 @@ from __future__ import annotations
 
 ##############################################################################
 # Python imports.
-from os import sep
+from asyncio import to_thread
+from os import altsep, sep
 from pathlib import Path
+from typing import ClassVar
 
 ##############################################################################
 # Textual imports.
 from textual.suggester import Suggester
 
+##############################################################################
+# Local imports.
+from .listing_backends import AsyncListingBackend, ListingBackend, is_async_backend
+from .name_index import DirectoryNames, NameIndex
+from .parts import DirectoryNavigation
+
 
 ##############################################################################
 class SuggestPath(Suggester):
     """A textual `Input` suggester that suggests a path."""
 
+    directory_names: ClassVar[DirectoryNames] = DirectoryNavigation.directory_names
+    """The cache of directory names to take suggestions from.
+
+    This is the same cache that the directory navigation widget fills as it
+    loads directories, so the directory being looked at in a dialog never
+    needs to be listed again to make suggestions for it.
+    """
+
     def __init__(self, *, root: str | Path = ".") -> None:
         """Initialise the suggester
 
@@ -28,48 +44,127 @@ class SuggestPath(Suggester):
         super().__init__(use_cache=False, case_sensitive=True)
         self.root = Path(root)
         """The root directory to work from when taking suggestions."""
+        self.listing_backend: ListingBackend | AsyncListingBackend | None = None
+        """The backend that the directory being typed into is listed with."""
 
-    async def get_suggestion(self, value: str) -> str | None:
-        """Get suggestions for the given value.
+    def _typed(self, value: str) -> tuple[str, str, Path | None]:
+        """Work out what has been typed so far.
 
         Args:
-            value: The value to make a suggestion for.
+            value: The value that has been typed.
+
+        Returns:
+            The directory that has been typed (if any), the start of the
+                name within that directory, and the location to look for
+                names in (or `None` if it can't be worked out).
+        """
+        # Split the value into the directory that's been typed so far (if
+        # any), and the start of the name within that directory.
+        split = max(value.rfind(sep), value.rfind(altsep) if altsep else -1) + 1
+        directory, prefix = value[:split], value[split:]
+
+        # Work out where to look; this could be relative to the root, or it
+        # could be an absolute or home directory path in its own right.
+        try:
+            return directory, prefix, self.root / Path(directory).expanduser()
+        except RuntimeError:
+            return directory, prefix, None
+
+    @staticmethod
+    def _suggestion(directory: str, prefix: str, names: NameIndex[str]) -> str | None:
+        """Make a suggestion from the names in a directory.
+
+        Args:
+            directory: The directory that has been typed.
+            prefix: The start of the name within that directory.
+            names: The names in the directory.
 
         Returns:
             A suggested completion, or `None` if none could be made.
         """
+        # The names are sorted, so the first match that comes back will
+        # always be the same; also, if the value is the name of something
+        # that exists, that'll be the first match.
+        suggestion = names.first(prefix)
+        return None if suggestion is None else f"{directory}{suggestion}"
+
+    def _suggest(self, value: str) -> str | None:
+        """Make a suggestion for the given value.
 
-        # We're going to work with this as a Path.
-        path = self.root / value
+        Args:
+            value: The value to make a suggestion for.
+
+        Returns:
+            A suggested completion, or `None` if none could be made.
+        """
+        directory, prefix, location = self._typed(value)
 
-        # If the value, turned into a path, exists in some capacity, there's
-        # nothing to suggest; the user has typed in a thing that exists.
-        if path.exists():
+        # If there's no name being typed yet there's nothing to suggest.
+        if not prefix:
             return value
 
+        if location is None or (names := self.directory_names.names(location)) is None:
+            return None
+        return self._suggestion(directory, prefix, names)
+
+    async def _suggest_async(
+        self, value: str, backend: AsyncListingBackend
+    ) -> str | None:
+        """Make a suggestion for the given value, using an async backend.
+
+        Args:
+            value: The value to make a suggestion for.
+            backend: The backend to list directories with.
+
+        Returns:
+            A suggested completion, or `None` if none could be made.
+        """
+        directory, prefix, location = self._typed(value)
+        if not prefix:
+            return value
+        if location is None:
+            return None
+        modified = self.directory_names.modified_at(
+            (await backend.details(location)).mtime
+        )
+        if modified is not None and (
+            names := self.directory_names.cached(location, modified)
+        ):
+            return self._suggestion(directory, prefix, names)
         try:
-            suggestion = next(self.root.glob(f"{value}*"), None)
-            return str(suggestion).removeprefix(f"{self.root}/") if suggestion else ""
-        except NotImplementedError:
-            # If we get a NotImplementedError, the most likely reason is
-            # that the user has typed in an absolute path of some
-            # description. So here we give up on trying to find something
-            # relative to self.root and instead treat the whole input in
-            # isolation.
-            if (input_path := Path(value)).exists():
-                return value
-            # Note that while `os.sep` isn't the ideal test here, we use it
-            # to try and handle an annoying case we run into because the
-            # `stem` of a path isn't the file, but the last part of the
-            # part. So if we have a pure directory we've got no useful way
-            # of deciding on how to glob things. So this cleans up a rare
-            # but annoying bad suggestion.
-            suggestion = (
-                input_path
-                if value.endswith(sep)
-                else next(input_path.parent.glob(f"{input_path.stem}*"), None)
-            )
-            return str(suggestion or value)
+            listed = [entry.name for entry in await backend.listing(location)]
+        except OSError:
+            return None
+        # If there's no telling when the directory was last modified,
+        # there's no telling when the names go out of date, so they're
+        # only used this once.
+        return self._suggestion(
+            directory,
+            prefix,
+            NameIndex(((name, name) for name in listed), case_sensitive=True)
+            if modified is None
+            else self.directory_names.remember(location, modified, listed),
+        )
+
+    async def get_suggestion(self, value: str) -> str | None:
+        """Get suggestions for the given value.
+
+        Args:
+            value: The value to make a suggestion for.
+
+        Returns:
+            A suggested completion, or `None` if none could be made.
+
+        Suggestions are taken from a sorted index of the names in the
+        directory being typed into, which is only made again when that
+        directory changes; the work is done in a thread so that a slow
+        filesystem doesn't hold up typing. If the listing backend is an
+        async one, the directory is listed with that on the event loop
+        instead.
+        """
+        if self.listing_backend is not None and is_async_backend(self.listing_backend):
+            return await self._suggest_async(value, self.listing_backend)
+        return await to_thread(self._suggest, value)
 
 
 ### suggest_path.py ends here
@@ -0,0 +1,34 @@
+"""Provides the location of the library's cache of data kept between runs."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import sys
+from os import environ
+from pathlib import Path
+
+
+##############################################################################
+def user_cache_directory() -> Path:
+    """Get the directory in which to keep data that is cached between runs.
+
+    Returns:
+        The location of the cache directory.
+
+    Note:
+        The directory isn't created; it's up to the caller to do that when
+        something needs to be written to it.
+    """
+    if sys.platform == "win32":
+        base = Path(environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "textual-fspicker"
+
+
+### user_cache.py ends here
@@ -0,0 +1,3 @@
+"""Tests for the library, run with pytest."""
+
+### __init__.py ends here
@@ -0,0 +1,134 @@
+"""Tests for browsing inside zip and tar archives."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import tarfile
+from collections.abc import Callable
+from io import BytesIO
+from pathlib import Path
+from zipfile import ZipFile
+
+##############################################################################
+# pytest imports.
+import pytest
+
+##############################################################################
+# Local imports.
+from textual_fspicker.archives import ArchivePath
+
+
+##############################################################################
+def _zip(root: Path) -> Path:
+    """Make a zip archive to browse.
+
+    Args:
+        root: Where to make the archive.
+
+    Returns:
+        The location of the archive.
+    """
+    with ZipFile(archive := root / "bundle.zip", "w") as zipped:
+        zipped.writestr("docs/readme.txt", "Hello, World!")
+        zipped.writestr("docs/guide/intro.txt", "Introduction")
+        zipped.writestr("top.txt", "Top")
+        zipped.writestr("../escape.txt", "Out")
+    return archive
+
+
+##############################################################################
+def _tar(root: Path) -> Path:
+    """Make a tar archive to browse.
+
+    Args:
+        root: Where to make the archive.
+
+    Returns:
+        The location of the archive.
+    """
+    with tarfile.open(archive := root / "bundle.tar.gz", "w:gz") as tarred:
+        for name, content in (
+            ("docs/readme.txt", b"Hello, World!"),
+            ("../escape.txt", b"Out"),
+        ):
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tarred.addfile(info, BytesIO(content))
+    return archive
+
+
+##############################################################################
+def test_zip_members(tmp_path: Path) -> None:
+    """The members of a zip archive are listed as entries in directories."""
+    archive = ArchivePath(_zip(tmp_path))
+    assert archive.is_dir()
+    assert sorted(entry.name for entry in archive.iterdir()) == ["docs", "top.txt"]
+    assert sorted(entry.name for entry in (archive / "docs").iterdir()) == [
+        "guide",
+        "readme.txt",
+    ]
+    assert (archive / "docs" / "guide").is_dir()
+    assert (archive / "docs" / "readme.txt").is_file()
+    assert (archive / "docs" / "readme.txt").read_text() == "Hello, World!"
+    assert not (archive / "nowhere.txt").exists()
+
+
+##############################################################################
+def test_tar_members(tmp_path: Path) -> None:
+    """The members of a tar archive can be listed and read."""
+    archive = ArchivePath(_tar(tmp_path))
+    assert [entry.name for entry in archive.iterdir()] == ["docs"]
+    assert (archive / "docs" / "readme.txt").read_bytes() == b"Hello, World!"
+
+
+##############################################################################
+def test_tar_member_closes_archive(tmp_path: Path) -> None:
+    """Closing the stream of a tar member closes the archive too."""
+    with (ArchivePath(_tar(tmp_path)) / "docs" / "readme.txt").open("rb") as member:
+        archive = member._archive  # type: ignore[attr-defined]
+        assert member.read(5) == b"Hello"
+    assert archive.closed
+
+
+##############################################################################
+@pytest.mark.parametrize("make", [_zip, _tar])
+def test_members_outside_are_rejected(
+    tmp_path: Path, make: Callable[[Path], Path]
+) -> None:
+    """Members whose names would lead outside of the archive are left out."""
+    archive = ArchivePath(make(tmp_path))
+    assert "escape.txt" not in {entry.name for entry in archive.iterdir()}
+    assert not (archive / ".." / "escape.txt").exists()
+
+
+##############################################################################
+def test_dot_dot_leads_out(tmp_path: Path) -> None:
+    """Going up out of an archive leads back to the filesystem."""
+    (tmp_path / "beside.txt").write_text("Beside")
+    beside = ArchivePath(_zip(tmp_path)) / "docs" / ".." / ".." / "beside.txt"
+    assert beside.archive is None
+    assert beside.read_text() == "Beside"
+
+
+##############################################################################
+def test_located_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Where a path leads is only worked out once."""
+    found: list[ArchivePath] = []
+    find = ArchivePath._find
+
+    def counting(path: ArchivePath) -> tuple[Path, str | None]:
+        found.append(path)
+        return find(path)
+
+    monkeypatch.setattr(ArchivePath, "_find", counting)
+    readme = ArchivePath(_zip(tmp_path)) / "docs" / "readme.txt"
+    assert readme.is_file()
+    assert readme.stat().st_size == len("Hello, World!")
+    assert not readme.is_dir()
+    assert found == [readme]
+
+
+### test_archives.py ends here
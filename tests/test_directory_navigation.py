@@ -0,0 +1,70 @@
+"""Tests for navigating the filesystem."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import asyncio
+from pathlib import Path
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+
+##############################################################################
+# Local imports.
+from textual_fspicker.parts import DirectoryNavigation
+from textual_fspicker.parts.directory_navigation import DirectoryEntry
+
+
+##############################################################################
+class NavigationApp(App[None]):
+    """An app for navigating a directory."""
+
+    def __init__(self, location: Path) -> None:
+        """Initialise the app.
+
+        Args:
+            location: The location to navigate.
+        """
+        super().__init__()
+        self._location = location
+        """The location to navigate."""
+
+    def compose(self) -> ComposeResult:
+        """Compose the app."""
+        yield DirectoryNavigation(self._location)
+
+
+##############################################################################
+def test_jump_ahead_follows_display_order(tmp_path: Path) -> None:
+    """Typing a name jumps to the first matching entry on display."""
+    for name in ("apple.txt", "avocado.txt", "banana.txt"):
+        (tmp_path / name).touch()
+    (tmp_path / "azure").mkdir()
+    jumped: list[str] = []
+
+    async def jump() -> None:
+        app = NavigationApp(tmp_path)
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            navigation = app.query_one(DirectoryNavigation)
+            navigation.focus()
+            for keys in (("a",), ("a", "v"), ("b",)):
+                # Wait long enough that each key starts a new search.
+                await asyncio.sleep(DirectoryNavigation.TYPE_AHEAD_TIMEOUT + 0.1)
+                await pilot.press(*keys)
+                assert navigation.highlighted is not None
+                highlighted = navigation.get_option_at_index(navigation.highlighted)
+                assert isinstance(highlighted, DirectoryEntry)
+                jumped.append(highlighted.name)
+
+    asyncio.run(jump())
+    # Directories are shown first, so that's where "a" leads.
+    assert jumped == ["azure", "avocado.txt", "banana.txt"]
+
+
+### test_directory_navigation.py ends here
@@ -0,0 +1,89 @@
+"""Tests for working out the total size of directories."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import os
+import sys
+from pathlib import Path
+from typing import Any
+from zipfile import ZipFile
+
+##############################################################################
+# pytest imports.
+import pytest
+
+##############################################################################
+# Local imports.
+from textual_fspicker import directory_sizes
+from textual_fspicker.archives import ArchivePath
+from textual_fspicker.directory_sizes import DirectorySize, DirectorySizer
+
+
+##############################################################################
+def _tree(root: Path) -> Path:
+    """Make a small tree to measure.
+
+    Args:
+        root: Where to make the tree.
+
+    Returns:
+        The top of the tree.
+    """
+    (root / "top.bin").write_bytes(b"x" * 10)
+    (root / "below").mkdir()
+    (root / "below" / "inner.bin").write_bytes(b"x" * 100)
+    return root
+
+
+##############################################################################
+def test_walk(tmp_path: Path) -> None:
+    """Everything below a directory is added up."""
+    assert DirectorySizer._walk(_tree(tmp_path), lambda: False) == DirectorySize(110, 3)
+
+
+##############################################################################
+def test_walk_stays_on_one_device(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Directories on another device aren't walked into."""
+    root = _tree(tmp_path)
+
+    def elsewhere(path: Any, *args: Any, **kwargs: Any) -> os.stat_result:
+        """Make the directory being measured look like it's on another device."""
+        found = os.stat(path, *args, **kwargs)
+        return os.stat_result((*found[:2], found.st_dev + 1, *found[3:]))
+
+    monkeypatch.setattr(directory_sizes, "stat", elsewhere)
+    # The directory below is counted, but not what's in it.
+    assert DirectorySizer._walk(root, lambda: False) == DirectorySize(10, 2)
+
+
+##############################################################################
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="Hard links aren't reported by scandir on Windows"
+)
+def test_hard_links_counted_once(tmp_path: Path) -> None:
+    """A file with many hard links in the tree only adds to the size once."""
+    root = _tree(tmp_path)
+    (root / "below" / "again.bin").hardlink_to(root / "top.bin")
+    assert DirectorySizer._walk(root, lambda: False) == DirectorySize(110, 4)
+
+
+##############################################################################
+def test_only_local_directories(tmp_path: Path) -> None:
+    """Only directories on the local filesystem are measured."""
+    root = _tree(tmp_path)
+    with ZipFile(root / "archive.zip", "w") as archive:
+        archive.writestr("inside/file.txt", "Hello")
+    assert DirectorySizer._key(root) is not None
+    assert DirectorySizer._key(ArchivePath(root)) is not None
+    assert DirectorySizer._key(ArchivePath(root / "archive.zip")) is None
+    assert DirectorySizer._key(ArchivePath(root / "archive.zip" / "inside")) is None
+    assert dict(DirectorySizer().measure([ArchivePath(root / "archive.zip")])) == {}
+
+
+### test_directory_sizes.py ends here
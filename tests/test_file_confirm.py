@@ -0,0 +1,110 @@
+"""Tests for checking the file chosen in a file dialog."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import asyncio
+from pathlib import Path
+
+##############################################################################
+# pytest imports.
+import pytest
+
+##############################################################################
+# Textual imports.
+from textual.app import App
+from textual.widgets import Button, Input
+
+##############################################################################
+# Local imports.
+from textual_fspicker import FileOpen
+from textual_fspicker.base_dialog import Dialog
+from textual_fspicker.entry_details import EntryDetails
+
+
+##############################################################################
+class OpeningApp(App[None]):
+    """An app for opening a file."""
+
+    def __init__(self, location: Path) -> None:
+        """Initialise the app.
+
+        Args:
+            location: The location to open a file from.
+        """
+        super().__init__()
+        self._location = location
+        """The location to open a file from."""
+        self.opened: list[Path | None] = []
+        """The results of the dialog."""
+
+    def on_mount(self) -> None:
+        """Open the dialog."""
+        self.push_screen(FileOpen(self._location), self.opened.append)
+
+
+##############################################################################
+def test_confirm_times_out(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A chosen file that takes too long to check is reported, not chosen."""
+    (tmp_path / "slow.txt").touch()
+    release = asyncio.Event()
+    looked_up: list[str] = []
+    look_up = FileOpen._look_up
+
+    async def slow(dialog: FileOpen, value: str) -> tuple[Path, EntryDetails]:
+        looked_up.append(value)
+        await release.wait()
+        return await look_up(dialog, value)
+
+    monkeypatch.setattr(FileOpen, "_look_up", slow)
+    monkeypatch.setattr(FileOpen, "CONFIRM_TIMEOUT", 0.1)
+    app = OpeningApp(tmp_path)
+    confirming: list[tuple[str, bool]] = []
+
+    async def confirm() -> None:
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            dialog = app.screen.query_one(Dialog)
+            app.screen.query_one("InputBar Input", Input).value = "slow.txt"
+            await pilot.click("#select")
+            await pilot.pause()
+            confirming.append(
+                (
+                    str(dialog.border_subtitle),
+                    app.screen.query_one("#select", Button).disabled,
+                )
+            )
+            # Choosing again while the check is going on doesn't start
+            # another one.
+            app.screen.query_one("InputBar Input", Input).focus()
+            await pilot.press("enter")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert isinstance(app.screen, FileOpen)
+            confirming.append(
+                (
+                    str(dialog.border_subtitle),
+                    app.screen.query_one("#select", Button).disabled,
+                )
+            )
+            # Once the filesystem is responsive again, the file can be
+            # chosen.
+            release.set()
+            await pilot.click("#select")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+    asyncio.run(confirm())
+    assert confirming == [
+        (FileOpen.CONFIRMING, True),
+        (FileOpen.ERROR_CONFIRM_TIMED_OUT, False),
+    ]
+    assert looked_up == ["slow.txt", "slow.txt"]
+    assert app.opened == [tmp_path / "slow.txt"]
+
+
+### test_file_confirm.py ends here
@@ -0,0 +1,140 @@
+"""Tests for previewing the start of a file."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import os
+from pathlib import Path
+from zipfile import ZipFile
+
+##############################################################################
+# pytest imports.
+import pytest
+
+##############################################################################
+# Local imports.
+from textual_fspicker.archives import ArchivePath
+from textual_fspicker.file_preview import (
+    DEFAULT_WINDOW,
+    HEX_DUMP_BYTES,
+    HEX_DUMP_WIDTH,
+    FilePreviewer,
+)
+
+
+##############################################################################
+def test_large_file_is_bounded(tmp_path: Path) -> None:
+    """Only the preview window's worth of a large file is looked at."""
+    (large := tmp_path / "large.txt").write_text("x" * (DEFAULT_WINDOW * 100))
+    preview = FilePreviewer().preview(large)
+    assert preview is not None
+    assert not preview.binary
+    assert preview.truncated
+    assert preview.size == DEFAULT_WINDOW * 100
+    assert preview.content == "x" * DEFAULT_WINDOW
+
+
+##############################################################################
+def test_small_file_is_whole(tmp_path: Path) -> None:
+    """A file smaller than the preview window is previewed in full."""
+    (small := tmp_path / "small.txt").write_text("Hello, World!")
+    preview = FilePreviewer().preview(small)
+    assert preview is not None
+    assert preview.content == "Hello, World!"
+    assert not preview.truncated
+
+
+##############################################################################
+def test_empty_file(tmp_path: Path) -> None:
+    """An empty file is previewed as empty text."""
+    (tmp_path / "empty.txt").touch()
+    preview = FilePreviewer().preview(tmp_path / "empty.txt")
+    assert preview is not None
+    assert preview.content == ""
+    assert not preview.binary
+    assert not preview.truncated
+
+
+##############################################################################
+def test_split_character(tmp_path: Path) -> None:
+    """A character split by the end of the window doesn't make it binary."""
+    (split := tmp_path / "split.txt").write_text("é" * 10, encoding="utf-8")
+    preview = FilePreviewer(window=5).preview(split)
+    assert preview is not None
+    assert not preview.binary
+    assert preview.content == "éé"
+    assert preview.truncated
+
+
+##############################################################################
+def test_binary_file(tmp_path: Path) -> None:
+    """A binary file is previewed as a bounded hex dump."""
+    (binary := tmp_path / "data.bin").write_bytes(bytes(range(256)) * 64)
+    preview = FilePreviewer().preview(binary)
+    assert preview is not None
+    assert preview.binary
+    assert preview.truncated
+    lines = preview.content.splitlines()
+    assert len(lines) == HEX_DUMP_BYTES // HEX_DUMP_WIDTH
+    assert lines[0].startswith("00000000  00 01 02 03")
+
+
+##############################################################################
+def test_not_a_regular_file(tmp_path: Path) -> None:
+    """Only regular files are previewed."""
+    assert FilePreviewer().preview(tmp_path) is None
+    assert FilePreviewer().preview(tmp_path / "nowhere.txt") is None
+
+
+##############################################################################
+def test_archive_member_is_bounded(tmp_path: Path) -> None:
+    """A file inside an archive is also only read as far as the window."""
+    with ZipFile(archive := tmp_path / "bundle.zip", "w") as zipped:
+        zipped.writestr("large.txt", "y" * 1000)
+    preview = FilePreviewer(window=10).preview(ArchivePath(archive) / "large.txt")
+    assert preview is not None
+    assert preview.content == "y" * 10
+    assert preview.truncated
+    assert preview.size == 1000
+
+
+##############################################################################
+def test_previews_are_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A preview is reused until the file changes."""
+    heads: list[Path] = []
+    head = FilePreviewer._head
+
+    def counting(previewer: FilePreviewer, location: Path, size: int) -> bytes:
+        heads.append(location)
+        return head(previewer, location, size)
+
+    monkeypatch.setattr(FilePreviewer, "_head", counting)
+    (text := tmp_path / "text.txt").write_text("Before")
+    previewer = FilePreviewer()
+    assert (first := previewer.preview(text)) is not None
+    assert previewer.preview(text) is first
+    assert heads == [text]
+    text.write_text("After")
+    modified = text.stat().st_mtime_ns + 10**9
+    os.utime(text, ns=(modified, modified))
+    assert (second := previewer.preview(text)) is not None
+    assert second.content == "After"
+    assert heads == [text, text]
+
+
+##############################################################################
+def test_cache_is_bounded(tmp_path: Path) -> None:
+    """The cache only keeps so many previews."""
+    previewer = FilePreviewer(cache_size=3)
+    for file in range(10):
+        (text := tmp_path / f"file-{file}.txt").write_text(str(file))
+        assert previewer.preview(text) is not None
+    assert len(previewer._previews) == 3
+    previewer.clear()
+    assert not previewer._previews
+
+
+### test_file_preview.py ends here
@@ -0,0 +1,148 @@
+"""Tests for the persistent index of filenames."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import os
+import shutil
+from pathlib import Path
+
+##############################################################################
+# pytest imports.
+import pytest
+
+##############################################################################
+# Local imports.
+from textual_fspicker.filename_index import FilenameIndex
+
+
+##############################################################################
+def _tree(root: Path) -> Path:
+    """Make a tree to index.
+
+    Args:
+        root: Where to make the tree.
+
+    Returns:
+        The top of the tree.
+    """
+    for name in (
+        "notes.txt",
+        "project/readme.md",
+        "project/src/main.py",
+        "project/src/util.py",
+        "project/.secret/key.txt",
+        "archive/old-notes.txt",
+    ):
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).touch()
+    return root
+
+
+##############################################################################
+def _touch_later(directory: Path) -> None:
+    """Make sure a change to a directory can be seen, however coarse the times.
+
+    Args:
+        directory: The directory to change the time of.
+    """
+    stat = directory.stat()
+    os.utime(directory, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+##############################################################################
+def _names(
+    index: FilenameIndex,
+    root: Path,
+    query: str,
+    include_hidden: bool = False,
+    directories_only: bool = False,
+) -> set[str]:
+    """Search an index, and get the names of what was found.
+
+    Args:
+        index: The index to search.
+        root: The location to search below.
+        query: The query to search for.
+        include_hidden: Should hidden entries be found?
+        directories_only: Should only directories be found?
+
+    Returns:
+        The paths of what was found, relative to the root.
+    """
+    return {
+        Path(match.location).relative_to(root).as_posix()
+        for match in index.search(
+            root,
+            query,
+            include_hidden=include_hidden,
+            directories_only=directories_only,
+        )
+    }
+
+
+##############################################################################
+def test_search(tmp_path: Path) -> None:
+    """Entries are found by substring, prefix or glob, leaving out hidden ones."""
+    index = FilenameIndex(database=tmp_path / "index.db")
+    assert index.updated(root := _tree(tmp_path / "tree")) is None
+    assert index.update(root)
+    assert index.updated(root) is not None
+    assert index.updated(root / "project") is not None
+    assert _names(index, root, "notes") == {"notes.txt", "archive/old-notes.txt"}
+    assert _names(index, root, "MAIN*") == {"project/src/main.py"}
+    assert _names(index, root, "*.py") == {"project/src/main.py", "project/src/util.py"}
+    assert _names(index, root / "project", "*.txt") == set()
+    assert _names(index, root / "project", "*.txt", include_hidden=True) == {
+        ".secret/key.txt"
+    }
+    assert _names(index, root, "src", directories_only=True) == {"project/src"}
+
+
+##############################################################################
+def test_incremental_update(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Only directories that have changed are listed again."""
+    index = FilenameIndex(database=tmp_path / "index.db")
+    index.update(root := _tree(tmp_path / "tree"))
+    listed: list[str] = []
+    list_directory = index._list
+
+    def counting(directory: str) -> list[tuple[str, bool, bool]] | None:
+        listed.append(directory)
+        return list_directory(directory)
+
+    monkeypatch.setattr(index, "_list", counting)
+    (root / "project" / "src" / "extra.py").touch()
+    _touch_later(root / "project" / "src")
+    assert index.update(root)
+    assert listed == [str(root / "project" / "src")]
+    assert _names(index, root, "extra") == {"project/src/extra.py"}
+
+
+##############################################################################
+def test_deletion(tmp_path: Path) -> None:
+    """Entries that have gone are taken out of the index."""
+    index = FilenameIndex(database=tmp_path / "index.db")
+    index.update(root := _tree(tmp_path / "tree"))
+    (root / "notes.txt").unlink()
+    shutil.rmtree(root / "project" / "src")
+    _touch_later(root)
+    _touch_later(root / "project")
+    index.update(root)
+    assert _names(index, root, "notes") == {"archive/old-notes.txt"}
+    assert _names(index, root, "*.py") == set()
+    assert _names(index, root, "src") == set()
+
+
+##############################################################################
+def test_cancelled_update(tmp_path: Path) -> None:
+    """A cancelled update says so, and doesn't mark the root as updated."""
+    index = FilenameIndex(database=tmp_path / "index.db")
+    assert not index.update(root := _tree(tmp_path / "tree"), lambda: True)
+    assert index.updated(root) is None
+
+
+### test_filename_index.py ends here
@@ -0,0 +1,116 @@
+"""Tests for evaluating expensive filters."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import os
+from pathlib import Path
+from threading import Event
+from time import monotonic
+
+##############################################################################
+# Local imports.
+from textual_fspicker import Filter
+from textual_fspicker.entry_details import EntryDetails
+from textual_fspicker.filter_evaluation import CANCEL_CHECK_INTERVAL, FilterEvaluator
+
+
+##############################################################################
+def _files(root: Path, count: int) -> list[EntryDetails]:
+    """Make some files to evaluate filters against.
+
+    Args:
+        root: Where to make the files.
+        count: The number of files to make.
+
+    Returns:
+        The details of the files.
+    """
+    for file in range(count):
+        (root / f"{file}.txt").write_text(f"{file}")
+    return [EntryDetails.of(root / f"{file}.txt") for file in range(count)]
+
+
+##############################################################################
+def test_results_are_cached(tmp_path: Path) -> None:
+    """A file is only looked at again once it has changed."""
+    tested: list[Path] = []
+
+    def odd(path: Path) -> bool:
+        tested.append(path)
+        return int(path.read_text()) % 2 == 1
+
+    odd_files = Filter("Odd", odd, expensive=True)
+    evaluator = FilterEvaluator()
+    files = _files(tmp_path, 4)
+    first = dict(evaluator.evaluate(odd_files, files))
+    assert dict(evaluator.evaluate(odd_files, files)) == first
+    assert {details.location for details, passed in first.items() if passed} == {
+        tmp_path / "1.txt",
+        tmp_path / "3.txt",
+    }
+    assert sorted(tested) == sorted(details.location for details in files)
+    # Change one of the files, and only that one is looked at again.
+    (changed := tmp_path / "2.txt").write_text("5")
+    stat = changed.stat()
+    os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    tested.clear()
+    assert dict(evaluator.evaluate(odd_files, [EntryDetails.of(changed)])) == {
+        EntryDetails.of(changed): True
+    }
+    assert tested == [changed]
+
+
+##############################################################################
+def test_errors_fail(tmp_path: Path) -> None:
+    """A filter that raises an error doesn't pass the file."""
+
+    def broken(_: Path) -> bool:
+        raise OSError("Can't look at the file")
+
+    evaluator = FilterEvaluator()
+    files = _files(tmp_path, 2)
+    assert dict(
+        evaluator.evaluate(Filter("Broken", broken, expensive=True), files)
+    ) == {details: False for details in files}
+
+
+##############################################################################
+def test_cache_is_bounded(tmp_path: Path) -> None:
+    """The cache only keeps the most recent results."""
+    files = _files(tmp_path, 10)
+    for cache_size in (0, 3):
+        evaluator = FilterEvaluator(cache_size=cache_size)
+        list(evaluator.evaluate(Filter("Any", lambda _: True, expensive=True), files))
+        assert len(evaluator._results) == max(cache_size, 1)
+
+
+##############################################################################
+def test_cancel_slow_filter(tmp_path: Path) -> None:
+    """Cancelling an evaluation doesn't wait for a slow filter to finish."""
+    release = Event()
+    cancelled = Event()
+
+    def slow(_: Path) -> bool:
+        release.wait(10)
+        return True
+
+    evaluator = FilterEvaluator()
+    started = monotonic()
+    try:
+        evaluation = evaluator.evaluate(
+            Filter("Slow", slow, expensive=True), _files(tmp_path, 2), cancelled.is_set
+        )
+        cancelled.set()
+        assert list(evaluation) == []
+        assert monotonic() - started < 1 + CANCEL_CHECK_INTERVAL
+    finally:
+        release.set()
+    # Nothing was finished, so nothing should have been cached.
+    assert evaluator._results == {}
+
+
+### test_filter_evaluation.py ends here
@@ -0,0 +1,108 @@
+"""Tests for showing the first page of a directory while it loads."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from pathlib import Path
+from random import Random
+
+##############################################################################
+# pytest imports.
+import pytest
+
+##############################################################################
+# Rich imports.
+from rich.style import Style
+
+##############################################################################
+# Local imports.
+from textual_fspicker.entry_details import EntryDetails
+from textual_fspicker.parts.directory_navigation import (
+    DirectoryEntry,
+    DirectoryEntryStyling,
+    _FirstPage,
+)
+from textual_fspicker.sort_modes import SortMode
+
+
+##############################################################################
+def _entries(count: int) -> list[DirectoryEntry]:
+    """Make some entries, in no particular order.
+
+    Args:
+        count: The number of entries to make.
+
+    Returns:
+        The entries, roughly a third of which are directories.
+    """
+    styles = DirectoryEntryStyling(Style(), Style(), Style(), Style())
+    randomly = Random(42)
+    entries = [
+        DirectoryEntry(
+            EntryDetails(
+                Path(name := f"entry-{number}"),
+                name,
+                is_dir := number % 3 == 0,
+                not is_dir,
+                False,
+                randomly.randrange(1_000),
+                float(randomly.randrange(1_000)),
+            ),
+            styles,
+        )
+        for number in range(count)
+    ]
+    randomly.shuffle(entries)
+    return entries
+
+
+##############################################################################
+@pytest.mark.parametrize("mode", list(SortMode))
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sorted_first_page(mode: SortMode, reverse: bool) -> None:
+    """The first page holds what would be first were everything sorted."""
+    entries = _entries(200)
+    page = _FirstPage(20, mode, reverse, True)
+    for entry in entries:
+        page.offer(entry)
+    directories = sorted(
+        (entry for entry in entries if entry.is_dir),
+        key=lambda entry: entry.sort_key(mode),
+        reverse=reverse,
+    )
+    files = sorted(
+        (entry for entry in entries if not entry.is_dir),
+        key=lambda entry: entry.sort_key(mode),
+        reverse=reverse,
+    )
+    assert page.changed
+    assert page.entries == (directories + files)[:20]
+    assert not page.changed
+
+
+##############################################################################
+def test_unsorted_first_page() -> None:
+    """Without sorting, the first page holds the first entries to arrive."""
+    entries = _entries(50)
+    page = _FirstPage(10, SortMode.NAME, False, False)
+    for entry in entries:
+        page.offer(entry)
+    assert page.entries == entries[:10]
+
+
+##############################################################################
+def test_short_directory() -> None:
+    """A directory with fewer entries than fit on a page is all on the page."""
+    entries = _entries(5)
+    page = _FirstPage(10, SortMode.NAME, False, True)
+    for entry in entries:
+        page.offer(entry)
+    assert sorted(entry.name for entry in page.entries) == sorted(
+        entry.name for entry in entries
+    )
+
+
+### test_first_page.py ends here
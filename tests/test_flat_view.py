@@ -0,0 +1,127 @@
+"""Tests for the flat view of the tree below a directory."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import asyncio
+from pathlib import Path
+from typing import Final
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+
+##############################################################################
+# Local imports.
+from textual_fspicker import Filter
+from textual_fspicker.listing_backends import FlatListing
+from textual_fspicker.parts import DirectoryNavigation
+from textual_fspicker.parts.directory_navigation import DirectoryEntry
+
+##############################################################################
+CSV_FILES: Final[Filter] = Filter.from_globs("CSV", "data_*.csv", ".data_*.csv")
+"""A name-only filter to view the tree through."""
+
+
+##############################################################################
+def _tree(root: Path) -> Path:
+    """Make a small tree of files to view.
+
+    Args:
+        root: Where to make the tree.
+
+    Returns:
+        The top of the tree.
+    """
+    for name in (
+        "data_0.csv",
+        "notes.txt",
+        "sub/data_1.csv",
+        "sub/deeper/data_2.csv",
+        "sub/.data_3.csv",
+        "sub/other.csv",
+    ):
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).touch()
+    return root
+
+
+##############################################################################
+def test_name_filter_on_flat_listing(tmp_path: Path) -> None:
+    """Name-only filters test the name of an entry, not its relative path."""
+    passed = {
+        entry.name
+        for entry in FlatListing(include_hidden=True).listing(_tree(tmp_path))
+        if CSV_FILES.test_details(entry.details)
+    }
+    assert passed == {
+        "data_0.csv",
+        "sub/data_1.csv",
+        "sub/deeper/data_2.csv",
+        "sub/.data_3.csv",
+    }
+
+
+##############################################################################
+class FlatApp(App[None]):
+    """An app for viewing a tree flat."""
+
+    def __init__(self, location: Path) -> None:
+        """Initialise the app.
+
+        Args:
+            location: The location to view.
+        """
+        super().__init__()
+        self._location = location
+        """The location to view."""
+
+    def compose(self) -> ComposeResult:
+        """Compose the app."""
+        yield DirectoryNavigation(self._location)
+
+    def on_mount(self) -> None:
+        """View the tree flat, through the filter."""
+        navigation = self.query_one(DirectoryNavigation)
+        navigation.flat_view = True
+        navigation.file_filter = CSV_FILES
+
+
+##############################################################################
+def test_flat_view_filtering(tmp_path: Path) -> None:
+    """The flat view honours the filter and hidden setting for every entry."""
+    shown: list[set[str]] = []
+
+    async def view() -> None:
+        app = FlatApp(_tree(tmp_path))
+        async with app.run_test() as pilot:
+            navigation = app.query_one(DirectoryNavigation)
+            for show_hidden in (False, True, False):
+                navigation.show_hidden = show_hidden
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                shown.append(
+                    {
+                        option.name
+                        for option in navigation.options
+                        if isinstance(option, DirectoryEntry) and option.name != ".."
+                    }
+                )
+
+    asyncio.run(view())
+    assert (
+        shown[0]
+        == shown[2]
+        == {
+            "data_0.csv",
+            "sub/data_1.csv",
+            "sub/deeper/data_2.csv",
+        }
+    )
+    assert shown[1] == shown[0] | {"sub/.data_3.csv"}
+
+
+### test_flat_view.py ends here
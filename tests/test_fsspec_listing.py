@@ -0,0 +1,285 @@
+"""Tests for listing directories on an fsspec filesystem."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import asyncio
+from collections import Counter
+from pathlib import Path, PurePosixPath
+from typing import Any, Final
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+
+##############################################################################
+# Local imports.
+from textual_fspicker.listing_backends import (
+    AsyncFsspecListing,
+    FsspecListing,
+    is_async_backend,
+)
+from textual_fspicker.parts import DirectoryNavigation
+from textual_fspicker.parts.directory_navigation import DirectoryEntry
+
+##############################################################################
+ENTRIES: Final[int] = 50
+"""The number of entries in the directory that is listed."""
+
+
+##############################################################################
+class CountingFilesystem:
+    """An in-memory stand-in for an fsspec filesystem that counts its calls."""
+
+    def __init__(self) -> None:
+        """Initialise the filesystem."""
+        self.calls: Counter[str] = Counter()
+        """The number of calls made to each method of the filesystem."""
+        self._entries: dict[str, dict[str, Any]] = {
+            "/": {"name": "/", "type": "directory", "size": 0},
+            "/data": {
+                "name": "/data",
+                "type": "directory",
+                "size": 0,
+                "mtime": 1_700_000_000.0,
+            },
+            "/data/sub": {"name": "/data/sub", "type": "directory", "size": 0},
+        }
+        """The details of every entry on the filesystem."""
+        for file in range(ENTRIES - 1):
+            name = f"/data/file-{file}.txt"
+            self._entries[name] = {
+                "name": name,
+                "type": "file",
+                "size": file,
+                "mtime": 1_700_000_000.0 + file,
+            }
+
+    def ls(self, path: str, detail: bool = True) -> list[dict[str, Any]]:
+        """List the content of a directory.
+
+        Args:
+            path: The path of the directory to list.
+            detail: Should the details of each entry be included?
+
+        Returns:
+            The details of each entry in the directory.
+        """
+        self.calls["ls"] += 1
+        if path not in self._entries:
+            raise FileNotFoundError(path)
+        return [
+            dict(info)
+            for name, info in self._entries.items()
+            if name != path and str(PurePosixPath(name).parent) == path
+        ]
+
+    def info(self, path: str) -> dict[str, Any]:
+        """Get the details of a location.
+
+        Args:
+            path: The path of the location.
+
+        Returns:
+            The details of the location.
+        """
+        self.calls["info"] += 1
+        try:
+            return dict(self._entries[path])
+        except KeyError:
+            raise FileNotFoundError(path) from None
+
+
+##############################################################################
+def test_listing_is_one_call() -> None:
+    """Listing a directory is a single call, with no call per entry."""
+    filesystem = CountingFilesystem()
+    listed = FsspecListing(filesystem).listing(Path("/data"))
+    details = {entry.name: entry.details for entry in listed}
+    assert filesystem.calls == {"ls": 1}
+    assert len(details) == ENTRIES
+    assert details["sub"].is_dir
+    assert details["file-3.txt"].is_file
+    assert details["file-3.txt"].size == 3
+    assert details["file-3.txt"].mtime == 1_700_000_003.0
+
+
+##############################################################################
+def test_details_of_missing_location() -> None:
+    """A location that isn't on the filesystem is taken not to exist."""
+    details = FsspecListing(CountingFilesystem()).details(Path("/nowhere"))
+    assert not (details.is_dir or details.is_file)
+
+
+##############################################################################
+class ListingApp(App[None]):
+    """An app for listing a directory on a stand-in filesystem."""
+
+    def __init__(self, filesystem: CountingFilesystem) -> None:
+        """Initialise the app.
+
+        Args:
+            filesystem: The filesystem to list.
+        """
+        super().__init__()
+        self._filesystem = filesystem
+        """The filesystem to list."""
+
+    def compose(self) -> ComposeResult:
+        """Compose the app."""
+        yield DirectoryNavigation(
+            "/data", listing_backend=FsspecListing(self._filesystem)
+        )
+
+
+##############################################################################
+def test_navigation_lists_with_one_call() -> None:
+    """The navigation lists with one call, and doesn't look at each entry."""
+    filesystem = CountingFilesystem()
+    shown: list[str] = []
+
+    async def list_directory() -> None:
+        app = ListingApp(filesystem)
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            shown.extend(
+                option.name
+                for option in app.query_one(DirectoryNavigation).options
+                if isinstance(option, DirectoryEntry)
+            )
+
+    asyncio.run(list_directory())
+    assert len(shown) == ENTRIES + 1
+    # The only things looked at on their own are the directory, for when it
+    # was last modified, and its parent; both on the filesystem that it was
+    # listed from.
+    assert filesystem.calls == {"ls": 1, "info": 2}
+    assert (
+        DirectoryNavigation.directory_names.cached(Path("/data"), 1_700_000_000 * 10**9)
+        is not None
+    )
+
+
+##############################################################################
+class AsyncCountingFilesystem(CountingFilesystem):
+    """An async stand-in for an fsspec filesystem that counts its calls."""
+
+    def __init__(self) -> None:
+        """Initialise the filesystem."""
+        super().__init__()
+        self.release = asyncio.Event()
+        """Event that lets listings finish."""
+        self.release.set()
+
+    async def _ls(self, path: str, detail: bool = True) -> list[dict[str, Any]]:
+        """List the content of a directory, once listings are allowed to finish.
+
+        Args:
+            path: The path of the directory to list.
+            detail: Should the details of each entry be included?
+
+        Returns:
+            The details of each entry in the directory.
+        """
+        await self.release.wait()
+        return self.ls(path, detail)
+
+    async def _info(self, path: str) -> dict[str, Any]:
+        """Get the details of a location.
+
+        Args:
+            path: The path of the location.
+
+        Returns:
+            The details of the location.
+        """
+        return self.info(path)
+
+
+##############################################################################
+def test_async_listing() -> None:
+    """An async backend lists a directory with a single awaited call."""
+    filesystem = AsyncCountingFilesystem()
+    backend = AsyncFsspecListing(filesystem)
+    assert is_async_backend(backend)
+    assert not is_async_backend(FsspecListing(filesystem))
+
+    async def list_directory() -> dict[str, bool]:
+        return {
+            entry.name: entry.details.is_dir
+            for entry in await backend.listing(Path("/data"))
+        }
+
+    listed = asyncio.run(list_directory())
+    assert filesystem.calls == {"ls": 1}
+    assert len(listed) == ENTRIES
+    assert listed["sub"]
+    assert not listed["file-0.txt"]
+
+
+##############################################################################
+class AsyncListingApp(App[None]):
+    """An app for listing a directory on an async stand-in filesystem."""
+
+    def __init__(self, filesystem: AsyncCountingFilesystem) -> None:
+        """Initialise the app.
+
+        Args:
+            filesystem: The filesystem to list.
+        """
+        super().__init__()
+        self._filesystem = filesystem
+        """The filesystem to list."""
+
+    def compose(self) -> ComposeResult:
+        """Compose the app."""
+        yield DirectoryNavigation(
+            "/data", listing_backend=AsyncFsspecListing(self._filesystem)
+        )
+
+
+##############################################################################
+def test_navigation_with_async_backend() -> None:
+    """A listing that is overtaken by a move elsewhere is never shown."""
+    filesystem = AsyncCountingFilesystem()
+    shown: list[list[str]] = []
+
+    async def list_directory() -> None:
+        filesystem.release.clear()
+        app = AsyncListingApp(filesystem)
+        async with app.run_test() as pilot:
+            navigation = app.query_one(DirectoryNavigation)
+            await pilot.pause()
+            navigation.location = Path("/data/sub")
+            await pilot.pause()
+            filesystem.release.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            shown.append(
+                [
+                    option.name
+                    for option in navigation.options
+                    if isinstance(option, DirectoryEntry)
+                ]
+            )
+            navigation.location = Path("/data")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            shown.append(
+                [
+                    option.name
+                    for option in navigation.options
+                    if isinstance(option, DirectoryEntry)
+                ]
+            )
+
+    asyncio.run(list_directory())
+    assert shown[0] == [".."]
+    assert len(shown[1]) == ENTRIES + 1
+
+
+### test_fsspec_listing.py ends here
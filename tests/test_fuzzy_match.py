@@ -0,0 +1,55 @@
+"""Tests for narrowing names with a fuzzy match."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# pytest imports.
+import pytest
+
+##############################################################################
+# Local imports.
+from textual_fspicker.fuzzy_match import FuzzyNarrowing, fuzzy_score
+
+
+##############################################################################
+def test_no_match() -> None:
+    """A name without the characters of the query doesn't match."""
+    assert fuzzy_score("xyz", "data.txt") is None
+
+
+##############################################################################
+def test_word_start_scores_higher() -> None:
+    """Characters that start words score higher than those that don't."""
+    starts = fuzzy_score("fb", "fooBar")
+    middles = fuzzy_score("fb", "foobar")
+    assert starts is not None and middles is not None
+    assert starts > middles
+
+
+##############################################################################
+@pytest.mark.parametrize(
+    "query, name",
+    [
+        ("b", "ßb"),
+        ("txt", "Maß.txt"),
+        ("ss", "Maß"),
+        ("b", "ßB"),
+        ("i", "İstanbul"),
+    ],
+)
+def test_names_that_grow_when_folded(query: str, name: str) -> None:
+    """Names that get longer when casefolded can still be scored."""
+    assert fuzzy_score(query, name) is not None
+
+
+##############################################################################
+def test_narrowing_non_ascii_names() -> None:
+    """Narrowing copes with names that get longer when casefolded."""
+    assert set(
+        FuzzyNarrowing().narrow("txt", ["Maß.txt", "Straße.py", "notes.txt"]) or {}
+    ) == {"Maß.txt", "notes.txt"}
+
+
+### test_fuzzy_match.py ends here
@@ -0,0 +1,98 @@
+"""Tests for the rules that decide which entries are ignored."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import os
+from pathlib import Path
+
+##############################################################################
+# Local imports.
+from textual_fspicker.ignore_rules import IgnoreRules
+
+
+##############################################################################
+def test_negation(tmp_path: Path) -> None:
+    """A negated pattern brings back what an earlier pattern ignored."""
+    (tmp_path / ".gitignore").write_text("*.log\n!keep.log\n")
+    matcher = IgnoreRules().matcher(tmp_path)
+    assert matcher.ignores("debug.log", False)
+    assert not matcher.ignores("keep.log", False)
+    assert not matcher.ignores("notes.txt", False)
+
+
+##############################################################################
+def test_directory_only(tmp_path: Path) -> None:
+    """A directory-only pattern only ignores directories."""
+    (tmp_path / ".gitignore").write_text("build/\n")
+    matcher = IgnoreRules().matcher(tmp_path)
+    assert matcher.ignores("build", True)
+    assert not matcher.ignores("build", False)
+    assert matcher.ignores("build") is None
+
+
+##############################################################################
+def test_repository_chain(tmp_path: Path) -> None:
+    """Inside a repository, ignore files up to its root apply."""
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".gitignore").write_text("*.log\nsub/generated.py\n")
+    (sub := tmp_path / "sub").mkdir()
+    (sub / ".gitignore").write_text("!debug.log\n")
+    matcher = IgnoreRules().matcher(sub)
+    assert matcher.ignores("trace.log", False)
+    assert not matcher.ignores("debug.log", False)
+    assert matcher.ignores("generated.py", False)
+
+
+##############################################################################
+def test_no_repository(tmp_path: Path) -> None:
+    """Outside a repository, only the directory's own ignore files apply."""
+    (tmp_path / ".gitignore").write_text("*.log\n")
+    (sub := tmp_path / "sub").mkdir()
+    assert not IgnoreRules().matcher(sub).ignores("trace.log", False)
+
+
+##############################################################################
+def test_no_discovery(tmp_path: Path) -> None:
+    """Without discovery, only the given patterns apply."""
+    (tmp_path / ".gitignore").write_text("*.log\n")
+    matcher = IgnoreRules("*.tmp").matcher(tmp_path, discover=False)
+    assert matcher.ignores("scratch.tmp", False)
+    assert not matcher.ignores("trace.log", False)
+
+
+##############################################################################
+def test_changed_ignore_file(tmp_path: Path) -> None:
+    """A change to an ignore file is picked up."""
+    (ignore_file := tmp_path / ".gitignore").write_text("*.log\n")
+    rules = IgnoreRules()
+    assert rules.matcher(tmp_path).ignores("trace.log", False)
+    ignore_file.write_text("*.tmp\n")
+    # Make sure the change can be seen, however coarse the file times are.
+    stat = ignore_file.stat()
+    os.utime(ignore_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert not rules.matcher(tmp_path).ignores("trace.log", False)
+
+
+##############################################################################
+def test_caches_are_bounded(tmp_path: Path) -> None:
+    """The caches only keep the most recently looked at directories."""
+    rules = IgnoreRules(cache_size=3)
+    for directory in range(10):
+        (tmp_path / f"{directory}").mkdir()
+        rules.matcher(tmp_path / f"{directory}")
+    assert len(rules._matchers) == 3
+    assert len(rules._defined) <= 3
+    assert len(rules._roots) <= 3
+    # Looking a directory up again keeps it in the cache.
+    rules.matcher(tmp_path / "7")
+    rules.matcher(tmp_path / "0")
+    assert set(rules._matchers) == {
+        tmp_path / f"{directory}" for directory in (9, 7, 0)
+    }
+
+
+### test_ignore_rules.py ends here
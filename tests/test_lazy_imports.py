@@ -0,0 +1,71 @@
+"""Tests that importing the library doesn't import more than it needs."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import subprocess
+import sys
+from typing import Final
+
+##############################################################################
+HEAVY: Final[tuple[str, ...]] = (
+    "concurrent.futures.process",
+    "mmap",
+    "multiprocessing",
+    "sqlite3",
+    "tarfile",
+    "zipfile",
+)
+"""Modules that should only be imported once they're used."""
+
+
+##############################################################################
+def _newly_imported(statement: str) -> set[str]:
+    """Find the modules that a statement imports, in a fresh interpreter.
+
+    Args:
+        statement: The import statement to run.
+
+    Returns:
+        The names of the modules that were imported by the statement.
+    """
+    return set(
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys\n"
+                "before = set(sys.modules)\n"
+                f"{statement}\n"
+                "print('\\n'.join(set(sys.modules) - before))",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split()
+    )
+
+
+##############################################################################
+def test_package_import_is_light() -> None:
+    """Importing the package doesn't import Textual."""
+    assert "textual" not in _newly_imported("import textual_fspicker")
+
+
+##############################################################################
+def test_heavy_modules_are_imported_when_used() -> None:
+    """Importing the widgets and their support doesn't import heavy modules."""
+    imported = _newly_imported(
+        "import textual_fspicker.parts\n"
+        "from textual_fspicker import (\n"
+        "    ArchivePath, FileOpen, FilenameIndex, ListingCache, MultiFileOpen\n"
+        ")\n"
+        "import textual_fspicker.subtree_search"
+    )
+    assert not imported.intersection(HEAVY)
+
+
+### test_lazy_imports.py ends here
@@ -0,0 +1,64 @@
+"""Tests for resolving symbolic links."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import sys
+from pathlib import Path
+
+##############################################################################
+# pytest imports.
+import pytest
+
+##############################################################################
+# Local imports.
+from textual_fspicker.link_resolver import LinkLoopError, LinkResolver
+
+##############################################################################
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Making links needs privileges on Windows"
+)
+
+
+##############################################################################
+def test_resolve_chain(tmp_path: Path) -> None:
+    """A chain of links resolves to where it finally leads."""
+    (target := tmp_path / "target").touch()
+    (tmp_path / "first").symlink_to("second")
+    (tmp_path / "second").symlink_to("target")
+    assert LinkResolver().resolve(tmp_path / "first") == target.resolve()
+
+
+##############################################################################
+def test_loop(tmp_path: Path) -> None:
+    """A link that loops is reported as such."""
+    (tmp_path / "ping").symlink_to("pong")
+    (tmp_path / "pong").symlink_to("ping")
+    resolver = LinkResolver()
+    assert resolver.is_loop(tmp_path / "ping")
+    with pytest.raises(LinkLoopError):
+        resolver.resolve(tmp_path / "ping")
+
+
+##############################################################################
+def test_cache_is_bounded(tmp_path: Path) -> None:
+    """The cache only keeps the most recently looked at links."""
+    resolver = LinkResolver(cache_size=3)
+    for link in range(10):
+        (target := tmp_path / f"target-{link}").touch()
+        (tmp_path / f"link-{link}").symlink_to(target.name)
+        assert resolver.resolve(tmp_path / f"link-{link}") == target.resolve()
+    assert len(resolver._resolved) == 3
+    assert len(resolver._targets) == 3
+    # Looking a link up again keeps it in the cache.
+    resolver.resolve(tmp_path / "link-7")
+    resolver.resolve(tmp_path / "link-0")
+    assert {location for location, *_ in resolver._resolved} == {
+        str(tmp_path / f"link-{link}") for link in (9, 7, 0)
+    }
+
+
+### test_link_resolver.py ends here
@@ -0,0 +1,31 @@
+"""Tests for listing local directories."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from pathlib import Path
+
+##############################################################################
+# Local imports.
+from textual_fspicker.entry_details import EntryDetails
+from textual_fspicker.listing_backends import PathListing
+
+
+##############################################################################
+def test_scanned_details_match_looked_up_details(tmp_path: Path) -> None:
+    """Scanning a local directory finds the same details as looking at each entry."""
+    (tmp_path / "file.txt").write_text("hello")
+    (tmp_path / "directory").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "file.txt")
+    (tmp_path / "broken").symlink_to(tmp_path / "nowhere")
+    listed = {entry.name: entry.details for entry in PathListing().listing(tmp_path)}
+    assert listed == {
+        name: EntryDetails.of(tmp_path / name)
+        for name in ("file.txt", "directory", "link", "broken")
+    }
+
+
+### test_listing_backends.py ends here
@@ -0,0 +1,155 @@
+"""Tests for the cache of directory listings."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import asyncio
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+
+##############################################################################
+# Local imports.
+from textual_fspicker.entry_details import EntryDetails
+from textual_fspicker.listing_cache import ListingCache
+from textual_fspicker.parts import DirectoryNavigation
+from textual_fspicker.parts.directory_navigation import DirectoryEntry
+
+
+##############################################################################
+def _listing(directory: Path, *names: str) -> list[EntryDetails]:
+    """Make the listing of a directory.
+
+    Args:
+        directory: The directory to make the listing of.
+        names: The names of the files in the directory.
+
+    Returns:
+        The details of the files.
+    """
+    return [
+        EntryDetails(directory / name, name, False, True, False, 1, 0.0)
+        for name in names
+    ]
+
+
+##############################################################################
+def _sizes(cache: ListingCache) -> tuple[int, int]:
+    """Get the size of the cache, as it is kept and as it really is.
+
+    Args:
+        cache: The cache to get the size of.
+
+    Returns:
+        The total size that is kept, and the real total size.
+    """
+    with closing(sqlite3.connect(cache.database)) as connection:
+        ((kept,),) = connection.execute("SELECT size FROM total")
+        ((real,),) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM listings")
+    return kept, real
+
+
+##############################################################################
+def test_store_and_fetch(tmp_path: Path) -> None:
+    """A listing that is stored can be fetched, and stored again."""
+    cache = ListingCache(database=tmp_path / "cache.db")
+    directory = tmp_path / "directory"
+    assert cache.fetch(directory) is None
+    cache.store(directory, _listing(directory, "a.txt", "b.txt"))
+    assert cache.fetch(directory) == _listing(directory, "a.txt", "b.txt")
+    cache.store(directory, _listing(directory, "c.txt"))
+    assert cache.fetch(directory) == _listing(directory, "c.txt")
+    kept, real = _sizes(cache)
+    assert kept == real > 0
+
+
+##############################################################################
+def test_exclusions(tmp_path: Path) -> None:
+    """Listings in and below excluded directories aren't cached."""
+    excluded = tmp_path / "excluded"
+    cache = ListingCache(database=tmp_path / "cache.db", excluded=[excluded])
+    for directory in (excluded, excluded / "below", tmp_path / "included"):
+        cache.store(directory, _listing(directory, "a.txt"))
+    assert cache.fetch(excluded) is None
+    assert cache.fetch(excluded / "below") is None
+    assert cache.fetch(tmp_path / "included") is not None
+
+
+##############################################################################
+def test_least_recently_used_are_evicted(tmp_path: Path) -> None:
+    """Once the cache is too big, the least recently used listings go."""
+    cache = ListingCache(database=tmp_path / "cache.db")
+    directories = [tmp_path / f"directory-{number}" for number in range(4)]
+    for directory in directories:
+        cache.store(directory, _listing(directory, "a.txt"))
+    # Make room for three listings, and use the first one again.
+    size, _ = _sizes(cache)
+    cache = ListingCache(database=tmp_path / "cache.db", max_size=size * 3 // 4)
+    assert cache.fetch(directories[0]) is not None
+    cache.store(extra := tmp_path / "extra", _listing(extra, "a.txt"))
+    assert [cache.fetch(directory) is not None for directory in directories] == [
+        True,
+        False,
+        False,
+        True,
+    ]
+    assert cache.fetch(extra) is not None
+    kept, real = _sizes(cache)
+    assert kept == real <= size * 3 // 4
+
+
+##############################################################################
+class CachedApp(App[None]):
+    """An app for navigating with a cache of listings."""
+
+    def __init__(self, location: Path, cache: ListingCache) -> None:
+        """Initialise the app.
+
+        Args:
+            location: The location to navigate.
+            cache: The cache of listings.
+        """
+        super().__init__()
+        self._location = location
+        """The location to navigate."""
+        self._cache = cache
+        """The cache of listings."""
+
+    def compose(self) -> ComposeResult:
+        """Compose the app."""
+        yield DirectoryNavigation(self._location, listing_cache=self._cache)
+
+
+##############################################################################
+def test_stale_listing_is_replaced(tmp_path: Path) -> None:
+    """A cached listing that is out of date is replaced once loaded."""
+    (directory := tmp_path / "directory").mkdir()
+    (directory / "real.txt").touch()
+    cache = ListingCache(database=tmp_path / "cache.db")
+    cache.store(directory, _listing(directory, "stale.txt"))
+    shown: list[str] = []
+
+    async def navigate() -> None:
+        app = CachedApp(directory, cache)
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            shown.extend(
+                option.name
+                for option in app.query_one(DirectoryNavigation).options
+                if isinstance(option, DirectoryEntry) and option.name != ".."
+            )
+
+    asyncio.run(navigate())
+    assert shown == ["real.txt"]
+    assert [entry.name for entry in cache.fetch(directory) or []] == ["real.txt"]
+
+
+### test_listing_cache.py ends here
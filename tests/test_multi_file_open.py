@@ -0,0 +1,176 @@
+"""Tests for the dialog for opening more than one file."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import asyncio
+from pathlib import Path
+
+##############################################################################
+# Textual imports.
+from textual.app import App
+from textual.widgets import Input
+
+##############################################################################
+# Local imports.
+from textual_fspicker import MultiFileOpen
+from textual_fspicker.parts import DirectoryNavigation
+from textual_fspicker.parts.directory_navigation import DirectoryEntry
+
+
+##############################################################################
+class PickingApp(App[None]):
+    """An app for picking files."""
+
+    def __init__(self, location: Path) -> None:
+        """Initialise the app.
+
+        Args:
+            location: The location to pick files from.
+        """
+        super().__init__()
+        self._location = location
+        """The location to pick files from."""
+        self.picked: list[Path] | None = None
+        """The files that were picked, if any were."""
+
+    def on_mount(self) -> None:
+        """Open the dialog."""
+        self.push_screen(MultiFileOpen(self._location), self._picked)
+
+    def _picked(self, picked: list[Path] | None) -> None:
+        """Record the files that were picked.
+
+        Args:
+            picked: The files that were picked.
+        """
+        self.picked = picked
+
+
+##############################################################################
+def _files(root: Path) -> Path:
+    """Make some files to pick from.
+
+    Args:
+        root: Where to make the files.
+
+    Returns:
+        The directory the files are in.
+    """
+    for name in ("a.txt", "b.txt", "c.txt", "d.txt"):
+        (root / name).touch()
+    return root
+
+
+##############################################################################
+def test_pick_marked_and_typed(tmp_path: Path) -> None:
+    """Marked files, and any typed in, are picked in the order chosen."""
+    app = PickingApp(_files(tmp_path))
+    marked: list[str] = []
+
+    async def pick() -> None:
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            navigation = app.screen.query_one(DirectoryNavigation)
+            navigation.focus()
+            # Skip the parent, then mark the second and third files.
+            navigation.highlighted = 2
+            await pilot.press("space", "space")
+            marked.extend(
+                option.name
+                for option in navigation.options
+                if isinstance(option, DirectoryEntry) and option.marked
+            )
+            app.screen.query_one("InputBar Input", Input).value = "a.txt"
+            await pilot.click("#select")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+    asyncio.run(pick())
+    assert marked == ["b.txt", "c.txt"]
+    assert app.picked == [tmp_path / "b.txt", tmp_path / "c.txt", tmp_path / "a.txt"]
+
+
+##############################################################################
+def test_typed_file_must_exist(tmp_path: Path) -> None:
+    """A typed-in file that doesn't exist stops the dialog closing."""
+    app = PickingApp(_files(tmp_path))
+
+    async def pick() -> None:
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            navigation = app.screen.query_one(DirectoryNavigation)
+            navigation.focus()
+            navigation.highlighted = 1
+            await pilot.press("space")
+            app.screen.query_one("InputBar Input", Input).value = "nowhere.txt"
+            await pilot.click("#select")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert isinstance(app.screen, MultiFileOpen)
+
+    asyncio.run(pick())
+    assert app.picked is None
+
+
+##############################################################################
+def test_deleted_marked_file_must_exist(tmp_path: Path) -> None:
+    """A marked file that is deleted before confirming stops the dialog closing."""
+    app = PickingApp(_files(tmp_path))
+
+    async def pick() -> None:
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            navigation = app.screen.query_one(DirectoryNavigation)
+            navigation.focus()
+            navigation.highlighted = 1
+            await pilot.press("space", "space")
+            (tmp_path / "b.txt").unlink()
+            await pilot.click("#select")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert isinstance(app.screen, MultiFileOpen)
+            assert not app.screen.query_one("#select").disabled
+
+    asyncio.run(pick())
+    assert app.picked is None
+
+
+##############################################################################
+def test_marks_are_shown(tmp_path: Path) -> None:
+    """Marking and unmarking a file shows and clears its mark."""
+    app = PickingApp(_files(tmp_path))
+    shown: list[list[bool]] = []
+
+    async def mark() -> None:
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            navigation = app.screen.query_one(DirectoryNavigation)
+            navigation.focus()
+            navigation.highlighted = 1
+            for keys in (("space",), ("up", "space")):
+                await pilot.press(*keys)
+                await pilot.pause()
+                shown.append(
+                    [
+                        DirectoryEntry.MARK_ICON.plain
+                        in navigation.render_line(line).text
+                        for line in range(navigation.option_count)
+                    ]
+                )
+
+    asyncio.run(mark())
+    assert shown == [
+        [False, True, False, False, False],
+        [False, False, False, False, False],
+    ]
+
+
+### test_multi_file_open.py ends here
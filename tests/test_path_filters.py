@@ -0,0 +1,166 @@
+"""Tests for filtering the entries of a directory."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import asyncio
+from os import DirEntry
+from pathlib import Path
+from typing import Final
+
+##############################################################################
+# pytest imports.
+import pytest
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+
+##############################################################################
+# Local imports.
+from textual_fspicker import Filter
+from textual_fspicker.entry_details import EntryDetails
+from textual_fspicker.parts import DirectoryNavigation
+from textual_fspicker.parts.directory_navigation import DirectoryEntry
+
+##############################################################################
+TEXT_FILES: Final[Filter] = Filter.from_suffixes("Text", ".txt")
+"""A name-only filter to view a directory through."""
+
+
+##############################################################################
+class FilteredApp(App[None]):
+    """An app for viewing a directory through a filter."""
+
+    def __init__(self, location: Path) -> None:
+        """Initialise the app.
+
+        Args:
+            location: The location to view.
+        """
+        super().__init__()
+        self._location = location
+        """The location to view."""
+
+    def compose(self) -> ComposeResult:
+        """Compose the app."""
+        yield DirectoryNavigation(self._location)
+
+    def on_mount(self) -> None:
+        """View the directory through the filter."""
+        self.query_one(DirectoryNavigation).file_filter = TEXT_FILES
+
+
+##############################################################################
+def test_name_filter_skips_looking(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Files ruled out on their name are never looked at, until the filter changes."""
+    for name in ("a.txt", "b.csv", "sub.csv/c.txt"):
+        (tmp_path / "dir" / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / "dir" / name).touch()
+    looked: list[str] = []
+    scanned = EntryDetails.scanned
+
+    def looking(location: Path, entry: DirEntry[str]) -> EntryDetails:
+        looked.append(location.name)
+        return scanned(location, entry)
+
+    monkeypatch.setattr(EntryDetails, "scanned", looking)
+    shown: list[set[str]] = []
+    seen: list[bool] = []
+
+    async def view() -> None:
+        app = FilteredApp(tmp_path)
+        async with app.run_test() as pilot:
+            navigation = app.query_one(DirectoryNavigation)
+            await app.workers.wait_for_complete()
+            navigation.location = tmp_path / "dir"
+            for file_filter in (TEXT_FILES, None):
+                navigation.file_filter = file_filter
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                shown.append(
+                    {
+                        option.name
+                        for option in navigation.options
+                        if isinstance(option, DirectoryEntry) and option.name != ".."
+                    }
+                )
+                seen.append("b.csv" in looked)
+
+    asyncio.run(view())
+    # A directory is always shown, even if its name doesn't pass the filter.
+    assert shown == [{"a.txt", "sub.csv"}, {"a.txt", "b.csv", "sub.csv"}]
+    assert seen == [False, True]
+
+
+##############################################################################
+@pytest.mark.parametrize(
+    "name, passes",
+    [
+        ("photo.png", True),
+        ("PHOTO.PNG", True),
+        ("photo.jpeg", True),
+        ("photo.jpg", True),
+        ("photo.png.txt", False),
+        ("png", False),
+        ("notes.txt", False),
+    ],
+)
+def test_from_globs(name: str, passes: bool) -> None:
+    """A glob filter passes names that match any of its globs, ignoring case."""
+    images = Filter.from_globs("Images", "*.png", "*.jp*g")
+    assert images.name_tester is not None
+    assert images.name_tester(name) is passes
+    assert images(Path("somewhere") / name) is passes
+
+
+##############################################################################
+def test_from_globs_case_sensitive() -> None:
+    """A case-sensitive glob filter only passes names with the same case."""
+    readme = Filter.from_globs("Read me", "README*", case_sensitive=True)
+    assert readme(Path("README.md"))
+    assert not readme(Path("readme.md"))
+
+
+##############################################################################
+def test_from_no_globs() -> None:
+    """A glob filter with no globs passes nothing."""
+    assert not Filter.from_globs("Nothing")(Path("anything.txt"))
+
+
+##############################################################################
+@pytest.mark.parametrize(
+    "name, passes",
+    [
+        ("main.c", True),
+        ("MAIN.H", True),
+        ("bundle.tar.gz", True),
+        ("BUNDLE.TAR.GZ", True),
+        ("notes.gz", False),
+        ("main.cpp", False),
+        (".c", False),
+        ("c", False),
+    ],
+)
+def test_from_suffixes(name: str, passes: bool) -> None:
+    """A suffix filter passes names with any of its suffixes, ignoring case."""
+    sources = Filter.from_suffixes("Sources", ".c", "h", ".tar.gz")
+    assert sources.name_tester is not None
+    assert sources.name_tester(name) is passes
+    assert sources(Path("somewhere") / name) is passes
+
+
+##############################################################################
+def test_from_suffixes_case_sensitive() -> None:
+    """A case-sensitive suffix filter only passes suffixes with the same case."""
+    c_files = Filter.from_suffixes("C", ".c", case_sensitive=True)
+    assert c_files(Path("main.c"))
+    assert not c_files(Path("main.C"))
+
+
+### test_path_filters.py ends here
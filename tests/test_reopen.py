@@ -0,0 +1,143 @@
+"""Tests for dismissing dialogs and opening them again."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import asyncio
+from pathlib import Path
+from threading import Event
+
+##############################################################################
+# Textual imports.
+from textual.app import App
+from textual.widgets import Input
+
+##############################################################################
+# Local imports.
+from textual_fspicker import FileOpen, Filter, Filters
+from textual_fspicker.base_dialog import Dialog
+from textual_fspicker.parts import DirectoryNavigation
+from textual_fspicker.parts.directory_navigation import DirectoryEntry
+
+
+##############################################################################
+class ReopeningApp(App[None]):
+    """An app with a dialog that is kept between uses."""
+
+    def __init__(self, dialog: FileOpen) -> None:
+        """Initialise the app.
+
+        Args:
+            dialog: The dialog to keep.
+        """
+        super().__init__()
+        self.dialog = dialog
+        """The dialog that is kept between uses."""
+
+    def on_mount(self) -> None:
+        """Install the dialog and open it."""
+        self.install_screen(self.dialog, "open")
+        self.push_screen("open")
+
+
+##############################################################################
+def _files(root: Path) -> Path:
+    """Make some files to open.
+
+    Args:
+        root: Where to make the files.
+
+    Returns:
+        The directory the files are in.
+    """
+    root.mkdir(exist_ok=True)
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (root / name).touch()
+    return root
+
+
+##############################################################################
+def test_dismissal_stops_all_work(tmp_path: Path) -> None:
+    """Work being done by any part of a dialog stops when it's dismissed.
+
+    The work is picked up again when the dialog is reopened.
+    """
+    release = Event()
+
+    def slow(_: Path) -> bool:
+        release.wait(10)
+        return True
+
+    app = ReopeningApp(
+        FileOpen(
+            _files(tmp_path), filters=Filters(Filter("Slow", slow, expensive=True))
+        )
+    )
+    running: list[str] = []
+    shown: list[str] = []
+
+    async def dismiss() -> None:
+        async with app.run_test() as pilot:
+            # Wait for the filter to be started on the files.
+            while not any(worker.is_running for worker in app.workers):
+                await pilot.pause()
+            app.dialog.dismiss(None)
+            await pilot.pause(0.5)
+            running.extend(worker.name for worker in app.workers if worker.is_running)
+            release.set()
+            app.push_screen("open")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            shown.extend(
+                option.name
+                for option in app.dialog.query_one(DirectoryNavigation).options
+                if isinstance(option, DirectoryEntry) and option.name != ".."
+            )
+
+    try:
+        asyncio.run(dismiss())
+    finally:
+        release.set()
+    assert running == []
+    assert sorted(shown) == ["a.txt", "b.txt", "c.txt"]
+
+
+##############################################################################
+def test_reopen_resets_state(tmp_path: Path) -> None:
+    """A dialog that is reopened starts afresh, in any new location."""
+    elsewhere = _files(tmp_path / "elsewhere")
+    app = ReopeningApp(FileOpen(_files(tmp_path), default_file="a.txt"))
+    shown: list[str] = []
+
+    async def reopen() -> None:
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            dialog = app.dialog
+            dialog.query_one("InputBar Input", Input).value = "nowhere.txt"
+            dialog._set_error("An error")
+            dialog.dismiss(None)
+            await pilot.pause()
+            dialog.reopen(location=elsewhere, title="Again")
+            app.push_screen("open")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            navigation = dialog.query_one(DirectoryNavigation)
+            assert navigation.location == elsewhere
+            assert dialog.query_one(Dialog).border_title == "Again"
+            assert not dialog.query_one(Dialog).border_subtitle
+            assert dialog.query_one("InputBar Input", Input).value == "a.txt"
+            shown.extend(
+                option.name
+                for option in navigation.options
+                if isinstance(option, DirectoryEntry) and option.name != ".."
+            )
+
+    asyncio.run(reopen())
+    assert sorted(shown) == ["a.txt", "b.txt", "c.txt"]
+
+
+### test_reopen.py ends here
@@ -0,0 +1,159 @@
+"""Tests for the ways in which the entries of a directory can be sorted."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import asyncio
+import os
+from pathlib import Path
+
+##############################################################################
+# pytest imports.
+import pytest
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+
+##############################################################################
+# Local imports.
+from textual_fspicker.entry_details import EntryDetails
+from textual_fspicker.parts import DirectoryNavigation
+from textual_fspicker.parts.directory_navigation import DirectoryEntry
+from textual_fspicker.sort_modes import SortMode
+
+
+##############################################################################
+def _details(name: str, size: int = 0, mtime: float = 0.0) -> EntryDetails:
+    """Make the details of a file.
+
+    Args:
+        name: The name of the file.
+        size: The size of the file.
+        mtime: The modification time of the file.
+
+    Returns:
+        The details of the file.
+    """
+    return EntryDetails(Path(name), name, False, True, False, size, mtime)
+
+
+##############################################################################
+@pytest.mark.parametrize(
+    "mode, names, expected",
+    [
+        (SortMode.NAME, ["b", "B", "a"], ["B", "a", "b"]),
+        (SortMode.CASEFOLDED_NAME, ["b", "B", "a"], ["a", "B", "b"]),
+        (
+            SortMode.NATURAL_NAME,
+            ["file10", "file2", "File1", "file"],
+            ["file", "File1", "file2", "file10"],
+        ),
+        (
+            SortMode.EXTENSION,
+            ["b.txt", "a.TXT", "c.csv", "readme", ".hidden"],
+            [".hidden", "readme", "c.csv", "a.TXT", "b.txt"],
+        ),
+    ],
+)
+def test_name_modes(mode: SortMode, names: list[str], expected: list[str]) -> None:
+    """The modes that sort on names put them in the expected order."""
+    assert [
+        details.name for details in sorted(map(_details, names), key=mode.key)
+    ] == expected
+
+
+##############################################################################
+def test_size_and_time() -> None:
+    """Sorting by size or time falls back to the name for a tie."""
+    entries = [
+        _details("c", 10, 3.0),
+        _details("b", 20, 1.0),
+        _details("a", 10, 2.0),
+    ]
+    assert [details.name for details in sorted(entries, key=SortMode.SIZE.key)] == [
+        "a",
+        "c",
+        "b",
+    ]
+    assert [details.name for details in sorted(entries, key=SortMode.MTIME.key)] == [
+        "b",
+        "a",
+        "c",
+    ]
+
+
+##############################################################################
+def test_next_cycles() -> None:
+    """Moving to the next mode goes through them all and back again."""
+    mode = SortMode.NAME
+    seen = []
+    for _ in SortMode:
+        seen.append(mode)
+        mode = mode.next
+    assert seen == list(SortMode)
+    assert mode is SortMode.NAME
+
+
+##############################################################################
+class SortingApp(App[None]):
+    """An app for viewing a sorted directory."""
+
+    def __init__(self, location: Path) -> None:
+        """Initialise the app.
+
+        Args:
+            location: The location to view.
+        """
+        super().__init__()
+        self._location = location
+        """The location to view."""
+
+    def compose(self) -> ComposeResult:
+        """Compose the app."""
+        yield DirectoryNavigation(self._location)
+
+
+##############################################################################
+def test_directories_come_first(tmp_path: Path) -> None:
+    """Directories are shown first, whatever the sort mode or direction."""
+    for number, name in enumerate(("small.txt", "large.txt", "middle.txt")):
+        (tmp_path / name).write_bytes(b"x" * (10 ** (number * 2 % 3)))
+        os.utime(tmp_path / name, (0, 1_000_000 * (3 - number)))
+    for name in ("zebra", "aardvark"):
+        (tmp_path / name).mkdir()
+    shown: list[list[str]] = []
+
+    async def view() -> None:
+        app = SortingApp(tmp_path)
+        async with app.run_test() as pilot:
+            navigation = app.query_one(DirectoryNavigation)
+            for mode, reverse in (
+                (SortMode.NAME, False),
+                (SortMode.NAME, True),
+                (SortMode.SIZE, False),
+                (SortMode.MTIME, False),
+            ):
+                navigation.sort_mode = mode
+                navigation.sort_reverse = reverse
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                shown.append(
+                    [
+                        option.name
+                        for option in navigation.options
+                        if isinstance(option, DirectoryEntry) and option.name != ".."
+                    ]
+                )
+
+    asyncio.run(view())
+    assert shown[0] == ["aardvark", "zebra", "large.txt", "middle.txt", "small.txt"]
+    assert shown[1] == ["zebra", "aardvark", "small.txt", "middle.txt", "large.txt"]
+    assert shown[2][2:] == ["small.txt", "middle.txt", "large.txt"]
+    assert shown[3][2:] == ["middle.txt", "large.txt", "small.txt"]
+
+
+### test_sort_modes.py ends here
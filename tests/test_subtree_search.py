@@ -0,0 +1,162 @@
+"""Tests for searching for entries below a directory."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+from zipfile import ZipFile
+
+##############################################################################
+# pytest imports.
+import pytest
+
+##############################################################################
+# Local imports.
+from textual_fspicker.archives import ArchivePath
+from textual_fspicker.filename_index import FilenameIndex
+from textual_fspicker.ignore_rules import IgnoreRules
+from textual_fspicker.subtree_search import SearchOptions, SubtreeSearch
+
+
+##############################################################################
+def _tree(root: Path) -> Path:
+    """Make a tree with many matches, few of which are text files.
+
+    Args:
+        root: Where to make the tree.
+
+    Returns:
+        The top of the tree.
+    """
+    root.mkdir(exist_ok=True)
+    for directory in range(5):
+        (below := root / f"dir-{directory}").mkdir()
+        for file in range(40):
+            (below / f"match-{file}.bin").touch()
+        for file in range(2):
+            (below / f"match-{file}.txt").touch()
+    return root
+
+
+##############################################################################
+def _is_text(name: str) -> bool:
+    """Is the name that of a text file?
+
+    Args:
+        name: The name to test.
+
+    Returns:
+        `True` if the name is that of a text file, `False` if not.
+    """
+    return name.endswith(".txt")
+
+
+##############################################################################
+def _found(
+    search: SubtreeSearch,
+    root: Path,
+    options: SearchOptions | None = None,
+    **kwargs: Any,
+) -> list[str]:
+    """Get the names of the files a search finds.
+
+    Args:
+        search: The search to run.
+        root: The directory to search below.
+        options: The options for the search, if not the default ones.
+        kwargs: Other arguments for the search.
+
+    Returns:
+        The names of the files found.
+    """
+    try:
+        return [
+            Path(match.location).name
+            for matches in search.search(
+                root, options or SearchOptions("match"), **kwargs
+            )
+            for match in matches
+            if not match.is_dir
+        ]
+    finally:
+        search.shutdown()
+
+
+##############################################################################
+def test_filter_applies_before_limit(tmp_path: Path) -> None:
+    """Filtered-out matches don't count towards the maximum."""
+    found = _found(
+        SubtreeSearch(), _tree(tmp_path), max_results=8, file_filter=_is_text
+    )
+    assert len(found) == 8
+    assert all(_is_text(name) for name in found)
+
+
+##############################################################################
+def test_index_filter_applies_before_limit(tmp_path: Path) -> None:
+    """Filtered-out entries in the index don't count towards the limit."""
+    index = FilenameIndex(database=tmp_path / "index.db")
+    index.update(root := _tree(tmp_path / "tree"))
+    found = index.search(root, "match", limit=8, file_filter=_is_text)
+    assert len(found) == 8
+    assert all(_is_text(match.location) for match in found)
+
+
+##############################################################################
+class BrokenPool(ProcessPoolExecutor):
+    """A process pool that has broken."""
+
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        """Submit a task that fails because the pool has broken."""
+        del fn, args, kwargs
+        task: Future[Any] = Future()
+        task.set_exception(BrokenProcessPool("broken"))
+        return task
+
+
+##############################################################################
+def test_broken_pool_falls_back_to_threads(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """A search carries on with threads if its pool of processes breaks."""
+    search = SubtreeSearch()
+    search._pool = BrokenPool(1)
+    assert len(_found(search, _tree(tmp_path), file_filter=_is_text)) == 10
+    assert "searching with threads" in caplog.text
+
+
+##############################################################################
+def test_ignore_rules_in_processes(tmp_path: Path) -> None:
+    """Ignore rules are applied by the processes that do the search."""
+    root = _tree(tmp_path)
+    (root / ".git").mkdir()
+    (root / ".gitignore").write_text("*.bin\n")
+    found = _found(
+        SubtreeSearch(),
+        root,
+        SearchOptions("match", ignore=IgnoreRules("dir-0/").settings),
+    )
+    assert len(found) == 8
+    assert all(_is_text(name) for name in found)
+
+
+##############################################################################
+def test_only_local_trees(tmp_path: Path) -> None:
+    """Nothing is searched for below a directory that isn't local."""
+    with ZipFile(archive := tmp_path / "archive.zip", "w") as zipped:
+        zipped.writestr("inside/match.txt", "Hello")
+    assert SubtreeSearch.can_search(tmp_path)
+    assert not SubtreeSearch.can_search(ArchivePath(archive))
+    assert _found(SubtreeSearch(), ArchivePath(archive)) == []
+
+
+### test_subtree_search.py ends here
@@ -0,0 +1,103 @@
+"""Tests for suggesting paths as they're typed."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import asyncio
+import os
+from pathlib import Path
+
+##############################################################################
+# Local imports.
+from textual_fspicker.name_index import DirectoryNames, NameIndex
+from textual_fspicker.suggest_path import SuggestPath
+
+
+##############################################################################
+def test_name_index() -> None:
+    """Names are found by prefix, in sorted order."""
+    index = NameIndex(
+        (name, name.upper()) for name in ("beta", "Alpha", "alps", "gamma")
+    )
+    assert list(index.names("al")) == ["Alpha", "alps"]
+    assert list(index.values("AL")) == ["ALPHA", "ALPS"]
+    assert index.first("g") == "GAMMA"
+    assert index.first("delta") is None
+    assert len(index) == 4
+
+
+##############################################################################
+def test_case_sensitive_name_index() -> None:
+    """A case-sensitive index only finds names with the same case."""
+    index = NameIndex(((name, name) for name in ("Alpha", "alps")), case_sensitive=True)
+    assert list(index.names("al")) == ["alps"]
+    assert list(index.names("A")) == ["Alpha"]
+
+
+##############################################################################
+def _touch_later(directory: Path) -> None:
+    """Make sure a change to a directory can be seen, however coarse the times.
+
+    Args:
+        directory: The directory to change the time of.
+    """
+    stat = directory.stat()
+    os.utime(directory, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+##############################################################################
+def test_directory_names_are_cached(tmp_path: Path) -> None:
+    """The names in a directory are only listed again once it changes."""
+    names = DirectoryNames()
+    (tmp_path / "first.txt").touch()
+    index = names.names(tmp_path)
+    assert index is not None
+    assert names.names(tmp_path) is index
+    (tmp_path / "second.txt").touch()
+    _touch_later(tmp_path)
+    assert (relisted := names.names(tmp_path)) is not index
+    assert relisted is not None
+    assert list(relisted.names("")) == ["first.txt", "second.txt"]
+    assert names.names(tmp_path / "nowhere") is None
+
+
+##############################################################################
+def test_directory_names_are_bounded(tmp_path: Path) -> None:
+    """Only the most recently listed directories are kept."""
+    names = DirectoryNames(cache_size=2)
+    for number in range(3):
+        names.remember(tmp_path / f"{number}", 1, [f"{number}.txt"])
+    assert names.cached(tmp_path / "0", 1) is None
+    assert names.cached(tmp_path / "1", 1) is not None
+    assert names.cached(tmp_path / "2", 1) is not None
+    assert names.cached(tmp_path / "2", 2) is None
+
+
+##############################################################################
+def test_suggestions(tmp_path: Path) -> None:
+    """Suggestions complete the name being typed, in any directory."""
+    (tmp_path / "documents").mkdir()
+    (tmp_path / "documents" / "letter.txt").touch()
+    (tmp_path / "Downloads").mkdir()
+    suggester = SuggestPath(root=tmp_path)
+
+    async def suggest() -> list[str | None]:
+        return [
+            await suggester.get_suggestion(typed)
+            for typed in ("doc", "Do", "documents/le", "documents/", "nothing", "x/y")
+        ]
+
+    assert asyncio.run(suggest()) == [
+        "documents",
+        "Downloads",
+        "documents/letter.txt",
+        "documents/",
+        None,
+        None,
+    ]
+
+
+### test_suggest_path.py ends here